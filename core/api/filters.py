@@ -1,5 +1,7 @@
 from ninja import Schema
 
+from pydantic import Field
+
 
 class PaginationOut(Schema):
     offset: int
@@ -12,5 +14,15 @@ class PaginationIn(Schema):
     limit: int = 50
 
 
+class CursorPaginationOut(Schema):
+    limit: int
+    next_cursor: str | None = None
+
+
+class CursorPaginationIn(Schema):
+    cursor: str | None = None
+    limit: int = Field(default=50, ge=1, le=100)
+
+
 class SearchFilter(Schema):
     search: str | None = None
@@ -7,7 +7,10 @@ from typing import (
     TypeVar,
 )
 
-from core.api.filters import PaginationOut
+from core.api.filters import (
+    CursorPaginationOut,
+    PaginationOut,
+)
 
 
 TData = TypeVar("TData")
@@ -23,6 +26,11 @@ class ListPaginatedResponse(Schema, Generic[TListItem]):
     pagination: PaginationOut
 
 
+class CursorPaginatedResponse(Schema, Generic[TListItem]):
+    items: list[TListItem]
+    pagination: CursorPaginationOut
+
+
 class ApiResponse(Schema, Generic[TData]):
     data: TData | dict = Field(default_factory=dict)
     meta: dict[str, Any] = Field(default_factory=dict)
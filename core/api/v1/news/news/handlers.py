@@ -0,0 +1,83 @@
+from django.http import HttpRequest
+from ninja import (
+    Query,
+    Router,
+)
+from ninja.errors import HttpError
+
+from core.api.filters import (
+    CursorPaginationIn,
+    CursorPaginationOut,
+)
+from core.api.schemas import (
+    ApiResponse,
+    CursorPaginatedResponse,
+)
+from core.api.v1.news.news.schemas import (
+    NewsDetailSchema,
+    NewsFilterSchema,
+    NewsSchema,
+)
+from core.apps.common.exceptions import ServiceException
+from core.apps.news.exceptions.news import NewsNotFoundException
+from core.apps.news.usecases.news.get_detail import GetNewsDetailUseCase
+from core.apps.news.usecases.news.get_list import GetNewsListUseCase
+from core.project.containers.containers import get_container
+
+
+router = Router(tags=["News"])
+
+
+@router.get(
+    "",
+    response=ApiResponse[CursorPaginatedResponse[NewsSchema]],
+    operation_id='get_news_list',
+)
+def get_news_list(
+        request: HttpRequest,
+        filters: Query[NewsFilterSchema],
+        pagination_in: Query[CursorPaginationIn],
+) -> ApiResponse[CursorPaginatedResponse[NewsSchema]]:
+    container = get_container()
+    use_case: GetNewsListUseCase = container.resolve(GetNewsListUseCase)
+    try:
+        news, next_cursor = use_case.execute(
+            cursor=pagination_in.cursor,
+            limit=pagination_in.limit,
+            faculty_id=filters.faculty_id,
+            tag_id=filters.tag_id,
+            search=filters.search,
+        )
+    except ServiceException as e:
+        raise HttpError(
+            status_code=400,
+            message=e.message,
+        )
+
+    return ApiResponse(
+        data=CursorPaginatedResponse(
+            items=[NewsSchema.from_entity(news=item) for item in news],
+            pagination=CursorPaginationOut(limit=pagination_in.limit, next_cursor=next_cursor),
+        ),
+    )
+
+
+@router.get(
+    "{news_id}",
+    response=ApiResponse[NewsDetailSchema],
+    operation_id='get_news_detail',
+)
+def get_news_detail(request: HttpRequest, news_id: int) -> ApiResponse[NewsDetailSchema]:
+    container = get_container()
+    use_case: GetNewsDetailUseCase = container.resolve(GetNewsDetailUseCase)
+    try:
+        news = use_case.execute(news_id=news_id)
+    except NewsNotFoundException as e:
+        raise HttpError(
+            status_code=404,
+            message=e.message,
+        )
+
+    return ApiResponse(
+        data=NewsDetailSchema.from_entity(news=news),
+    )
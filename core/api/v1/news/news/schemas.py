@@ -0,0 +1,80 @@
+from datetime import datetime
+
+from ninja import Schema
+
+from core.api.filters import SearchFilter
+
+from core.api.v1.news.user.schemas import ClientSchemaPublic
+from core.apps.news.entities.faculty import Faculty as FacultyEntity
+from core.apps.news.entities.news import News as NewsEntity
+from core.apps.news.entities.tag import Tag as TagEntity
+
+
+class TagSchema(Schema):
+    id: int
+    name: str
+
+    @classmethod
+    def from_entity(cls, tag: TagEntity) -> 'TagSchema':
+        return cls(
+            id=tag.id,
+            name=tag.name,
+        )
+
+
+class FacultySchema(Schema):
+    id: int
+    name: str
+
+    @classmethod
+    def from_entity(cls, faculty: FacultyEntity) -> 'FacultySchema':
+        return cls(
+            id=faculty.id,
+            name=faculty.name,
+        )
+
+
+class NewsSchema(Schema):
+    id: int
+    title: str
+    description: str
+    author: ClientSchemaPublic
+    faculty: FacultySchema | None = None
+    tags: list[TagSchema]
+    headline: str | None = None
+    created_at: datetime
+
+    @classmethod
+    def from_entity(cls, news: NewsEntity) -> 'NewsSchema':
+        return cls(
+            id=news.id,
+            title=news.title,
+            description=news.description,
+            author=ClientSchemaPublic.from_entity(client=news.user),
+            faculty=FacultySchema.from_entity(faculty=news.faculty) if news.faculty is not None else None,
+            tags=[TagSchema.from_entity(tag=tag) for tag in news.tags],
+            headline=news.headline,
+            created_at=news.created_at,
+        )
+
+
+class NewsDetailSchema(NewsSchema):
+    content: str
+
+    @classmethod
+    def from_entity(cls, news: NewsEntity) -> 'NewsDetailSchema':
+        return cls(
+            id=news.id,
+            title=news.title,
+            description=news.description,
+            content=news.content,
+            author=ClientSchemaPublic.from_entity(client=news.user),
+            faculty=FacultySchema.from_entity(faculty=news.faculty) if news.faculty is not None else None,
+            tags=[TagSchema.from_entity(tag=tag) for tag in news.tags],
+            created_at=news.created_at,
+        )
+
+
+class NewsFilterSchema(SearchFilter):
+    faculty_id: int | None = None
+    tag_id: int | None = None
@@ -0,0 +1,8 @@
+from ninja import Router
+
+from core.api.v1.news.news.handlers import router as news_router
+
+
+router = Router(tags=['News'])
+
+router.add_router(prefix="", router=news_router)
@@ -1,7 +1,9 @@
 from ninja import Router
 
+from core.api.v1.news.news.urls import router as news_router
 from core.api.v1.news.user.urls import router as client_router
 
 router = Router(tags=['news'])
 router.add_router('user/', client_router)
+router.add_router('news/', news_router)
 
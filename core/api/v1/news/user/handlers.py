@@ -9,19 +9,29 @@ from jwt import PyJWTError
 
 from core.api.schemas import ApiResponse, StatusResponse
 from core.api.v1.news.user.schemas import ClientSchemaPrivate, TokenOutSchema, LogInSchema, UpdatePwInSchema, \
-    TokenClientOutSchema, UpdateEmailInSchema, CredentialsInSchema, SignUpInSchema, ScoreInSchema
-from core.apps.common.auth.ninja_auth import jwt_auth
-from core.apps.common.exceptions import ServiceException
-from core.apps.news.services.user import BaseClientService
+    TokenClientOutSchema, UpdateEmailInSchema, CredentialsInSchema, SignUpInSchema, ScoreInSchema, SessionSchema
+from core.apps.common.auth.ninja_auth import (
+    async_jwt_auth,
+    jwt_auth,
+)
+from core.apps.common.exceptions import (
+    ExecutorSaturatedException,
+    ServiceException,
+    TokenRevokedException,
+)
+from core.apps.news.exceptions.auth import LoginThrottledException
+from core.apps.news.exceptions.session import SessionNotFoundException
 from core.apps.news.usecases.user.create import CreateClientUseCase
-from core.apps.news.usecases.user.get_info import GetClientInfoUseCase
-from core.apps.news.usecases.user.login import LoginClientUseCase
+from core.apps.news.usecases.user.get_info import AsyncGetClientInfoUseCase
+from core.apps.news.usecases.user.get_sessions import GetClientSessionsUseCase
+from core.apps.news.usecases.user.login import AsyncLoginClientUseCase
 from core.apps.news.usecases.user.logout import LogoutClientUseCase
-from core.apps.news.usecases.user.update_access_token import UpdateAccessTokenUseCase
-from core.apps.news.usecases.user.update_credentials import UpdateClientCredentialsUseCase
+from core.apps.news.usecases.user.logout_all import LogoutAllClientUseCase
+from core.apps.news.usecases.user.update_access_token import AsyncUpdateAccessTokenUseCase
+from core.apps.news.usecases.user.update_credentials import AsyncUpdateClientCredentialsUseCase
 from core.apps.news.usecases.user.update_email import UpdateClientEmailUseCase
 from core.apps.news.usecases.user.update_password import UpdateClientPasswordUseCase
-from core.apps.news.usecases.user.update_score import UpdateClientScoreUseCase
+from core.apps.news.usecases.user.update_score import AsyncUpdateClientScoreUseCase
 from core.project.containers.containers import get_container
 
 
@@ -47,6 +57,11 @@ def sign_up(request: HttpRequest, schema: SignUpInSchema) -> ApiResponse[ClientS
             password=schema.password,
             verify_password=schema.verify_password,
         )
+    except ExecutorSaturatedException as e:
+        raise HttpError(
+            status_code=503,
+            message=e.message,
+        )
     except ServiceException as e:
         raise HttpError(
             status_code=400,
@@ -61,15 +76,13 @@ def sign_up(request: HttpRequest, schema: SignUpInSchema) -> ApiResponse[ClientS
     "info",
     response={200: ApiResponse[ClientSchemaPrivate]},
     operation_id='get_client_info',
-    auth=jwt_auth,
+    auth=async_jwt_auth,
 )
-def get_client_info(request: HttpRequest) -> ApiResponse[ClientSchemaPrivate]:
+async def get_client_info(request: HttpRequest) -> ApiResponse[ClientSchemaPrivate]:
     container = get_container()
-    client_service: BaseClientService = container.resolve(BaseClientService)
-    use_case: GetClientInfoUseCase = container.resolve(GetClientInfoUseCase)
+    use_case: AsyncGetClientInfoUseCase = container.resolve(AsyncGetClientInfoUseCase)
     try:
-        user_email: str = client_service.get_client_email_from_token(token=request.auth)
-        client = use_case.execute(user_email)
+        client = await use_case.execute(email=request.auth.email)
 
     except ServiceException as e:
         raise HttpError(
@@ -87,12 +100,26 @@ def get_client_info(request: HttpRequest) -> ApiResponse[ClientSchemaPrivate]:
     response=ApiResponse[TokenOutSchema],
     operation_id='login',
 )
-def login(request: HttpRequest, response: HttpResponse, schema: LogInSchema) -> ApiResponse[TokenOutSchema]:
+async def login(request: HttpRequest, response: HttpResponse, schema: LogInSchema) -> ApiResponse[TokenOutSchema]:
     container = get_container()
-    use_case: LoginClientUseCase = container.resolve(LoginClientUseCase)
+    use_case: AsyncLoginClientUseCase = container.resolve(AsyncLoginClientUseCase)
     try:
-        client, jwt_tokens = use_case.execute(email=schema.email, password=schema.password)
+        client, jwt_tokens = await use_case.execute(
+            email=schema.email,
+            password=schema.password,
+            ip_address=request.META.get("REMOTE_ADDR"),
+        )
         response.set_cookie(key="refresh_token", value=jwt_tokens.refresh_token, httponly=True, samesite="Strict")
+    except LoginThrottledException as e:
+        raise HttpError(
+            status_code=429,
+            message=e.message,
+        )
+    except ExecutorSaturatedException as e:
+        raise HttpError(
+            status_code=503,
+            message=e.message,
+        )
     except ServiceException:
         raise HttpError(
             status_code=400,
@@ -114,7 +141,7 @@ def logout(request: HttpRequest, response: HttpResponse) -> ApiResponse[StatusRe
     container = get_container()
     use_case: LogoutClientUseCase = container.resolve(LogoutClientUseCase)
     try:
-        use_case.execute(token=request.auth)
+        use_case.execute(claims=request.auth, refresh_token=request.COOKIES.get("refresh_token"))
         response.delete_cookie(key="refresh_token")
     except ServiceException as e:
         raise HttpError(
@@ -127,17 +154,71 @@ def logout(request: HttpRequest, response: HttpResponse) -> ApiResponse[StatusRe
     )
 
 
+@router.post(
+    "log-out-all",
+    response=ApiResponse[StatusResponse],
+    operation_id='logout_all',
+    auth=jwt_auth,
+)
+def logout_all(request: HttpRequest, response: HttpResponse) -> ApiResponse[StatusResponse]:
+    container = get_container()
+    use_case: LogoutAllClientUseCase = container.resolve(LogoutAllClientUseCase)
+    try:
+        use_case.execute(claims=request.auth)
+        response.delete_cookie(key="refresh_token")
+    except ServiceException as e:
+        raise HttpError(
+            status_code=400,
+            message=e.message,
+        )
+
+    return ApiResponse(
+        data=StatusResponse(status="Successfully logged out from all devices"),
+    )
+
+
+@router.get(
+    "sessions",
+    response=ApiResponse[list[SessionSchema]],
+    operation_id='get_client_sessions',
+    auth=jwt_auth,
+)
+def get_client_sessions(request: HttpRequest) -> ApiResponse[list[SessionSchema]]:
+    container = get_container()
+    use_case: GetClientSessionsUseCase = container.resolve(GetClientSessionsUseCase)
+    try:
+        sessions = use_case.execute(client_id=request.auth.client_id)
+    except ServiceException as e:
+        raise HttpError(
+            status_code=400,
+            message=e.message,
+        )
+
+    return ApiResponse(
+        data=[
+            SessionSchema.from_entity(session=session, current_device_id=request.auth.device_id)
+            for session in sessions
+        ],
+    )
+
+
 @router.post(
     "update_access_token",
     response=ApiResponse[TokenOutSchema],
     operation_id='update_access_token',
 )
-def update_access_token(request: HttpRequest) -> ApiResponse[TokenOutSchema]:
+async def update_access_token(request: HttpRequest, response: HttpResponse) -> ApiResponse[TokenOutSchema]:
     container = get_container()
-    use_case: UpdateAccessTokenUseCase = container.resolve(UpdateAccessTokenUseCase)
+    use_case: AsyncUpdateAccessTokenUseCase = container.resolve(AsyncUpdateAccessTokenUseCase)
 
     try:
-        jwt_tokens = use_case.execute(request.COOKIES.get("refresh_token"))
+        jwt_tokens = await use_case.execute(request.COOKIES.get("refresh_token"))
+        response.set_cookie(key="refresh_token", value=jwt_tokens.refresh_token, httponly=True, samesite="Strict")
+    except (TokenRevokedException, SessionNotFoundException) as e:
+        raise HttpError(
+            status_code=401,
+            message=e.message,
+        )
     except ServiceException as e:
         raise HttpError(
             status_code=400,
@@ -149,7 +230,7 @@ def update_access_token(request: HttpRequest) -> ApiResponse[TokenOutSchema]:
             message='Invalid token uat',
         )
     return ApiResponse(
-        data=TokenOutSchema.from_values(access_token=jwt_tokens.access_token),
+        data=TokenOutSchema.from_values(access_token=jwt_tokens.access_token, refresh_token=jwt_tokens.refresh_token),
     )
 
 
@@ -161,17 +242,20 @@ def update_access_token(request: HttpRequest) -> ApiResponse[TokenOutSchema]:
 )
 def update_password(request: HttpRequest, schema: UpdatePwInSchema) -> ApiResponse[StatusResponse]:
     container = get_container()
-    client_service: BaseClientService = container.resolve(BaseClientService)
     use_case: UpdateClientPasswordUseCase = container.resolve(UpdateClientPasswordUseCase)
 
     try:
-        user_email: str = client_service.get_client_email_from_token(token=request.auth)
         use_case.execute(
-            email=user_email,
+            email=request.auth.email,
             old_password=schema.old_password,
             new_password=schema.new_password,
             verify_password=schema.verify_password,
         )
+    except ExecutorSaturatedException as e:
+        raise HttpError(
+            status_code=503,
+            message=e.message,
+        )
     except ServiceException as e:
         raise HttpError(
             status_code=400,
@@ -197,71 +281,44 @@ def update_email(
         schema: UpdateEmailInSchema,
 ) -> ApiResponse[TokenClientOutSchema]:
     container = get_container()
-    client_service = container.resolve(BaseClientService)
     use_case: UpdateClientEmailUseCase = container.resolve(UpdateClientEmailUseCase)
 
     try:
-        user_email: str = client_service.get_client_email_from_token(token=request.auth)
         client, jwt_tokens = use_case.execute(
-            old_email=user_email,
+            old_email=request.auth.email,
             new_email=schema.new_email,
             password=schema.password,
+            device_id=request.auth.device_id,
         )
         response.set_cookie(key="refresh_token", value=jwt_tokens.refresh_token, httponly=True, samesite="Strict")
-    except ServiceException as e:
+    except ExecutorSaturatedException as e:
         raise HttpError(
-            status_code=400,
+            status_code=503,
             message=e.message,
         )
-    return ApiResponse(
-        data=TokenClientOutSchema.from_entity_with_token_values(client=client, access_token=jwt_tokens.access_token, refresh_token=jwt_tokens.refresh_token),
-    )
-
-
-@router.patch(
-    "update_credentials",
-    response=ApiResponse[ClientSchemaPrivate],
-    operation_id='update_credentials',
-    auth=jwt_auth,
-)
-def update_credentials(request: HttpRequest, schema: CredentialsInSchema) -> ApiResponse[ClientSchemaPrivate]:
-    container = get_container()
-    client_service: BaseClientService = container.resolve(BaseClientService)
-    use_case: UpdateClientCredentialsUseCase = container.resolve(UpdateClientCredentialsUseCase)
-
-    try:
-        user_email: str = client_service.get_client_email_from_token(token=request.auth)
-        client = use_case.execute(
-            email=user_email,
-            first_name=schema.first_name,
-            last_name=schema.last_name,
-            middle_name=schema.middle_name,
-        )
-
     except ServiceException as e:
         raise HttpError(
             status_code=400,
             message=e.message,
         )
     return ApiResponse(
-        data=ClientSchemaPrivate.from_entity(client=client),
+        data=TokenClientOutSchema.from_entity_with_token_values(client=client, access_token=jwt_tokens.access_token, refresh_token=jwt_tokens.refresh_token),
     )
 
+
 @router.patch(
     "update_credentials",
     response=ApiResponse[ClientSchemaPrivate],
     operation_id='update_credentials',
-    auth=jwt_auth,
+    auth=async_jwt_auth,
 )
-def update_credentials(request: HttpRequest, schema: CredentialsInSchema) -> ApiResponse[ClientSchemaPrivate]:
+async def update_credentials(request: HttpRequest, schema: CredentialsInSchema) -> ApiResponse[ClientSchemaPrivate]:
     container = get_container()
-    client_service: BaseClientService = container.resolve(BaseClientService)
-    use_case: UpdateClientCredentialsUseCase = container.resolve(UpdateClientCredentialsUseCase)
+    use_case: AsyncUpdateClientCredentialsUseCase = container.resolve(AsyncUpdateClientCredentialsUseCase)
 
     try:
-        user_email: str = client_service.get_client_email_from_token(token=request.auth)
-        client = use_case.execute(
-            email=user_email,
+        client = await use_case.execute(
+            email=request.auth.email,
             first_name=schema.first_name,
             last_name=schema.last_name,
             middle_name=schema.middle_name,
@@ -278,14 +335,18 @@ def update_credentials(request: HttpRequest, schema: CredentialsInSchema) -> Api
 
 @router.patch(
     "update_score",
-    response=ApiResponse[ClientSchemaPrivate],
+    response={200: ApiResponse[ClientSchemaPrivate], 202: ApiResponse[StatusResponse]},
     operation_id='update_score',
 )
-def update_credentials(request: HttpRequest, client_email: str, schema: ScoreInSchema) -> ApiResponse[ClientSchemaPrivate]:
+async def update_score(
+        request: HttpRequest,
+        client_email: str,
+        schema: ScoreInSchema,
+) -> tuple[int, ApiResponse[ClientSchemaPrivate] | ApiResponse[StatusResponse]]:
     container = get_container()
-    use_case: UpdateClientScoreUseCase = container.resolve(UpdateClientScoreUseCase)
+    use_case: AsyncUpdateClientScoreUseCase = container.resolve(AsyncUpdateClientScoreUseCase)
     try:
-        client = use_case.execute(
+        client = await use_case.execute(
             email=client_email,
             liked=schema.liked,
         )
@@ -295,7 +356,11 @@ def update_credentials(request: HttpRequest, client_email: str, schema: ScoreInS
             status_code=400,
             message=e.message,
         )
-    return ApiResponse(
+    if client is None:
+        return 202, ApiResponse(
+            data=StatusResponse(status="Score update accepted"),
+        )
+    return 200, ApiResponse(
         data=ClientSchemaPrivate.from_entity(client=client),
     )
 
@@ -1,5 +1,8 @@
+from datetime import datetime
+
 from ninja import Schema
 
+from core.apps.news.entities.session import Session as SessionEntity
 from core.apps.news.entities.user import User as ClientEntity
 from core.apps.news.entities.token import Token as TokenEntity
 from core.apps.common.models import UserRole
@@ -66,6 +69,7 @@ class TokenClientOutSchema(ClientSchemaPrivate):
             last_name=client.last_name,
             first_name=client.first_name,
             middle_name=client.middle_name,
+            score=client.score,
             role=client.role,
             email=client.email,
             access_token=tokens.access_token,
@@ -83,6 +87,7 @@ class TokenClientOutSchema(ClientSchemaPrivate):
             last_name=client.last_name,
             first_name=client.first_name,
             middle_name=client.middle_name,
+            score=client.score,
             role=client.role,
             email=client.email,
             access_token=access_token,
@@ -109,6 +114,24 @@ class TokenOutSchema(Schema):
         )
 
 
+class SessionSchema(Schema):
+    device_id: str
+    created_at: datetime
+    last_used_at: datetime | None = None
+    expires_at: datetime
+    is_current: bool
+
+    @classmethod
+    def from_entity(cls, session: SessionEntity, current_device_id: str | None = None) -> 'SessionSchema':
+        return cls(
+            device_id=session.device_id,
+            created_at=session.created_at,
+            last_used_at=session.updated_at,
+            expires_at=session.expires_at,
+            is_current=session.device_id == current_device_id,
+        )
+
+
 class TokenInSchema(Schema):
     token: str
 
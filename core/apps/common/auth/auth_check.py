@@ -3,11 +3,15 @@ from ninja.errors import HttpError
 
 from jwt import PyJWTError
 
-from core.apps.common.auth.token import JWTTokenService
+from core.apps.common.auth.token import BaseTokenService
+from core.apps.common.exceptions import JWTKeyParsingException
 from core.apps.common.models import (
     UserRole,
     TokenType,
 )
+from core.apps.news.entities.token import TokenClaims
+from core.apps.news.services.revocation import BaseTokenRevocationService
+from core.project.containers.containers import get_container
 
 
 class AuthCheck:
@@ -16,37 +20,47 @@ class AuthCheck:
         self.allowed_roles = allowed_roles
         self.allowed_emails = allowed_emails
 
-    def authenticate(self, request: HttpRequest, token: str) -> str:
+    def authenticate(self, request: HttpRequest, token: str) -> TokenClaims:
+        claims = self._get_claims(token=token)
+
+        revocation_service: BaseTokenRevocationService = get_container().resolve(BaseTokenRevocationService)
+        if revocation_service.is_revoked(jti=claims.jti):
+            raise HttpError(
+                status_code=401,
+                message="Token has been revoked",
+            )
+
+        return claims
+
+    def _get_claims(self, token: str) -> TokenClaims:
+        token_service: BaseTokenService = get_container().resolve(BaseTokenService)
         try:
-            token_service = JWTTokenService()
-            token_type = token_service.get_token_type_from_token(token=token)
-            if token_type != TokenType.ACCESS:
-                raise HttpError(
-                    status_code=403,
-                    message="Invalid token type",
-                )
-
-
-            user_role = token_service.get_client_role_from_token(token=token)
-            if not self._is_role_allowed(role=user_role):
-                raise HttpError(
-                    status_code=403,
-                    message="Client does not have permission to access this resource",
-                )
-
-            user_email = token_service.get_client_email_from_token(token=token)
-            if not self._is_email_allowed(email=user_email):
-                raise HttpError(
-                    status_code=403,
-                    message="Client does not have permission to access this resource",
-                )
-
-        except PyJWTError:
+            claims = token_service.get_claims_from_token(token=token)
+        except (PyJWTError, JWTKeyParsingException):
             raise HttpError(
                 status_code=401,
                 message="Invalid token",
             )
-        return token
+
+        if claims.token_type != TokenType.ACCESS:
+            raise HttpError(
+                status_code=403,
+                message="Invalid token type",
+            )
+
+        if not self._is_role_allowed(role=claims.role):
+            raise HttpError(
+                status_code=403,
+                message="Client does not have permission to access this resource",
+            )
+
+        if not self._is_email_allowed(email=claims.email):
+            raise HttpError(
+                status_code=403,
+                message="Client does not have permission to access this resource",
+            )
+
+        return claims
 
     def _is_role_allowed(self, role: UserRole) -> bool:
         if not self.allowed_roles:
@@ -57,3 +71,17 @@ class AuthCheck:
         if not self.allowed_emails:
             return True
         return email in self.allowed_emails
+
+
+class AsyncAuthCheck(AuthCheck):
+    async def authenticate(self, request: HttpRequest, token: str) -> TokenClaims:
+        claims = self._get_claims(token=token)
+
+        revocation_service: BaseTokenRevocationService = get_container().resolve(BaseTokenRevocationService)
+        if await revocation_service.ais_revoked(jti=claims.jti):
+            raise HttpError(
+                status_code=401,
+                message="Token has been revoked",
+            )
+
+        return claims
@@ -1,7 +1,14 @@
 from ninja.security import HttpBearer
 
-from core.apps.common.auth.auth_check import AuthCheck
+from core.apps.common.auth.auth_check import (
+    AsyncAuthCheck,
+    AuthCheck,
+)
 
 
 class JWTBearer(AuthCheck, HttpBearer):
     pass
+
+
+class AsyncJWTBearer(AsyncAuthCheck, HttpBearer):
+    pass
@@ -1,4 +1,7 @@
-from core.apps.common.auth.bearer import JWTBearer
+from core.apps.common.auth.bearer import (
+    AsyncJWTBearer,
+    JWTBearer,
+)
 from core.apps.common.models import UserRole
 
 
@@ -11,3 +14,9 @@ jwt_auth = JWTBearer([
     UserRole.MANAGER,
     UserRole.CREATOR,
 ])
+
+async_jwt_auth = AsyncJWTBearer([
+    UserRole.ADMIN,
+    UserRole.MANAGER,
+    UserRole.CREATOR,
+])
@@ -1,15 +1,45 @@
+import asyncio
+import base64
 import bcrypt
+import hashlib
+import hmac
+import logging
+import math
+import os
+import time
 from abc import (
     ABC,
     abstractmethod,
 )
-from dataclasses import dataclass
-from typing import ClassVar
+from dataclasses import (
+    dataclass,
+    field,
+)
+from functools import lru_cache
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+)
+
+from asgiref.sync import sync_to_async
+
+from core.apps.common.exceptions import ExecutorSaturatedException
+from core.apps.common.executor import (
+    BoundedPriorityExecutor,
+    TaskPriority,
+)
+from core.project.settings import env
+
+
+logger = logging.getLogger(__name__)
 
 
 @dataclass
 class BasePasswordService(ABC):
     HASH_ENCODING: ClassVar[str]
+    ALGORITHM: ClassVar[str]
+    HASH_PREFIXES: ClassVar[tuple[str, ...]] = ()
 
     @abstractmethod
     def hash_password(self, plain_password: str) -> str:
@@ -19,14 +49,26 @@ class BasePasswordService(ABC):
     def verify_password(self, plain_password: str, hashed_password: str) -> bool:
         ...
 
+    @abstractmethod
+    def needs_rehash(self, hashed_password: str) -> bool:
+        ...
+
+    async def averify_password(self, plain_password: str, hashed_password: str) -> bool:
+        return await sync_to_async(self.verify_password, thread_sensitive=False)(
+            plain_password=plain_password,
+            hashed_password=hashed_password,
+        )
+
 
 class BcryptPasswordService(BasePasswordService):
     HASH_ENCODING: ClassVar[str] = "UTF-8"
+    ALGORITHM: ClassVar[str] = "bcrypt"
+    HASH_PREFIXES: ClassVar[tuple[str, ...]] = ("$2a$", "$2b$", "$2y$")
 
     def hash_password(self, plain_password: str) -> str:
         hashed_password = bcrypt.hashpw(
             password=plain_password.encode(self.HASH_ENCODING),
-            salt=bcrypt.gensalt(),
+            salt=bcrypt.gensalt(rounds=get_bcrypt_rounds()),
         )
         return hashed_password.decode(self.HASH_ENCODING)
 
@@ -35,3 +77,199 @@ class BcryptPasswordService(BasePasswordService):
             password=plain_password.encode(self.HASH_ENCODING),
             hashed_password=hashed_password.encode(self.HASH_ENCODING),
         )
+
+    def needs_rehash(self, hashed_password: str) -> bool:
+        try:
+            rounds = int(hashed_password.split("$")[2])
+        except (IndexError, ValueError):
+            return False
+        return rounds != get_bcrypt_rounds()
+
+
+class ScryptPasswordService(BasePasswordService):
+    HASH_ENCODING: ClassVar[str] = "UTF-8"
+    ALGORITHM: ClassVar[str] = "scrypt"
+    HASH_PREFIXES: ClassVar[tuple[str, ...]] = ("$scrypt$",)
+    N: ClassVar[int] = env.int("SCRYPT_N", default=2 ** 14)
+    R: ClassVar[int] = env.int("SCRYPT_R", default=8)
+    P: ClassVar[int] = env.int("SCRYPT_P", default=1)
+    SALT_SIZE: ClassVar[int] = 16
+    KEY_SIZE: ClassVar[int] = 32
+
+    def hash_password(self, plain_password: str) -> str:
+        salt = os.urandom(self.SALT_SIZE)
+        key = self._derive_key(plain_password=plain_password, salt=salt, n=self.N, r=self.R, p=self.P)
+        return f"$scrypt$n={self.N},r={self.R},p={self.P}${self._encode(salt)}${self._encode(key)}"
+
+    def verify_password(self, plain_password: str, hashed_password: str) -> bool:
+        try:
+            n, r, p, salt, key = self._parse(hashed_password=hashed_password)
+            derived_key = self._derive_key(plain_password=plain_password, salt=salt, n=n, r=r, p=p)
+        except ValueError:
+            return False
+        return hmac.compare_digest(derived_key, key)
+
+    def needs_rehash(self, hashed_password: str) -> bool:
+        try:
+            n, r, p, _, _ = self._parse(hashed_password=hashed_password)
+        except ValueError:
+            return False
+        return (n, r, p) != (self.N, self.R, self.P)
+
+    def _derive_key(self, plain_password: str, salt: bytes, n: int, r: int, p: int) -> bytes:
+        return hashlib.scrypt(
+            plain_password.encode(self.HASH_ENCODING),
+            salt=salt,
+            n=n,
+            r=r,
+            p=p,
+            maxmem=256 * n * r * p,
+            dklen=self.KEY_SIZE,
+        )
+
+    def _parse(self, hashed_password: str) -> tuple[int, int, int, bytes, bytes]:
+        _, algorithm, params, salt, key = hashed_password.split("$")
+        if algorithm != self.ALGORITHM:
+            raise ValueError(algorithm)
+        params = dict(param.split("=") for param in params.split(","))
+        try:
+            n, r, p = int(params["n"]), int(params["r"]), int(params["p"])
+        except KeyError as exception:
+            raise ValueError(f"Missing scrypt parameter: {exception}")
+        return n, r, p, self._decode(salt), self._decode(key)
+
+    def _encode(self, value: bytes) -> str:
+        return base64.b64encode(value).decode(self.HASH_ENCODING).rstrip("=")
+
+    def _decode(self, value: str) -> bytes:
+        return base64.b64decode(value + "=" * (-len(value) % 4))
+
+
+@dataclass
+class PasswordServiceRegistry(BasePasswordService):
+    HASH_ENCODING: ClassVar[str] = "UTF-8"
+    ALGORITHM: ClassVar[str] = "registry"
+
+    password_services: list[BasePasswordService]
+    default_algorithm: str
+    _services_by_algorithm: dict[str, BasePasswordService] = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self._services_by_algorithm = {service.ALGORITHM: service for service in self.password_services}
+        if self.default_algorithm not in self._services_by_algorithm:
+            raise ValueError(f"Unknown password hasher: {self.default_algorithm}")
+
+    def hash_password(self, plain_password: str) -> str:
+        return self._services_by_algorithm[self.default_algorithm].hash_password(plain_password=plain_password)
+
+    def verify_password(self, plain_password: str, hashed_password: str) -> bool:
+        password_service = self._identify(hashed_password=hashed_password)
+        if password_service is None:
+            logger.warning("Password Hash Algorithm Not Recognized Error")
+            return False
+        return password_service.verify_password(plain_password=plain_password, hashed_password=hashed_password)
+
+    def needs_rehash(self, hashed_password: str) -> bool:
+        password_service = self._identify(hashed_password=hashed_password)
+        if password_service is None:
+            return False
+        if password_service.ALGORITHM != self.default_algorithm:
+            return True
+        return password_service.needs_rehash(hashed_password=hashed_password)
+
+    def _identify(self, hashed_password: str) -> BasePasswordService | None:
+        for password_service in self.password_services:
+            if hashed_password.startswith(password_service.HASH_PREFIXES):
+                return password_service
+        return None
+
+
+@dataclass
+class PooledPasswordService(BasePasswordService):
+    HASH_ENCODING: ClassVar[str] = "UTF-8"
+    ALGORITHM: ClassVar[str] = "pooled"
+
+    password_service: BasePasswordService
+    executor: BoundedPriorityExecutor
+    timeout: float | None = None
+
+    def hash_password(self, plain_password: str) -> str:
+        return self._run(self.password_service.hash_password, plain_password, priority=TaskPriority.LOW)
+
+    def verify_password(self, plain_password: str, hashed_password: str) -> bool:
+        return self._run(
+            self.password_service.verify_password,
+            plain_password,
+            hashed_password,
+            priority=TaskPriority.HIGH,
+        )
+
+    def needs_rehash(self, hashed_password: str) -> bool:
+        return self.password_service.needs_rehash(hashed_password=hashed_password)
+
+    async def averify_password(self, plain_password: str, hashed_password: str) -> bool:
+        return await self._arun(
+            self.password_service.verify_password,
+            plain_password,
+            hashed_password,
+            priority=TaskPriority.HIGH,
+        )
+
+    def _run(self, fn: Callable, *args: Any, priority: TaskPriority) -> Any:
+        if self.executor.is_worker_thread():
+            return fn(*args)
+
+        future = self.executor.submit(fn, *args, priority=priority)
+        try:
+            return future.result(timeout=self.timeout)
+        except TimeoutError:
+            future.cancel()
+            raise ExecutorSaturatedException
+
+    async def _arun(self, fn: Callable, *args: Any, priority: TaskPriority) -> Any:
+        future = self.executor.submit(fn, *args, priority=priority)
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), timeout=self.timeout)
+        except TimeoutError:
+            future.cancel()
+            raise ExecutorSaturatedException
+
+
+@lru_cache(1)
+def get_password_hashing_executor() -> BoundedPriorityExecutor:
+    max_queue_size = env.int("PASSWORD_HASHING_QUEUE_SIZE", default=64)
+    return BoundedPriorityExecutor(
+        max_workers=env.int("PASSWORD_HASHING_WORKERS", default=os.cpu_count() or 1),
+        max_queue_size=max_queue_size,
+        max_low_priority_queue_size=env.int("PASSWORD_HASHING_LOW_PRIORITY_QUEUE_SIZE", default=max_queue_size // 2),
+        thread_name_prefix="password_hashing",
+    )
+
+
+def calibrate_bcrypt_rounds(target_ms: int, min_rounds: int, max_rounds: int = 16, sample_rounds: int = 8) -> int:
+    salt = bcrypt.gensalt(rounds=sample_rounds)
+    elapsed_ms = math.inf
+    for _ in range(3):
+        started_at = time.perf_counter()
+        bcrypt.hashpw(password=b"calibration", salt=salt)
+        elapsed_ms = min(elapsed_ms, (time.perf_counter() - started_at) * 1000)
+
+    rounds = sample_rounds + math.floor(math.log2(target_ms / max(elapsed_ms, 0.001)))
+    return min(max(rounds, min_rounds), max_rounds)
+
+
+@lru_cache(1)
+def get_bcrypt_rounds() -> int:
+    rounds = env.int("BCRYPT_ROUNDS", default=0)
+    if rounds:
+        return rounds
+
+    target_ms = env.int("BCRYPT_TARGET_MS", default=250)
+    rounds = calibrate_bcrypt_rounds(target_ms=target_ms, min_rounds=env.int("BCRYPT_MIN_ROUNDS", default=10))
+    logger.info(f"Bcrypt Rounds Calibrated ({rounds=}, {target_ms=})")
+    return rounds
+
+
+def pin_bcrypt_rounds(rounds: int) -> None:
+    os.environ["BCRYPT_ROUNDS"] = str(rounds)
+    get_bcrypt_rounds.cache_clear()
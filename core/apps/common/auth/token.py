@@ -1,3 +1,4 @@
+import hashlib
 import jwt
 from abc import (
     ABC,
@@ -13,7 +14,9 @@ from typing import (
     ClassVar,
 )
 
+from core.apps.news.entities.token import TokenClaims
 from core.apps.news.entities.user import User as UserEntity
+from core.apps.common.cache import LRUCache
 from core.apps.common.exceptions import JWTKeyParsingException
 from core.apps.common.factory import (
     convert_to_timestamp,
@@ -39,6 +42,10 @@ class BaseTokenService(ABC):
     def get_raw_jwt(self, token: str) -> dict[str, Any]:
         ...
 
+    @abstractmethod
+    def get_claims_from_token(self, token: str) -> TokenClaims:
+        ...
+
     @abstractmethod
     def get_client_email_from_token(self, token: str) -> str:
         ...
@@ -78,13 +85,30 @@ class JWTTokenService(BaseTokenService):
     EXPIRATION_TIME: ClassVar[str] = "exp"
     ACCESS_TOKEN_TTL: timedelta = timedelta(seconds=env.int("ACCESS_TOKEN_EXP"))
     REFRESH_TOKEN_TTL: timedelta = timedelta(seconds=env.int("REFRESH_TOKEN_EXP"))
+    CLIENT_ID_KEY: ClassVar[str] = "client_id"
     CLIENT_EMAIL_KEY: ClassVar[str] = "client_email"
     CLIENT_ROLE_KEY: ClassVar[str] = "client_roles"
+    TOKEN_VERSION_KEY: ClassVar[str] = "token_version"
+    VERIFIED_TOKENS_CACHE_SIZE: ClassVar[int] = env.int("JWT_CACHE_SIZE", default=0)
+    verified_tokens_cache: ClassVar[LRUCache | None] = (
+        LRUCache(maxsize=VERIFIED_TOKENS_CACHE_SIZE) if VERIFIED_TOKENS_CACHE_SIZE > 0 else None
+    )
 
     def __encode_jwt(self, payload: dict[str, Any]) -> str:
         return jwt.encode(payload=payload, key=self.JWT_SECRET_KEY, algorithm=self.ALGORITHM)
 
     def __decode_jwt_token(self, token: str) -> dict[str, Any]:
+        if self.verified_tokens_cache is None:
+            return self.__verify_jwt_token(token=token)
+
+        cache_key = hashlib.sha256(token.encode()).digest()
+        payload: dict[str, Any] | None = self.verified_tokens_cache.get(cache_key)
+        if payload is None:
+            payload = self.__verify_jwt_token(token=token)
+            self.verified_tokens_cache.set(cache_key, payload, expires_at=payload[self.EXPIRATION_TIME])
+        return payload
+
+    def __verify_jwt_token(self, token: str) -> dict[str, Any]:
         return jwt.decode(
             jwt=token,
             key=self.JWT_SECRET_KEY,
@@ -119,8 +143,10 @@ class JWTTokenService(BaseTokenService):
 
     def __get_payload(self, client: UserEntity, payload: dict[str, Any]) -> dict[str, Any]:
         payload.update({
+            self.CLIENT_ID_KEY: client.id,
             self.CLIENT_EMAIL_KEY: client.email,
             self.CLIENT_ROLE_KEY: client.role,
+            self.TOKEN_VERSION_KEY: client.token_version or 0,
         })
 
         return payload
@@ -146,6 +172,29 @@ class JWTTokenService(BaseTokenService):
     def get_raw_jwt(self, token: str) -> dict[str, Any]:
         return jwt.decode(jwt=token, options={'verify_signature': False})
 
+    def get_claims_from_token(self, token: str) -> TokenClaims:
+        payload: dict[str, Any] = self.__decode_jwt_token(token=token)
+        client_id: int = payload.get(self.CLIENT_ID_KEY)
+        client_email: str = payload.get(self.CLIENT_EMAIL_KEY)
+        client_role: str = payload.get(self.CLIENT_ROLE_KEY)
+        if client_id is None or not client_email or not client_role:
+            raise JWTKeyParsingException
+
+        try:
+            return TokenClaims(
+                token_type=TokenType(payload[self.TOKEN_TYPE]),
+                client_id=client_id,
+                email=client_email,
+                role=UserRole(client_role),
+                token_version=payload.get(self.TOKEN_VERSION_KEY, 0),
+                jti=payload[self.JWT_ID],
+                expires_at=payload[self.EXPIRATION_TIME],
+                issued_at=payload[self.ISSUED_AT],
+                device_id=payload.get(self.DEVICE_ID),
+            )
+        except ValueError:
+            raise JWTKeyParsingException
+
     def get_client_email_from_token(self, token: str) -> str:
         payload: dict[str, Any] = self.__decode_jwt_token(token=token)
         client_email: str = payload.get(self.CLIENT_EMAIL_KEY)
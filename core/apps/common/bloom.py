@@ -0,0 +1,35 @@
+import hashlib
+import math
+from dataclasses import (
+    dataclass,
+    field,
+)
+
+
+@dataclass(eq=False)
+class BloomFilter:
+    capacity: int
+    error_rate: float = 0.001
+    size: int = field(init=False)
+    hash_count: int = field(init=False)
+    _bits: bytearray = field(init=False, repr=False)
+
+    def __post_init__(self):
+        capacity = max(self.capacity, 1)
+        self.size = max(8, math.ceil(-capacity * math.log(self.error_rate) / (math.log(2) ** 2)))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, item: str):
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+        for i in range(self.hash_count):
+            yield (first + i * second) % self.size
+
+    def add(self, item: str) -> None:
+        for position in self._positions(item):
+            self._bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, item: str) -> bool:
+        return all(self._bits[position >> 3] & (1 << (position & 7)) for position in self._positions(item))
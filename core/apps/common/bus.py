@@ -0,0 +1,191 @@
+import json
+import logging
+import os
+import select
+import threading
+from abc import (
+    ABC,
+    abstractmethod,
+)
+from collections import defaultdict
+from dataclasses import (
+    dataclass,
+    field,
+)
+from enum import Enum
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Iterator,
+)
+
+from django.db import (
+    connection,
+    connections,
+)
+from django.db.backends.postgresql.psycopg_any import is_psycopg3
+
+from core.apps.common.factory import get_new_uuid
+from core.project.settings import env
+
+
+logger = logging.getLogger(__name__)
+
+
+class InvalidationTopic(str, Enum):
+    CLIENT = "client"
+    REVOKED_TOKEN = "revoked_token"
+
+
+InvalidationHandler = Callable[[dict[str, list] | None], None]
+
+
+class BaseInvalidationBus(ABC):
+    @abstractmethod
+    def publish(self, topic: InvalidationTopic, **keys: list) -> None:
+        ...
+
+    @abstractmethod
+    def subscribe(self, topic: InvalidationTopic, handler: InvalidationHandler) -> None:
+        ...
+
+    @abstractmethod
+    def start(self) -> None:
+        ...
+
+    @abstractmethod
+    def stop(self) -> None:
+        ...
+
+
+class NoInvalidationBus(BaseInvalidationBus):
+    def publish(self, topic: InvalidationTopic, **keys: list) -> None:
+        ...
+
+    def subscribe(self, topic: InvalidationTopic, handler: InvalidationHandler) -> None:
+        ...
+
+    def start(self) -> None:
+        ...
+
+    def stop(self) -> None:
+        ...
+
+
+@dataclass(eq=False)
+class PostgresInvalidationBus(BaseInvalidationBus):
+    CHANNEL: ClassVar[str] = env.str("INVALIDATION_BUS_CHANNEL", default="cache_invalidation")
+    DATABASE_ALIAS: ClassVar[str] = "default"
+    DIRECT_HOST: ClassVar[str] = env.str("INVALIDATION_BUS_HOST", default="")
+    DIRECT_PORT: ClassVar[str] = env.str("INVALIDATION_BUS_PORT", default="")
+    POLL_TIMEOUT: ClassVar[float] = 1.0
+    RECONNECT_DELAY: ClassVar[float] = 1.0
+    MAX_PAYLOAD_SIZE: ClassVar[int] = 7900
+
+    origin: str = field(default_factory=get_new_uuid, init=False)
+    _handlers: defaultdict[InvalidationTopic, list[InvalidationHandler]] = field(
+        default_factory=lambda: defaultdict(list),
+        init=False,
+        repr=False,
+    )
+    _listener: threading.Thread | None = field(default=None, init=False, repr=False)
+    _listener_pid: int | None = field(default=None, init=False, repr=False)
+    _stopped: threading.Event = field(default_factory=threading.Event, init=False, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+
+    def publish(self, topic: InvalidationTopic, **keys: list) -> None:
+        payload = json.dumps({"topic": topic, "origin": self.origin, "keys": keys}, default=str)
+        if len(payload) > self.MAX_PAYLOAD_SIZE:
+            payload = json.dumps({"topic": topic, "origin": self.origin, "keys": None})
+
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT pg_notify(%s, %s)", [self.CHANNEL, payload])
+
+    def subscribe(self, topic: InvalidationTopic, handler: InvalidationHandler) -> None:
+        with self._lock:
+            self._handlers[topic].append(handler)
+        self.start()
+
+    def start(self) -> None:
+        with self._lock:
+            if self._listener is not None and self._listener.is_alive() and self._listener_pid == os.getpid():
+                return
+            self._stopped.clear()
+            self._listener = threading.Thread(target=self._listen, name="invalidation_bus", daemon=True)
+            self._listener_pid = os.getpid()
+            self._listener.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        listener = self._listener
+        if listener is not None and listener.is_alive() and self._listener_pid == os.getpid():
+            listener.join(timeout=self.POLL_TIMEOUT)
+
+    def _listen(self) -> None:
+        while not self._stopped.is_set():
+            raw_connection = None
+            try:
+                raw_connection = self._connect()
+                with raw_connection.cursor() as cursor:
+                    cursor.execute(f"LISTEN {connection.ops.quote_name(self.CHANNEL)}")
+                self._dispatch_reset()
+
+                while not self._stopped.is_set():
+                    for payload in self._wait_for_payloads(raw_connection=raw_connection):
+                        self._dispatch(payload=payload)
+            except Exception:
+                logger.exception(f"Invalidation Bus Listener Error ({self.CHANNEL=})")
+            finally:
+                if raw_connection is not None:
+                    raw_connection.close()
+            self._stopped.wait(self.RECONNECT_DELAY)
+
+    def _connect(self) -> Any:
+        database = connections[self.DATABASE_ALIAS]
+        connection_params = database.get_connection_params()
+        if self.DIRECT_HOST:
+            connection_params["host"] = self.DIRECT_HOST
+        if self.DIRECT_PORT:
+            connection_params["port"] = self.DIRECT_PORT
+
+        raw_connection = database.Database.connect(**connection_params)
+        raw_connection.autocommit = True
+        return raw_connection
+
+    def _wait_for_payloads(self, raw_connection: Any) -> Iterator[str]:
+        if is_psycopg3:
+            for notify in raw_connection.notifies(timeout=self.POLL_TIMEOUT):
+                yield notify.payload
+            return
+
+        if select.select([raw_connection], [], [], self.POLL_TIMEOUT) == ([], [], []):
+            return
+        raw_connection.poll()
+        while raw_connection.notifies:
+            yield raw_connection.notifies.pop(0).payload
+
+    def _dispatch(self, payload: str) -> None:
+        try:
+            message: dict[str, Any] = json.loads(payload)
+            topic = InvalidationTopic(message["topic"])
+        except (ValueError, KeyError):
+            logger.warning(f"Invalidation Bus Message Error ({payload=})")
+            return
+
+        if message.get("origin") == self.origin:
+            return
+        self._notify(topic=topic, keys=message.get("keys"))
+
+    def _dispatch_reset(self) -> None:
+        for topic in InvalidationTopic:
+            self._notify(topic=topic, keys=None)
+
+    def _notify(self, topic: InvalidationTopic, keys: dict[str, list] | None) -> None:
+        with self._lock:
+            handlers = list(self._handlers[topic])
+        for handler in handlers:
+            try:
+                handler(keys)
+            except Exception:
+                logger.exception(f"Invalidation Bus Handler Error ({topic=})")
@@ -22,3 +22,28 @@ class InvalidTokenTypeException(ServiceException):
     @property
     def message(self):
         return 'Invalid token type'
+
+
+@dataclass(eq=False)
+class TokenRevokedException(ServiceException):
+
+    @property
+    def message(self):
+        return 'Token has been revoked'
+
+
+@dataclass(eq=False)
+class ExecutorSaturatedException(ServiceException):
+
+    @property
+    def message(self):
+        return 'Service is temporarily overloaded, please try again later'
+
+
+@dataclass(eq=False)
+class InvalidCursorException(ServiceException):
+    cursor: str
+
+    @property
+    def message(self):
+        return 'Invalid pagination cursor'
@@ -0,0 +1,83 @@
+import itertools
+import logging
+import queue
+import threading
+from concurrent.futures import Future
+from dataclasses import (
+    dataclass,
+    field,
+)
+from enum import IntEnum
+from typing import (
+    Any,
+    Callable,
+)
+
+from core.apps.common.exceptions import ExecutorSaturatedException
+
+
+logger = logging.getLogger(__name__)
+
+
+class TaskPriority(IntEnum):
+    HIGH = 0
+    LOW = 1
+
+
+@dataclass(eq=False)
+class BoundedPriorityExecutor:
+    max_workers: int
+    max_queue_size: int
+    max_low_priority_queue_size: int
+    thread_name_prefix: str = "executor"
+    _queue: queue.PriorityQueue = field(default_factory=queue.PriorityQueue, init=False, repr=False)
+    _queued: int = field(default=0, init=False, repr=False)
+    _workers: list[threading.Thread] = field(default_factory=list, init=False, repr=False)
+    _sequence: itertools.count = field(default_factory=itertools.count, init=False, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+
+    def submit(self, fn: Callable, *args: Any, priority: TaskPriority = TaskPriority.HIGH, **kwargs: Any) -> Future:
+        future = Future()
+        with self._lock:
+            queue_limit = self.max_queue_size if priority == TaskPriority.HIGH else self.max_low_priority_queue_size
+            if self._queued >= queue_limit:
+                logger.warning(f"Executor Saturated Error ({self.thread_name_prefix=}, {priority=}, {self._queued=})")
+                raise ExecutorSaturatedException
+            self._queued += 1
+            self._start_workers()
+
+        self._queue.put((priority, next(self._sequence), future, fn, args, kwargs))
+        return future
+
+    def is_worker_thread(self) -> bool:
+        return threading.current_thread() in self._workers
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "workers": len(self._workers),
+            "queued": self._queued,
+        }
+
+    def _start_workers(self) -> None:
+        self._workers = [worker for worker in self._workers if worker.is_alive()]
+        while len(self._workers) < self.max_workers:
+            worker = threading.Thread(
+                target=self._work,
+                name=f"{self.thread_name_prefix}_{len(self._workers)}",
+                daemon=True,
+            )
+            worker.start()
+            self._workers.append(worker)
+
+    def _work(self) -> None:
+        while True:
+            _, _, future, fn, args, kwargs = self._queue.get()
+            with self._lock:
+                self._queued -= 1
+
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(fn(*args, **kwargs))
+            except BaseException as e:
+                future.set_exception(e)
@@ -0,0 +1,95 @@
+import base64
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from typing import (
+    Any,
+    Generic,
+    Sequence,
+    TypeVar,
+)
+
+from django.core.exceptions import (
+    FieldDoesNotExist,
+    ValidationError,
+)
+from django.db import models
+from django.db.models import (
+    Func,
+    QuerySet,
+    Value,
+)
+
+from core.apps.common.exceptions import InvalidCursorException
+
+
+TModel = TypeVar("TModel", bound=models.Model)
+
+
+class Row(Func):
+    function = "ROW"
+    output_field = models.Field()
+
+
+@dataclass
+class KeysetPage(Generic[TModel]):
+    items: list[TModel]
+    next_cursor: str | None
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    payload = json.dumps(
+        [value.isoformat() if isinstance(value, datetime) else value for value in values],
+        separators=(",", ":"),
+        default=str,
+    )
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, size: int) -> list[Any]:
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except (TypeError, ValueError):
+        raise InvalidCursorException(cursor=cursor)
+
+    if (
+        not isinstance(values, list)
+        or len(values) != size
+        or not all(value is None or isinstance(value, (str, int, float)) for value in values)
+    ):
+        raise InvalidCursorException(cursor=cursor)
+    return values
+
+
+def paginate_by_keyset(
+    queryset: QuerySet[TModel],
+    cursor: str | None,
+    limit: int,
+    fields: tuple[str, ...] = ("created_at", "id"),
+    descending: bool = True,
+) -> KeysetPage[TModel]:
+    queryset = queryset.order_by(*(f"-{name}" if descending else name for name in fields))
+    if cursor is not None:
+        values = [
+            _to_python(model=queryset.model, name=name, value=value, cursor=cursor)
+            for name, value in zip(fields, decode_cursor(cursor=cursor, size=len(fields)))
+        ]
+        queryset = queryset.alias(keyset=Row(*fields)).filter(
+            **{"keyset__lt" if descending else "keyset__gt": Row(*(Value(value) for value in values))},
+        )
+
+    items = list(queryset[:limit + 1])
+    if len(items) <= limit:
+        return KeysetPage(items=items, next_cursor=None)
+
+    items = items[:limit]
+    return KeysetPage(items=items, next_cursor=encode_cursor([getattr(items[-1], name) for name in fields]))
+
+
+def _to_python(model: type[models.Model], name: str, value: Any, cursor: str) -> Any:
+    try:
+        return model._meta.get_field(name).to_python(value)
+    except FieldDoesNotExist:
+        return value
+    except (TypeError, ValueError, ValidationError):
+        raise InvalidCursorException(cursor=cursor)
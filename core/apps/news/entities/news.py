@@ -18,5 +18,6 @@ class News:
     user: User | None = field(default=None, kw_only=True)
     tags: list[Tag] | None = field(default=None, kw_only=True)
     faculty: Faculty | None = field(default=None, kw_only=True)
+    headline: str | None = field(default=None, kw_only=True)
     created_at: datetime = field(default_factory=datetime.utcnow)
     updated_at: datetime | None = field(default=None)
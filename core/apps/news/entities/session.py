@@ -0,0 +1,16 @@
+from dataclasses import (
+    dataclass,
+    field,
+)
+from datetime import datetime
+
+
+@dataclass
+class Session:
+    id: int | None = field(default=None, kw_only=True) # noqa
+    client_id: int | None = field(default=None, kw_only=True)
+    device_id: str | None = field(default=None, kw_only=True)
+    expires_at: datetime | None = field(default=None, kw_only=True)
+    revoked_at: datetime | None = field(default=None, kw_only=True)
+    created_at: datetime = field(default_factory=datetime.utcnow)
+    updated_at: datetime | None = field(default=None)
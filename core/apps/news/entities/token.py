@@ -3,8 +3,26 @@ from dataclasses import (
     field,
 )
 
+from core.apps.common.models import (
+    TokenType,
+    UserRole,
+)
+
 
 @dataclass
 class Token:
     access_token: str | None = field(default=None)
     refresh_token: str | None = field(default=None)
+
+
+@dataclass(frozen=True, slots=True)
+class TokenClaims:
+    token_type: TokenType
+    client_id: int
+    email: str
+    role: UserRole
+    token_version: int
+    jti: str
+    expires_at: int
+    issued_at: int
+    device_id: str | None = None
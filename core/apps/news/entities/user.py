@@ -4,6 +4,8 @@ from dataclasses import (
 )
 from decimal import Decimal
 from datetime import datetime
+from enum import Enum
+from typing import Any
 
 from core.apps.common.models import UserRole
 
@@ -18,5 +20,44 @@ class User:
     role: UserRole | None = field(default=None, kw_only=True)
     password: str | None = field(default=None, kw_only=True)
     score: Decimal | None = field(default=None, kw_only=True)
+    token_version: int | None = field(default=None, kw_only=True)
     created_at: datetime = field(default_factory=datetime.utcnow)
     updated_at: datetime | None = field(default=None)
+
+
+class ClientProjection(Enum):
+    AUTH = ("id", "email", "role", "password", "token_version")
+    PUBLIC = ("id", "first_name", "last_name", "middle_name", "score")
+    PRIVATE = ("id", "first_name", "last_name", "middle_name", "score", "role", "email")
+    FULL = (
+        "id",
+        "first_name",
+        "last_name",
+        "middle_name",
+        "email",
+        "role",
+        "password",
+        "score",
+        "token_version",
+        "created_at",
+        "updated_at",
+    )
+
+    def to_entity(self, row: tuple[Any, ...]) -> User:
+        values = dict(zip(self.value, row))
+        if "role" in values:
+            values["role"] = UserRole(values["role"])
+        return User(**values)
+
+
+@dataclass
+class ClientImportError:
+    line: int
+    email: str | None
+    message: str
+
+
+@dataclass
+class ClientImportReport:
+    imported: int = 0
+    errors: list[ClientImportError] = field(default_factory=list)
@@ -9,3 +9,13 @@ class InvalidAuthDataException(ServiceException):
     @property
     def message(self):
         return 'Невірний email або пароль'
+
+
+@dataclass(eq=False)
+class LoginThrottledException(ServiceException):
+    email: str
+    ip_address: str | None = None
+
+    @property
+    def message(self):
+        return 'Забагато невдалих спроб входу, спробуйте пізніше'
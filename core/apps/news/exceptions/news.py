@@ -0,0 +1,12 @@
+from dataclasses import dataclass
+
+from core.apps.common.exceptions import ServiceException
+
+
+@dataclass(eq=False)
+class NewsNotFoundException(ServiceException):
+    id: int
+
+    @property
+    def message(self):
+        return 'Новину з вказаним ідентифікатором не знайдено'
@@ -0,0 +1,13 @@
+from dataclasses import dataclass
+
+from core.apps.common.exceptions import ServiceException
+
+
+@dataclass(eq=False)
+class SessionNotFoundException(ServiceException):
+    client_id: int
+    device_id: str | None = None
+
+    @property
+    def message(self):
+        return 'Сесію не знайдено або її завершено'
@@ -34,7 +34,7 @@ class ClientRoleNotMatchingWithRequiredException(ServiceException):
 
 @dataclass(eq=False)
 class ClientUpdateException(ServiceException):
-    id: int
+    id: int | None = None
     email: str | None = None
     password: str | None = None
 
@@ -0,0 +1,73 @@
+import random
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import (
+    connection,
+    transaction,
+)
+from django.test.utils import CaptureQueriesContext
+
+from core.apps.news.models.user import User as ClientModel
+from core.apps.news.services.user import ORMClientService
+from core.apps.common.factory import get_new_uuid
+from core.apps.common.models import UserRole
+from core.project.containers.containers import get_container
+
+
+class Command(BaseCommand):
+    help = "Measures client insert and email lookup cost inside a rolled back transaction"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--inserts", type=int, default=2_000)
+        parser.add_argument("--lookups", type=int, default=5_000)
+
+    def handle(self, *args, **options):
+        client_service: ORMClientService = get_container().resolve(ORMClientService)
+        table = ClientModel._meta.db_table
+
+        with transaction.atomic():
+            emails = [f"Bench.{get_new_uuid()[:12]}@gmail.com" for _ in range(options["inserts"])]
+            started_at = time.perf_counter()
+            for email in emails:
+                client_service.create(
+                    first_name="Bench",
+                    last_name="Bench",
+                    middle_name="Bench",
+                    email=email,
+                    role=UserRole.CREATOR,
+                    hashed_password="!",
+                )
+            insert_seconds = time.perf_counter() - started_at
+
+            with connection.cursor() as cursor:
+                cursor.execute(f"ANALYZE {connection.ops.quote_name(table)}")
+
+            sample = random.choices(emails, k=options["lookups"])
+            started_at = time.perf_counter()
+            for email in sample:
+                client_service.get_by_email(client_email=email)
+            lookup_seconds = time.perf_counter() - started_at
+
+            with CaptureQueriesContext(connection) as context:
+                client_service.get_by_email(client_email=sample[0])
+            with connection.cursor() as cursor:
+                cursor.execute(f"EXPLAIN ANALYZE {context.captured_queries[-1]['sql']}")
+                plan = [row[0] for row in cursor.fetchall()]
+                cursor.execute(
+                    "SELECT indexrelid::regclass::text, pg_relation_size(indexrelid) "
+                    "FROM pg_index WHERE indrelid = %s::regclass ORDER BY 1",
+                    [table],
+                )
+                indexes = cursor.fetchall()
+
+            transaction.set_rollback(True)
+
+        self.stdout.write(f"insert: {insert_seconds / len(emails) * 1e6:.0f} us/row ({len(emails)} rows)")
+        self.stdout.write(f"lookup: {lookup_seconds / len(sample) * 1e6:.0f} us/query ({len(sample)} queries)")
+        self.stdout.write("lookup plan:")
+        for line in plan:
+            self.stdout.write(f"  {line}")
+        self.stdout.write(f"indexes on {table}:")
+        for name, size in indexes:
+            self.stdout.write(f"  {name}: {size // 1024} KiB")
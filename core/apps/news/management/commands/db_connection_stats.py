@@ -0,0 +1,36 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import connections
+
+
+class Command(BaseCommand):
+    help = "Shows the database pooling mode and the server-side connections opened by the application"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--database", default="default")
+
+    def handle(self, *args, **options):
+        connection = connections[options["database"]]
+        settings_dict = connection.settings_dict
+        application_name = settings_dict["OPTIONS"].get("application_name")
+
+        self.stdout.write(f"mode: {settings.DB_POOL_MODE}")
+        self.stdout.write(f"conn_max_age: {settings_dict['CONN_MAX_AGE']}")
+        self.stdout.write(f"conn_health_checks: {settings_dict['CONN_HEALTH_CHECKS']}")
+        self.stdout.write(f"disable_server_side_cursors: {settings_dict['DISABLE_SERVER_SIDE_CURSORS']}")
+        for key, value in (settings_dict["OPTIONS"].get("pool") or {}).items():
+            self.stdout.write(f"pool.{key}: {value}")
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT COALESCE(state, 'unknown'), COUNT(*) FROM pg_stat_activity "
+                "WHERE datname = current_database() AND application_name = %s AND pid <> pg_backend_pid() "
+                "GROUP BY 1 ORDER BY 1",
+                [application_name],
+            )
+            rows = cursor.fetchall()
+
+        self.stdout.write(f"server connections ({application_name=}):")
+        for state, count in rows:
+            self.stdout.write(f"  {state}: {count}")
+        self.stdout.write(self.style.SUCCESS(f"Total {sum(count for _, count in rows)} connections"))
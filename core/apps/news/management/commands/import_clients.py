@@ -0,0 +1,76 @@
+import csv
+import json
+import os
+import time
+from pathlib import Path
+from typing import (
+    Any,
+    Iterator,
+)
+
+from django.core.management.base import (
+    BaseCommand,
+    CommandError,
+)
+
+from core.apps.news.usecases.user.import_clients import ImportClientsUseCase
+from core.apps.common.models import UserRole
+from core.project.containers.containers import get_container
+
+
+class Command(BaseCommand):
+    help = (
+        "Imports clients from a CSV or NDJSON file with first_name, last_name, middle_name, email, password "
+        "and an optional role"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", type=Path)
+        parser.add_argument("--format", choices=["csv", "ndjson"])
+        parser.add_argument("--chunk-size", type=int, default=1_000)
+        parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+        parser.add_argument("--role", choices=UserRole.values, default=UserRole.CREATOR)
+        parser.add_argument(
+            "--bcrypt-rounds",
+            type=int,
+            help="Hash cost for imported passwords; lower costs are upgraded on the client's first login",
+        )
+
+    def handle(self, *args, **options):
+        path: Path = options["path"]
+        if not path.is_file():
+            raise CommandError(f"File not found: {path}")
+        file_format = options["format"] or ("ndjson" if path.suffix in (".ndjson", ".jsonl") else "csv")
+
+        use_case: ImportClientsUseCase = get_container().resolve(ImportClientsUseCase)
+        started_at = time.perf_counter()
+        with path.open(newline="", encoding="utf-8") as file:
+            report = use_case.execute(
+                rows=self._read_csv(file) if file_format == "csv" else self._read_ndjson(file),
+                chunk_size=options["chunk_size"],
+                workers=options["workers"],
+                default_role=UserRole(options["role"]),
+                bcrypt_rounds=options["bcrypt_rounds"],
+            )
+        elapsed = time.perf_counter() - started_at
+
+        for error in report.errors:
+            self.stderr.write(f"line {error.line} ({error.email}): {error.message}")
+        self.stdout.write(self.style.SUCCESS(
+            f"Imported {report.imported} clients, {len(report.errors)} rows failed in {elapsed:.1f}s",
+        ))
+
+    def _read_csv(self, file) -> Iterator[tuple[int, dict[str, Any] | None]]:
+        reader = csv.DictReader(file)
+        for row in reader:
+            yield reader.line_num, row
+
+    def _read_ndjson(self, file) -> Iterator[tuple[int, dict[str, Any] | None]]:
+        for line, raw_row in enumerate(file, start=1):
+            if not raw_row.strip():
+                continue
+            try:
+                row = json.loads(raw_row)
+            except json.JSONDecodeError:
+                row = None
+            yield line, row if isinstance(row, dict) else None
@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand
+
+from core.apps.news.services.revocation import BaseTokenRevocationService
+from core.project.containers.containers import get_container
+
+
+class Command(BaseCommand):
+    help = "Deletes expired revoked tokens and rebuilds the revocation filter"
+
+    def handle(self, *args, **options):
+        container = get_container()
+        revocation_service: BaseTokenRevocationService = container.resolve(BaseTokenRevocationService)
+        deleted = revocation_service.prune()
+
+        self.stdout.write(self.style.SUCCESS(f"Pruned {deleted} expired revoked tokens"))
@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand
+
+from core.apps.news.services.session import BaseSessionService
+from core.project.containers.containers import get_container
+
+
+class Command(BaseCommand):
+    help = "Deletes expired client sessions"
+
+    def handle(self, *args, **options):
+        container = get_container()
+        session_service: BaseSessionService = container.resolve(BaseSessionService)
+        deleted = session_service.prune()
+
+        self.stdout.write(self.style.SUCCESS(f"Pruned {deleted} expired sessions"))
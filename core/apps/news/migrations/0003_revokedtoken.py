@@ -0,0 +1,29 @@
+# Generated by Django 5.1.7 on 2026-10-18 15:01
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('news', '0002_alter_user_score'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RevokedToken',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Created date')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Updated date')),
+                ('jti', models.CharField(max_length=36, unique=True, verbose_name='Token identifier')),
+                ('token_type', models.CharField(choices=[('access', 'ACCESS'), ('refresh', 'REFRESH')], verbose_name='Token type')),
+                ('expires_at', models.DateTimeField(verbose_name='Token expiration time')),
+            ],
+            options={
+                'verbose_name': 'Revoked token',
+                'verbose_name_plural': 'Revoked tokens',
+                'indexes': [models.Index(fields=['created_at'], name='news_revoke_created_1d3682_idx'), models.Index(fields=['expires_at'], name='news_revoke_expires_fd9980_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 5.1.7 on 2026-10-18 15:03
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('news', '0003_revokedtoken'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Session',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Created date')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Updated date')),
+                ('device_id', models.CharField(max_length=36, verbose_name='Session device identifier')),
+                ('refresh_jti', models.CharField(max_length=36, verbose_name='Current refresh token identifier')),
+                ('expires_at', models.DateTimeField(verbose_name='Session expiration time')),
+                ('revoked_at', models.DateTimeField(blank=True, null=True, verbose_name='Session revocation time')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='user_sessions', to='news.user', verbose_name='Session user')),
+            ],
+            options={
+                'verbose_name': 'Session',
+                'verbose_name_plural': 'Sessions',
+                'constraints': [models.UniqueConstraint(fields=('user', 'device_id'), name='news_session_user_device_uniq')],
+            },
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 5.1.7 on 2026-10-18 15:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('news', '0005_user_token_version'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ScoreEvent',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Created date')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Updated date')),
+                ('client_email', models.EmailField(max_length=255, verbose_name="Scored client's email")),
+                ('delta', models.DecimalField(decimal_places=2, max_digits=5, verbose_name='Score change')),
+            ],
+            options={
+                'verbose_name': 'Score event',
+                'verbose_name_plural': 'Score events',
+            },
+        ),
+    ]
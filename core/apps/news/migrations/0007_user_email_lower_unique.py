@@ -0,0 +1,57 @@
+# Generated by Django 5.1.7 on 2026-10-18 15:49
+
+import django.db.models.functions.text
+from django.db import migrations, models
+from django.db.models import Count
+from django.db.models.functions import Lower
+
+
+def check_case_duplicate_emails(apps, schema_editor):
+    User = apps.get_model('news', 'User')
+    duplicates = (
+        User.objects.using(schema_editor.connection.alias)
+        .values(email_lower=Lower('email'))
+        .annotate(count=Count('id'))
+        .filter(count__gt=1)
+        .order_by('email_lower')
+    )
+    if not duplicates:
+        return
+
+    emails = {
+        duplicate['email_lower']: sorted(
+            User.objects.using(schema_editor.connection.alias)
+            .filter(email__iexact=duplicate['email_lower'])
+            .values_list('email', flat=True),
+        )
+        for duplicate in duplicates
+    }
+    raise RuntimeError(
+        'Cannot add news_user_email_lower_uniq: emails differ only by case for '
+        + '; '.join(f'{email_lower}: {", ".join(variants)}' for email_lower, variants in emails.items())
+        + '. Merge or rename these users and rerun the migration.'
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('news', '0006_scoreevent'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='user',
+            name='news_user_email_b147bc_idx',
+        ),
+        migrations.AlterField(
+            model_name='user',
+            name='email',
+            field=models.EmailField(max_length=255, verbose_name="User's email for auth"),
+        ),
+        migrations.RunPython(check_case_duplicate_emails, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='user',
+            constraint=models.UniqueConstraint(django.db.models.functions.text.Lower('email'), name='news_user_email_lower_uniq'),
+        ),
+    ]
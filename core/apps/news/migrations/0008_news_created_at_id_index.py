@@ -0,0 +1,17 @@
+# Generated by Django 5.1.7 on 2026-10-18 16:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('news', '0007_user_email_lower_unique'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='news',
+            index=models.Index(fields=['created_at', 'id'], name='news_news_created_3d414b_idx'),
+        ),
+    ]
@@ -4,3 +4,6 @@ from .faculty import Faculty
 from .user import User
 from .tag import Tag
 from .subscription import Subscription
+from .token import RevokedToken
+from .session import Session
+from .score import ScoreEvent
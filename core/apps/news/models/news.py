@@ -1,3 +1,13 @@
+from typing import (
+    ClassVar,
+    Iterable,
+)
+
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import (
+    SearchVector,
+    SearchVectorField,
+)
 from django.db import models
 
 from core.apps.common.models import (
@@ -6,9 +16,14 @@ from core.apps.common.models import (
 from core.apps.news.models.faculty import Faculty
 from core.apps.news.models.tag import Tag
 from core.apps.news.models.user import User
+from core.apps.news.entities.faculty import Faculty as FacultyEntity
 from core.apps.news.entities.news import News as NewsEntity
+from core.apps.news.entities.tag import Tag as TagEntity
+from core.apps.news.entities.user import User as UserEntity
 
 class News(TimedBaseModel):
+    SEARCH_CONFIG: ClassVar[str] = 'simple'
+
     title = models.CharField(
         max_length=150,
         verbose_name='News name',
@@ -38,6 +53,15 @@ class News(TimedBaseModel):
         blank=True,
         null=True,
     )
+    search_vector = models.GeneratedField(
+        expression=(
+            SearchVector('title', weight='A', config=SEARCH_CONFIG)
+            + SearchVector('description', weight='B', config=SEARCH_CONFIG)
+            + SearchVector('content', weight='C', config=SEARCH_CONFIG)
+        ),
+        output_field=SearchVectorField(),
+        db_persist=True,
+    )
 
     def to_entity(self) -> NewsEntity:
         return NewsEntity(
@@ -45,13 +69,45 @@ class News(TimedBaseModel):
             title=self.title,
             description=self.description,
             content=self.content,
-            user=self.user,
-            tags=[Tag(tag.id) for tag in self.tags.all()],
-            faculty=self.faculty,
+            user=self.user.to_entity(),
+            tags=[tag.to_entity() for tag in self.tags.all()],
+            faculty=self.faculty.to_entity() if self.faculty is not None else None,
             created_at=self.created_at,
             updated_at=self.updated_at,
         )
 
+    @classmethod
+    def to_entities(cls, news: Iterable['News']) -> list[NewsEntity]:
+        users: dict[int, UserEntity] = {}
+        faculties: dict[int, FacultyEntity] = {}
+        tags: dict[int, TagEntity] = {}
+
+        entities = []
+        for item in news:
+            if item.user_id not in users:
+                users[item.user_id] = item.user.to_entity()
+            if item.faculty_id is not None and item.faculty_id not in faculties:
+                faculties[item.faculty_id] = item.faculty.to_entity()
+            for tag in item.tags.all():
+                if tag.id not in tags:
+                    tags[tag.id] = tag.to_entity()
+
+            entities.append(
+                NewsEntity(
+                    id=item.id,
+                    title=item.title,
+                    description=item.description,
+                    content=item.content,
+                    user=users[item.user_id],
+                    tags=[tags[tag.id] for tag in item.tags.all()],
+                    faculty=faculties.get(item.faculty_id),
+                    headline=getattr(item, 'headline', None),
+                    created_at=item.created_at,
+                    updated_at=item.updated_at,
+                ),
+            )
+        return entities
+
     def __str__(self):
         return (
             f"{self.title}\n"
@@ -59,4 +115,8 @@ class News(TimedBaseModel):
 
     class Meta:
         verbose_name = "News"
-        verbose_name_plural = "News"
\ No newline at end of file
+        verbose_name_plural = "News"
+        indexes = [
+            models.Index(fields=["created_at", "id"]),
+            GinIndex(fields=["search_vector"]),
+        ]
\ No newline at end of file
@@ -0,0 +1,22 @@
+from django.db import models
+
+from core.apps.common.models import TimedBaseModel
+
+
+class ScoreEvent(TimedBaseModel):
+    client_email = models.EmailField(
+        verbose_name="Scored client's email",
+        max_length=255,
+    )
+    delta = models.DecimalField(
+        verbose_name='Score change',
+        decimal_places=2,
+        max_digits=5,
+    )
+
+    def __str__(self):
+        return f"{self.client_email} {self.delta}"
+
+    class Meta:
+        verbose_name = 'Score event'
+        verbose_name_plural = 'Score events'
@@ -0,0 +1,51 @@
+from django.db import models
+
+from core.apps.common.models import TimedBaseModel
+from core.apps.news.models.user import User
+from core.apps.news.entities.session import Session as SessionEntity
+
+
+class Session(TimedBaseModel):
+    user = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name='user_sessions',
+        verbose_name='Session user',
+    )
+    device_id = models.CharField(
+        verbose_name='Session device identifier',
+        max_length=36,
+    )
+    refresh_jti = models.CharField(
+        verbose_name='Current refresh token identifier',
+        max_length=36,
+    )
+    expires_at = models.DateTimeField(
+        verbose_name='Session expiration time',
+    )
+    revoked_at = models.DateTimeField(
+        verbose_name='Session revocation time',
+        blank=True,
+        null=True,
+    )
+
+    def to_entity(self) -> SessionEntity:
+        return SessionEntity(
+            id=self.id,
+            client_id=self.user_id,
+            device_id=self.device_id,
+            expires_at=self.expires_at,
+            revoked_at=self.revoked_at,
+            created_at=self.created_at,
+            updated_at=self.updated_at,
+        )
+
+    def __str__(self):
+        return f"{self.user_id} {self.device_id}"
+
+    class Meta:
+        verbose_name = "Session"
+        verbose_name_plural = "Sessions"
+        constraints = [
+            models.UniqueConstraint(fields=["user", "device_id"], name="news_session_user_device_uniq"),
+        ]
@@ -0,0 +1,32 @@
+from django.db import models
+
+from core.apps.common.models import (
+    TimedBaseModel,
+    TokenType,
+)
+
+
+class RevokedToken(TimedBaseModel):
+    jti = models.CharField(
+        verbose_name="Token identifier",
+        max_length=36,
+        unique=True,
+    )
+    token_type = models.CharField(
+        verbose_name="Token type",
+        choices=TokenType,
+    )
+    expires_at = models.DateTimeField(
+        verbose_name="Token expiration time",
+    )
+
+    def __str__(self):
+        return f"{self.token_type} {self.jti}"
+
+    class Meta:
+        verbose_name = "Revoked token"
+        verbose_name_plural = "Revoked tokens"
+        indexes = [
+            models.Index(fields=["created_at"]),
+            models.Index(fields=["expires_at"]),
+        ]
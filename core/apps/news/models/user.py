@@ -1,4 +1,5 @@
 from django.db import models
+from django.db.models.functions import Lower
 
 from core.apps.common.models import (
     UserRole,
@@ -6,6 +7,7 @@ from core.apps.common.models import (
 )
 from core.apps.news.entities.user import User as UserEntity
 
+
 class User(TimedBaseModel):
     first_name = models.CharField(
         verbose_name="User's First Name",
@@ -32,7 +34,6 @@ class User(TimedBaseModel):
     email = models.EmailField(
         verbose_name="User's email for auth",
         max_length=255,
-        unique=True,
         blank=False,
     )
     password = models.CharField(
@@ -40,6 +41,10 @@ class User(TimedBaseModel):
         blank=False,
         null=False,
     )
+    token_version = models.PositiveIntegerField(
+        verbose_name="User's token version",
+        default=0,
+    )
 
     def to_entity(self) -> UserEntity:
         return UserEntity(
@@ -51,6 +56,7 @@ class User(TimedBaseModel):
             email=self.email,
             score=self.score,
             password=self.password,
+            token_version=self.token_version,
             created_at=self.created_at,
             updated_at=self.updated_at,
         )
@@ -61,6 +67,9 @@ class User(TimedBaseModel):
     class Meta:
         verbose_name = "User"
         verbose_name_plural = "Users"
-        indexes = [
-            models.Index(fields=["email"]),
+        constraints = [
+            models.UniqueConstraint(Lower("email"), name="news_user_email_lower_uniq"),
         ]
+
+
+User._meta.get_field("email").register_lookup(Lower)
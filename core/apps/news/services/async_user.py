@@ -0,0 +1,126 @@
+import logging
+from abc import (
+    ABC,
+    abstractmethod,
+)
+from dataclasses import dataclass
+from decimal import Decimal
+
+from asgiref.sync import sync_to_async
+
+from core.apps.news.entities.token import (
+    Token,
+    TokenClaims,
+)
+from core.apps.news.entities.user import (
+    ClientProjection,
+    User as ClientEntity,
+)
+from core.apps.news.exceptions.auth import InvalidAuthDataException
+from core.apps.news.services.user import BaseClientService
+from core.apps.common.auth.password import BasePasswordService
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(eq=False)
+class BaseAsyncClientService(ABC):
+    client_service: BaseClientService
+    password_service: BasePasswordService
+
+    @abstractmethod
+    async def update_credentials(
+        self,
+        client_email: str,
+        first_name: str,
+        last_name: str,
+        middle_name: str,
+    ) -> ClientEntity:
+        ...
+
+    @abstractmethod
+    async def increment_score(self, client_email: str, delta: Decimal) -> ClientEntity:
+        ...
+
+    @abstractmethod
+    async def get_by_email(
+            self,
+            client_email: str,
+            projection: ClientProjection = ClientProjection.FULL,
+    ) -> ClientEntity:
+        ...
+
+    @abstractmethod
+    async def get_by_id(self, client_id: int, projection: ClientProjection = ClientProjection.FULL) -> ClientEntity:
+        ...
+
+    @abstractmethod
+    async def check_client_exists(self, client_email: str) -> bool:
+        ...
+
+    @abstractmethod
+    async def validate_password(self, client_password: str, plain_password: str) -> None:
+        ...
+
+    @abstractmethod
+    def schedule_password_rehash(self, client: ClientEntity, plain_password: str) -> None:
+        ...
+
+    @abstractmethod
+    def generate_tokens(self, client: ClientEntity, device_id: str | None = None) -> Token:
+        ...
+
+    @abstractmethod
+    def get_claims_from_token(self, token: str) -> TokenClaims:
+        ...
+
+
+class AsyncORMClientService(BaseAsyncClientService):
+    async def update_credentials(
+        self,
+        client_email: str,
+        first_name: str,
+        last_name: str,
+        middle_name: str,
+    ) -> ClientEntity:
+        return await sync_to_async(self.client_service.update_credentials)(
+            client_email=client_email,
+            first_name=first_name,
+            last_name=last_name,
+            middle_name=middle_name,
+        )
+
+    async def increment_score(self, client_email: str, delta: Decimal) -> ClientEntity:
+        return await sync_to_async(self.client_service.increment_score)(client_email=client_email, delta=delta)
+
+    async def get_by_email(
+            self,
+            client_email: str,
+            projection: ClientProjection = ClientProjection.FULL,
+    ) -> ClientEntity:
+        return await self.client_service.aget_by_email(client_email=client_email, projection=projection)
+
+    async def get_by_id(self, client_id: int, projection: ClientProjection = ClientProjection.FULL) -> ClientEntity:
+        return await self.client_service.aget_by_id(client_id=client_id, projection=projection)
+
+    async def check_client_exists(self, client_email: str) -> bool:
+        return await self.client_service.acheck_client_exists(client_email=client_email)
+
+    async def validate_password(self, client_password: str, plain_password: str) -> None:
+        is_valid = await self.password_service.averify_password(
+            plain_password=plain_password,
+            hashed_password=client_password,
+        )
+        if not is_valid:
+            logger.info("Client Validate Password Error")
+            raise InvalidAuthDataException
+
+    def schedule_password_rehash(self, client: ClientEntity, plain_password: str) -> None:
+        self.client_service.schedule_password_rehash(client=client, plain_password=plain_password)
+
+    def generate_tokens(self, client: ClientEntity, device_id: str | None = None) -> Token:
+        return self.client_service.generate_tokens(client=client, device_id=device_id)
+
+    def get_claims_from_token(self, token: str) -> TokenClaims:
+        return self.client_service.get_claims_from_token(token=token)
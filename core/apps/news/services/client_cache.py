@@ -0,0 +1,330 @@
+import threading
+import time
+from dataclasses import (
+    dataclass,
+    field,
+    replace,
+)
+from decimal import Decimal
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    ClassVar,
+    Iterable,
+)
+
+from django.core.cache import caches
+from django.db import (
+    connection,
+    transaction,
+)
+
+from core.apps.common.bus import InvalidationTopic
+from core.apps.common.cache import LRUCache
+from core.apps.common.models import (
+    TokenType,
+    UserRole,
+)
+from core.apps.news.entities.token import (
+    Token,
+    TokenClaims,
+)
+from core.apps.news.entities.user import (
+    ClientProjection,
+    User as ClientEntity,
+)
+from core.apps.news.services.user import BaseClientService
+from core.project.routers import use_primary
+from core.project.settings import env
+
+
+@dataclass(eq=False)
+class CachedClientService(BaseClientService):
+    CACHED_PROJECTIONS: ClassVar[tuple[ClientProjection, ...]] = (ClientProjection.PUBLIC, ClientProjection.PRIVATE)
+    CACHE_ALIAS: ClassVar[str] = env.str("CLIENT_CACHE", default="default")
+    CACHE_TTL: ClassVar[int] = env.int("CLIENT_CACHE_TTL", default=300)
+    LOCAL_CACHE_SIZE: ClassVar[int] = env.int("CLIENT_CACHE_LOCAL_SIZE", default=10_000)
+    LOCAL_CACHE_TTL: ClassVar[int] = env.int("CLIENT_CACHE_LOCAL_TTL", default=5)
+
+    client_service: BaseClientService
+    local_cache: LRUCache = field(init=False, repr=False)
+    _generation: int = field(default=0, init=False, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+
+    def __post_init__(self):
+        self.local_cache = LRUCache(maxsize=self.LOCAL_CACHE_SIZE)
+        self.invalidation_bus.subscribe(InvalidationTopic.CLIENT, self._on_client_invalidated)
+
+    def get_by_email(self, client_email: str, projection: ClientProjection = ClientProjection.FULL) -> ClientEntity:
+        if projection not in self.CACHED_PROJECTIONS:
+            return self.client_service.get_by_email(client_email=client_email, projection=projection)
+        return self._get_or_load(
+            lookup=f"email:{client_email.lower()}",
+            projection=projection,
+            load=lambda: self.client_service.get_by_email(client_email=client_email, projection=projection),
+        )
+
+    def get_by_id(self, client_id: int, projection: ClientProjection = ClientProjection.FULL) -> ClientEntity:
+        if projection not in self.CACHED_PROJECTIONS:
+            return self.client_service.get_by_id(client_id=client_id, projection=projection)
+        return self._get_or_load(
+            lookup=f"id:{client_id}",
+            projection=projection,
+            load=lambda: self.client_service.get_by_id(client_id=client_id, projection=projection),
+        )
+
+    async def aget_by_email(
+            self,
+            client_email: str,
+            projection: ClientProjection = ClientProjection.FULL,
+    ) -> ClientEntity:
+        if projection not in self.CACHED_PROJECTIONS:
+            return await self.client_service.aget_by_email(client_email=client_email, projection=projection)
+        return await self._aget_or_load(
+            lookup=f"email:{client_email.lower()}",
+            projection=projection,
+            load=lambda: self.client_service.aget_by_email(client_email=client_email, projection=projection),
+        )
+
+    async def aget_by_id(self, client_id: int, projection: ClientProjection = ClientProjection.FULL) -> ClientEntity:
+        if projection not in self.CACHED_PROJECTIONS:
+            return await self.client_service.aget_by_id(client_id=client_id, projection=projection)
+        return await self._aget_or_load(
+            lookup=f"id:{client_id}",
+            projection=projection,
+            load=lambda: self.client_service.aget_by_id(client_id=client_id, projection=projection),
+        )
+
+    def invalidate(self, client_ids: Iterable[int] = (), client_emails: Iterable[str] = ()) -> None:
+        lookups = self._get_lookups(client_ids=client_ids, client_emails=client_emails)
+        if not lookups:
+            return
+
+        entry_keys = self._evict_local(lookups=lookups)
+        cache = caches[self.CACHE_ALIAS]
+        for lookup in lookups:
+            version_key = self._get_version_key(lookup=lookup)
+            cache.add(version_key, 0, timeout=None)
+            try:
+                cache.incr(version_key)
+            except ValueError:
+                cache.set(version_key, 1, timeout=None)
+        cache.delete_many(entry_keys)
+
+    def create(
+        self,
+        first_name: str,
+        last_name: str,
+        middle_name: str,
+        email: str,
+        role: str,
+        hashed_password: str,
+    ) -> ClientEntity:
+        return self.client_service.create(
+            first_name=first_name,
+            last_name=last_name,
+            middle_name=middle_name,
+            email=email,
+            role=role,
+            hashed_password=hashed_password,
+        )
+
+    def bulk_create(self, clients: list[ClientEntity]) -> set[str]:
+        return self.client_service.bulk_create(clients=clients)
+
+    def update_email(self, client_email: str, email: str) -> ClientEntity:
+        client = self.client_service.update_email(client_email=client_email, email=email)
+        self._invalidate_after_write(client_ids=[client.id], client_emails=[client_email, email])
+        return client
+
+    def update_password(self, client_email: str, hashed_password: str) -> ClientEntity:
+        client = self.client_service.update_password(client_email=client_email, hashed_password=hashed_password)
+        self._invalidate_after_write(client_ids=[client.id], client_emails=[client_email])
+        return client
+
+    def upgrade_password_hash(self, client_id: int, old_hashed_password: str, hashed_password: str) -> bool:
+        return self.client_service.upgrade_password_hash(
+            client_id=client_id,
+            old_hashed_password=old_hashed_password,
+            hashed_password=hashed_password,
+        )
+
+    def schedule_password_rehash(self, client: ClientEntity, plain_password: str) -> None:
+        self.client_service.schedule_password_rehash(client=client, plain_password=plain_password)
+
+    def update_credentials(
+        self,
+        client_email: str,
+        first_name: str,
+        last_name: str,
+        middle_name: str,
+    ) -> ClientEntity:
+        client = self.client_service.update_credentials(
+            client_email=client_email,
+            first_name=first_name,
+            last_name=last_name,
+            middle_name=middle_name,
+        )
+        self._invalidate_after_write(client_ids=[client.id], client_emails=[client_email])
+        return client
+
+    def update_role(self, client_email: str, role: str) -> ClientEntity:
+        client = self.client_service.update_role(client_email=client_email, role=role)
+        self._invalidate_after_write(client_ids=[client.id], client_emails=[client_email])
+        return client
+
+    def update_score(self, client_email: str, score: Decimal) -> ClientEntity:
+        client = self.client_service.update_score(client_email=client_email, score=score)
+        self._invalidate_after_write(client_ids=[client.id], client_emails=[client_email])
+        return client
+
+    def increment_score(self, client_email: str, delta: Decimal) -> ClientEntity:
+        client = self.client_service.increment_score(client_email=client_email, delta=delta)
+        self._invalidate_after_write(client_ids=[client.id], client_emails=[client_email])
+        return client
+
+    def increment_scores(self, deltas: dict[str, Decimal]) -> list[int]:
+        client_ids = self.client_service.increment_scores(deltas=deltas)
+        self._invalidate_after_write(client_ids=client_ids, client_emails=deltas.keys())
+        return client_ids
+
+    def check_client_exists(self, client_email: str) -> bool:
+        return self.client_service.check_client_exists(client_email=client_email)
+
+    async def acheck_client_exists(self, client_email: str) -> bool:
+        return await self.client_service.acheck_client_exists(client_email=client_email)
+
+    def validate_password(self, client_password: str, plain_password: str) -> None:
+        self.client_service.validate_password(client_password=client_password, plain_password=plain_password)
+
+    def check_client_role(self, client_role: UserRole, required_role: UserRole) -> None:
+        self.client_service.check_client_role(client_role=client_role, required_role=required_role)
+
+    def generate_tokens(self, client: ClientEntity, device_id: str | None = None) -> Token:
+        return self.client_service.generate_tokens(client=client, device_id=device_id)
+
+    def update_access_token(self, client: ClientEntity, device_id: str) -> Token:
+        return self.client_service.update_access_token(client=client, device_id=device_id)
+
+    def get_raw_jwt(self, token: str) -> dict[str, Any]:
+        return self.client_service.get_raw_jwt(token=token)
+
+    def get_claims_from_token(self, token: str) -> TokenClaims:
+        return self.client_service.get_claims_from_token(token=token)
+
+    def get_client_email_from_token(self, token: str) -> str:
+        return self.client_service.get_client_email_from_token(token=token)
+
+    def get_client_role_from_token(self, token: str) -> str:
+        return self.client_service.get_client_role_from_token(token=token)
+
+    def get_token_type_from_token(self, token: str) -> TokenType:
+        return self.client_service.get_token_type_from_token(token=token)
+
+    def get_jti_from_token(self, token: str) -> str:
+        return self.client_service.get_jti_from_token(token=token)
+
+    def get_device_id_from_token(self, token: str) -> str:
+        return self.client_service.get_device_id_from_token(token=token)
+
+    def get_expiration_time_from_token(self, token: str) -> int:
+        return self.client_service.get_expiration_time_from_token(token=token)
+
+    def _on_client_invalidated(self, keys: dict[str, list] | None) -> None:
+        if keys is None:
+            with self._lock:
+                self._generation += 1
+            self.local_cache.clear()
+            return
+        self._evict_local(
+            lookups=self._get_lookups(client_ids=keys.get("ids", []), client_emails=keys.get("emails", [])),
+        )
+
+    def _evict_local(self, lookups: list[str]) -> list[str]:
+        with self._lock:
+            self._generation += 1
+        entry_keys = [
+            self._get_entry_key(lookup=lookup, projection=projection)
+            for lookup in lookups
+            for projection in self.CACHED_PROJECTIONS
+        ]
+        for entry_key in entry_keys:
+            self.local_cache.delete(entry_key)
+        return entry_keys
+
+    def _get_lookups(self, client_ids: Iterable[int], client_emails: Iterable[str]) -> list[str]:
+        return [f"id:{client_id}" for client_id in client_ids] + [f"email:{email.lower()}" for email in client_emails]
+
+    def _invalidate_after_write(self, client_ids: Iterable[int] = (), client_emails: Iterable[str] = ()) -> None:
+        client_ids, client_emails = list(client_ids), list(client_emails)
+        self.invalidate(client_ids=client_ids, client_emails=client_emails)
+        if connection.in_atomic_block:
+            transaction.on_commit(lambda: self.invalidate(client_ids=client_ids, client_emails=client_emails))
+
+    def _get_or_load(
+            self,
+            lookup: str,
+            projection: ClientProjection,
+            load: Callable[[], ClientEntity],
+    ) -> ClientEntity:
+        entry_key = self._get_entry_key(lookup=lookup, projection=projection)
+        client: ClientEntity | None = self.local_cache.get(entry_key)
+        if client is not None:
+            return replace(client)
+
+        generation = self._generation
+        cache = caches[self.CACHE_ALIAS]
+        version_key = self._get_version_key(lookup=lookup)
+        cached = cache.get_many([version_key, entry_key])
+        version = cached.get(version_key, 0)
+        entry: tuple[int, ClientEntity] | None = cached.get(entry_key)
+
+        if entry is not None and entry[0] == version:
+            client = entry[1]
+        else:
+            with use_primary():
+                client = load()
+            cache.set(entry_key, (version, client), timeout=self.CACHE_TTL)
+
+        self._set_local(entry_key=entry_key, client=client, generation=generation)
+        return replace(client)
+
+    async def _aget_or_load(
+            self,
+            lookup: str,
+            projection: ClientProjection,
+            load: Callable[[], Awaitable[ClientEntity]],
+    ) -> ClientEntity:
+        entry_key = self._get_entry_key(lookup=lookup, projection=projection)
+        client: ClientEntity | None = self.local_cache.get(entry_key)
+        if client is not None:
+            return replace(client)
+
+        generation = self._generation
+        cache = caches[self.CACHE_ALIAS]
+        version_key = self._get_version_key(lookup=lookup)
+        cached = await cache.aget_many([version_key, entry_key])
+        version = cached.get(version_key, 0)
+        entry: tuple[int, ClientEntity] | None = cached.get(entry_key)
+
+        if entry is not None and entry[0] == version:
+            client = entry[1]
+        else:
+            with use_primary():
+                client = await load()
+            await cache.aset(entry_key, (version, client), timeout=self.CACHE_TTL)
+
+        self._set_local(entry_key=entry_key, client=client, generation=generation)
+        return replace(client)
+
+    def _set_local(self, entry_key: str, client: ClientEntity, generation: int) -> None:
+        with self._lock:
+            if self._generation == generation:
+                self.local_cache.set(entry_key, client, expires_at=time.time() + self.LOCAL_CACHE_TTL)
+
+    def _get_entry_key(self, lookup: str, projection: ClientProjection) -> str:
+        return f"client:{projection.name}:{lookup}"
+
+    def _get_version_key(self, lookup: str) -> str:
+        return f"client:version:{lookup}"
@@ -0,0 +1,143 @@
+import logging
+import threading
+import time
+from abc import (
+    ABC,
+    abstractmethod,
+)
+from collections import deque
+from dataclasses import (
+    dataclass,
+    field,
+)
+from typing import ClassVar
+
+from django.core.cache import caches
+
+from core.apps.common.cache import LRUCache
+from core.apps.news.exceptions.auth import LoginThrottledException
+from core.project.settings import env
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(eq=False)
+class BaseLoginThrottleService(ABC):
+    EMAIL_LIMIT: ClassVar[int] = env.int("LOGIN_THROTTLE_EMAIL_LIMIT", default=5)
+    IP_LIMIT: ClassVar[int] = env.int("LOGIN_THROTTLE_IP_LIMIT", default=20)
+    WINDOW: ClassVar[int] = env.int("LOGIN_THROTTLE_WINDOW", default=300)
+
+    def acquire(self, email: str, ip_address: str | None = None) -> None:
+        reserved_keys = []
+        for key, limit in self._get_limits(email=email, ip_address=ip_address):
+            if not self._reserve(key=key, limit=limit):
+                for reserved_key in reserved_keys:
+                    self._release(key=reserved_key)
+                logger.warning(f"Login Throttled Error ({key=})")
+                raise LoginThrottledException(email=email, ip_address=ip_address)
+            reserved_keys.append(key)
+
+    def release(self, email: str, ip_address: str | None = None) -> None:
+        self._clear(key=self._get_email_key(email=email))
+        if ip_address:
+            self._release(key=self._get_ip_key(ip_address=ip_address))
+
+    def _get_limits(self, email: str, ip_address: str | None) -> list[tuple[str, int]]:
+        limits = [(self._get_email_key(email=email), self.EMAIL_LIMIT)]
+        if ip_address:
+            limits.append((self._get_ip_key(ip_address=ip_address), self.IP_LIMIT))
+        return limits
+
+    def _get_email_key(self, email: str) -> str:
+        return f"login_throttle:email:{email.lower()}"
+
+    def _get_ip_key(self, ip_address: str) -> str:
+        return f"login_throttle:ip:{ip_address}"
+
+    @abstractmethod
+    def _reserve(self, key: str, limit: int) -> bool:
+        ...
+
+    @abstractmethod
+    def _release(self, key: str) -> None:
+        ...
+
+    @abstractmethod
+    def _clear(self, key: str) -> None:
+        ...
+
+
+@dataclass(eq=False)
+class MemoryLoginThrottleService(BaseLoginThrottleService):
+    MAX_KEYS: ClassVar[int] = env.int("LOGIN_THROTTLE_MAX_KEYS", default=100_000)
+
+    attempts: LRUCache = field(init=False, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+
+    def __post_init__(self):
+        self.attempts = LRUCache(maxsize=self.MAX_KEYS)
+
+    def _reserve(self, key: str, limit: int) -> bool:
+        now = time.time()
+        window_start = now - self.WINDOW
+        with self._lock:
+            attempts: deque | None = self.attempts.get(key)
+            if attempts is None:
+                attempts = deque(maxlen=limit)
+            while attempts and attempts[0] <= window_start:
+                attempts.popleft()
+            if len(attempts) >= limit:
+                return False
+            attempts.append(now)
+            self.attempts.set(key, attempts, expires_at=now + self.WINDOW)
+        return True
+
+    def _release(self, key: str) -> None:
+        with self._lock:
+            attempts: deque | None = self.attempts.get(key)
+            if attempts:
+                attempts.pop()
+
+    def _clear(self, key: str) -> None:
+        self.attempts.delete(key)
+
+
+@dataclass(eq=False)
+class CacheLoginThrottleService(BaseLoginThrottleService):
+    CACHE_ALIAS: ClassVar[str] = env.str("LOGIN_THROTTLE_CACHE", default="default")
+
+    def _reserve(self, key: str, limit: int) -> bool:
+        cache = caches[self.CACHE_ALIAS]
+        current_bucket, elapsed = divmod(time.time(), self.WINDOW)
+        previous_key, current_key = self._get_bucket_keys(key=key, bucket=int(current_bucket))
+        cache.add(current_key, 0, timeout=self.WINDOW * 2)
+        try:
+            current_count = cache.incr(current_key)
+        except ValueError:
+            cache.set(current_key, 1, timeout=self.WINDOW * 2)
+            current_count = 1
+
+        previous_count = cache.get(previous_key, 0)
+        if previous_count * (1 - elapsed / self.WINDOW) + current_count - 1 >= limit:
+            self._decr(key=current_key)
+            return False
+        return True
+
+    def _release(self, key: str) -> None:
+        _, current_key = self._get_bucket_keys(key=key, bucket=int(time.time() // self.WINDOW))
+        self._decr(key=current_key)
+
+    def _decr(self, key: str) -> None:
+        try:
+            caches[self.CACHE_ALIAS].decr(key)
+        except ValueError:
+            pass
+
+    def _clear(self, key: str) -> None:
+        caches[self.CACHE_ALIAS].delete_many(
+            self._get_bucket_keys(key=key, bucket=int(time.time() // self.WINDOW)),
+        )
+
+    def _get_bucket_keys(self, key: str, bucket: int) -> list[str]:
+        return [f"{key}:{bucket - 1}", f"{key}:{bucket}"]
@@ -0,0 +1,93 @@
+import logging
+from abc import (
+    ABC,
+    abstractmethod,
+)
+from dataclasses import dataclass
+from typing import ClassVar
+
+from django.contrib.postgres.search import (
+    SearchHeadline,
+    SearchQuery,
+    SearchRank,
+)
+from django.db.models import (
+    F,
+    FloatField,
+    QuerySet,
+)
+from django.db.models.functions import Cast
+
+from core.apps.news.entities.news import News as NewsEntity
+from core.apps.news.exceptions.news import NewsNotFoundException
+from core.apps.news.models.news import News as NewsModel
+from core.apps.common.pagination import paginate_by_keyset
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(eq=False)
+class BaseNewsService(ABC):
+    @abstractmethod
+    def get_by_id(self, news_id: int) -> NewsEntity:
+        ...
+
+    @abstractmethod
+    def get_list(
+        self,
+        cursor: str | None,
+        limit: int,
+        faculty_id: int | None = None,
+        tag_id: int | None = None,
+        search: str | None = None,
+    ) -> tuple[list[NewsEntity], str | None]:
+        ...
+
+
+class ORMNewsService(BaseNewsService):
+    HEADLINE_MAX_WORDS: ClassVar[int] = 35
+    HEADLINE_MIN_WORDS: ClassVar[int] = 15
+
+    def get_by_id(self, news_id: int) -> NewsEntity:
+        try:
+            news = self._get_queryset().get(id=news_id)
+        except NewsModel.DoesNotExist:
+            logger.info(f"News Does Not Exist Error ({news_id=})")
+            raise NewsNotFoundException(id=news_id)
+
+        return news.to_entity()
+
+    def get_list(
+        self,
+        cursor: str | None,
+        limit: int,
+        faculty_id: int | None = None,
+        tag_id: int | None = None,
+        search: str | None = None,
+    ) -> tuple[list[NewsEntity], str | None]:
+        queryset = self._get_queryset()
+        if faculty_id is not None:
+            queryset = queryset.filter(faculty_id=faculty_id)
+        if tag_id is not None:
+            queryset = queryset.filter(tags__id=tag_id)
+        if not search:
+            page = paginate_by_keyset(queryset=queryset, cursor=cursor, limit=limit)
+            return NewsModel.to_entities(page.items), page.next_cursor
+
+        query = SearchQuery(search, config=NewsModel.SEARCH_CONFIG, search_type="websearch")
+        queryset = queryset.filter(search_vector=query).annotate(
+            rank=Cast(SearchRank(F("search_vector"), query), output_field=FloatField()),
+            headline=SearchHeadline(
+                "content",
+                query,
+                config=NewsModel.SEARCH_CONFIG,
+                max_words=self.HEADLINE_MAX_WORDS,
+                min_words=self.HEADLINE_MIN_WORDS,
+            ),
+        )
+        page = paginate_by_keyset(queryset=queryset, cursor=cursor, limit=limit, fields=("rank", "id"))
+        return NewsModel.to_entities(page.items), page.next_cursor
+
+    def _get_queryset(self) -> QuerySet[NewsModel]:
+        return NewsModel.objects.select_related("user", "faculty").prefetch_related("tags").defer("search_vector")
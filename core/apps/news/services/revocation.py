@@ -0,0 +1,164 @@
+import logging
+import threading
+import time
+from abc import (
+    ABC,
+    abstractmethod,
+)
+from dataclasses import (
+    dataclass,
+    field,
+)
+from datetime import (
+    datetime,
+    timedelta,
+    timezone,
+)
+from typing import ClassVar
+
+from asgiref.sync import sync_to_async
+
+from core.apps.common.bloom import BloomFilter
+from core.apps.common.bus import (
+    BaseInvalidationBus,
+    InvalidationTopic,
+)
+from core.apps.news.entities.token import TokenClaims
+from core.apps.news.models.token import RevokedToken as RevokedTokenModel
+from core.project.settings import env
+
+
+logger = logging.getLogger(__name__)
+
+
+class BaseTokenRevocationService(ABC):
+    @abstractmethod
+    def revoke(self, claims: list[TokenClaims]) -> None:
+        ...
+
+    @abstractmethod
+    def is_revoked(self, jti: str) -> bool:
+        ...
+
+    @abstractmethod
+    async def ais_revoked(self, jti: str) -> bool:
+        ...
+
+    @abstractmethod
+    def rebuild(self) -> None:
+        ...
+
+    @abstractmethod
+    def prune(self) -> int:
+        ...
+
+
+@dataclass(eq=False)
+class ORMTokenRevocationService(BaseTokenRevocationService):
+    BLOOM_CAPACITY: ClassVar[int] = env.int("REVOCATION_BLOOM_CAPACITY", default=100_000)
+    BLOOM_ERROR_RATE: ClassVar[float] = env.float("REVOCATION_BLOOM_ERROR_RATE", default=0.001)
+    SYNC_INTERVAL: ClassVar[int] = env.int("REVOCATION_SYNC_INTERVAL", default=5)
+    REBUILD_INTERVAL: ClassVar[int] = env.int("REVOCATION_REBUILD_INTERVAL", default=600)
+    CLOCK_SKEW: ClassVar[timedelta] = timedelta(seconds=30)
+
+    invalidation_bus: BaseInvalidationBus
+    _filter: BloomFilter | None = field(default=None, init=False, repr=False)
+    _synced_till: datetime | None = field(default=None, init=False, repr=False)
+    _synced_at: float = field(default=0.0, init=False, repr=False)
+    _built_at: float = field(default=0.0, init=False, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+
+    def __post_init__(self):
+        self.invalidation_bus.subscribe(InvalidationTopic.REVOKED_TOKEN, self._on_tokens_revoked)
+
+    def revoke(self, claims: list[TokenClaims]) -> None:
+        RevokedTokenModel.objects.bulk_create(
+            [
+                RevokedTokenModel(
+                    jti=token_claims.jti,
+                    token_type=token_claims.token_type,
+                    expires_at=datetime.fromtimestamp(token_claims.expires_at, tz=timezone.utc),
+                )
+                for token_claims in claims
+            ],
+            ignore_conflicts=True,
+        )
+        bloom_filter = self._get_filter()
+        for token_claims in claims:
+            bloom_filter.add(token_claims.jti)
+        self.invalidation_bus.publish(
+            InvalidationTopic.REVOKED_TOKEN,
+            jtis=[token_claims.jti for token_claims in claims],
+        )
+
+    def is_revoked(self, jti: str) -> bool:
+        if jti not in self._get_filter():
+            return False
+        return RevokedTokenModel.objects.filter(jti=jti).exists()
+
+    async def ais_revoked(self, jti: str) -> bool:
+        bloom_filter = self._filter
+        now = time.monotonic()
+        if (
+            bloom_filter is None
+            or now - self._built_at >= self.REBUILD_INTERVAL
+            or now - self._synced_at >= self.SYNC_INTERVAL
+        ):
+            bloom_filter = await sync_to_async(self._get_filter)()
+
+        if jti not in bloom_filter:
+            return False
+        return await RevokedTokenModel.objects.filter(jti=jti).aexists()
+
+    def rebuild(self) -> None:
+        with self._lock:
+            synced_till = datetime.now(tz=timezone.utc)
+            jtis = list(
+                RevokedTokenModel.objects.filter(expires_at__gt=synced_till).values_list("jti", flat=True),
+            )
+            bloom_filter = BloomFilter(
+                capacity=max(self.BLOOM_CAPACITY, 2 * len(jtis)),
+                error_rate=self.BLOOM_ERROR_RATE,
+            )
+            for jti in jtis:
+                bloom_filter.add(jti)
+
+            self._filter = bloom_filter
+            self._synced_till = synced_till
+            self._built_at = self._synced_at = time.monotonic()
+        logger.info(f"Revocation Filter Rebuilt ({len(jtis)=})")
+
+    def prune(self) -> int:
+        deleted, _ = RevokedTokenModel.objects.filter(expires_at__lte=datetime.now(tz=timezone.utc)).delete()
+        self.rebuild()
+        return deleted
+
+    def _sync(self) -> None:
+        with self._lock:
+            synced_till = datetime.now(tz=timezone.utc)
+            jtis = RevokedTokenModel.objects.filter(
+                created_at__gte=self._synced_till - self.CLOCK_SKEW,
+            ).values_list("jti", flat=True)
+            for jti in jtis:
+                self._filter.add(jti)
+
+            self._synced_till = synced_till
+            self._synced_at = time.monotonic()
+
+    def _on_tokens_revoked(self, keys: dict[str, list] | None) -> None:
+        if keys is None:
+            self._built_at = float("-inf")
+            return
+        bloom_filter = self._filter
+        if bloom_filter is None:
+            return
+        for jti in keys.get("jtis", []):
+            bloom_filter.add(jti)
+
+    def _get_filter(self) -> BloomFilter:
+        now = time.monotonic()
+        if self._filter is None or now - self._built_at >= self.REBUILD_INTERVAL:
+            self.rebuild()
+        elif now - self._synced_at >= self.SYNC_INTERVAL:
+            self._sync()
+        return self._filter
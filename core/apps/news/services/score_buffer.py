@@ -0,0 +1,163 @@
+import atexit
+import logging
+import threading
+import time
+from abc import (
+    ABC,
+    abstractmethod,
+)
+from collections import defaultdict
+from dataclasses import (
+    dataclass,
+    field,
+)
+from decimal import Decimal
+from typing import ClassVar
+
+from django.db import (
+    close_old_connections,
+    connection,
+    transaction,
+)
+
+from core.apps.news.models.score import ScoreEvent
+from core.apps.news.services.user import BaseClientService
+from core.project.settings import env
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(eq=False)
+class BaseScoreBufferService(ABC):
+    IS_BUFFERED: ClassVar[bool] = True
+
+    @abstractmethod
+    def add(self, client_email: str, delta: Decimal) -> None:
+        ...
+
+    @abstractmethod
+    def flush(self) -> int:
+        ...
+
+
+@dataclass(eq=False)
+class NoScoreBufferService(BaseScoreBufferService):
+    IS_BUFFERED: ClassVar[bool] = False
+
+    client_service: BaseClientService
+
+    def add(self, client_email: str, delta: Decimal) -> None:
+        self.client_service.increment_score(client_email=client_email, delta=delta)
+
+    def flush(self) -> int:
+        return 0
+
+
+@dataclass(eq=False)
+class BackgroundFlushScoreBufferService(BaseScoreBufferService):
+    FLUSH_INTERVAL_MS: ClassVar[int] = env.int("SCORE_BUFFER_FLUSH_INTERVAL_MS", default=500)
+    MAX_EVENTS: ClassVar[int] = env.int("SCORE_BUFFER_MAX_EVENTS", default=1000)
+    FLUSH_AT_EXIT: ClassVar[bool] = False
+
+    client_service: BaseClientService
+    _events: int = field(default=0, init=False, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+    _flush_lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+    _flusher: threading.Thread | None = field(default=None, init=False, repr=False)
+
+    def add(self, client_email: str, delta: Decimal) -> None:
+        self._add(client_email=client_email, delta=delta)
+        with self._lock:
+            self._events += 1
+            is_full = self._events >= self.MAX_EVENTS
+            self._start_flusher()
+        if is_full:
+            self.flush()
+
+    def flush(self) -> int:
+        with self._flush_lock:
+            with self._lock:
+                self._events = 0
+            try:
+                return self._flush()
+            except Exception:
+                logger.exception("Score Buffer Flush Error")
+                return 0
+
+    @abstractmethod
+    def _add(self, client_email: str, delta: Decimal) -> None:
+        ...
+
+    @abstractmethod
+    def _flush(self) -> int:
+        ...
+
+    def _start_flusher(self) -> None:
+        if self._flusher is not None:
+            return
+        self._flusher = threading.Thread(target=self._flush_periodically, name="score_buffer", daemon=True)
+        self._flusher.start()
+        if self.FLUSH_AT_EXIT:
+            atexit.register(self.flush)
+
+    def _flush_periodically(self) -> None:
+        while True:
+            time.sleep(self.FLUSH_INTERVAL_MS / 1000)
+            self.flush()
+            close_old_connections()
+
+
+@dataclass(eq=False)
+class MemoryScoreBufferService(BackgroundFlushScoreBufferService):
+    FLUSH_AT_EXIT: ClassVar[bool] = True
+
+    _deltas: defaultdict[str, Decimal] = field(
+        default_factory=lambda: defaultdict(Decimal),
+        init=False,
+        repr=False,
+    )
+
+    def _add(self, client_email: str, delta: Decimal) -> None:
+        with self._lock:
+            self._deltas[client_email.lower()] += delta
+
+    def _flush(self) -> int:
+        with self._lock:
+            deltas, self._deltas = self._deltas, defaultdict(Decimal)
+        if not deltas:
+            return 0
+
+        try:
+            return len(self.client_service.increment_scores(deltas=deltas))
+        except Exception:
+            with self._lock:
+                for client_email, delta in deltas.items():
+                    self._deltas[client_email] += delta
+            raise
+
+
+@dataclass(eq=False)
+class TableScoreBufferService(BackgroundFlushScoreBufferService):
+    BATCH_SIZE: ClassVar[int] = env.int("SCORE_BUFFER_TABLE_BATCH_SIZE", default=5000)
+
+    def _add(self, client_email: str, delta: Decimal) -> None:
+        ScoreEvent.objects.create(client_email=client_email, delta=delta)
+
+    def _flush(self) -> int:
+        table = connection.ops.quote_name(ScoreEvent._meta.db_table)
+        with transaction.atomic():
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    f"WITH batch AS ("
+                    f"DELETE FROM {table} WHERE id IN ("
+                    f"SELECT id FROM {table} ORDER BY id LIMIT %s FOR UPDATE SKIP LOCKED"
+                    f") RETURNING client_email, delta"
+                    f") SELECT lower(client_email), SUM(delta) FROM batch GROUP BY lower(client_email)",
+                    [self.BATCH_SIZE],
+                )
+                deltas = dict(cursor.fetchall())
+            if not deltas:
+                return 0
+
+            return len(self.client_service.increment_scores(deltas=deltas))
@@ -0,0 +1,159 @@
+import logging
+from abc import (
+    ABC,
+    abstractmethod,
+)
+from datetime import (
+    datetime,
+    timezone,
+)
+
+from core.apps.news.entities.session import Session as SessionEntity
+from core.apps.news.entities.token import TokenClaims
+from core.apps.news.exceptions.session import SessionNotFoundException
+from core.apps.news.models.session import Session as SessionModel
+
+
+logger = logging.getLogger(__name__)
+
+
+class BaseSessionService(ABC):
+    @abstractmethod
+    def create(self, claims: TokenClaims) -> None:
+        ...
+
+    @abstractmethod
+    async def acreate(self, claims: TokenClaims) -> None:
+        ...
+
+    @abstractmethod
+    def rotate(self, claims: TokenClaims, new_claims: TokenClaims) -> None:
+        ...
+
+    @abstractmethod
+    async def arotate(self, claims: TokenClaims, new_claims: TokenClaims) -> None:
+        ...
+
+    @abstractmethod
+    def reissue(self, claims: TokenClaims) -> None:
+        ...
+
+    @abstractmethod
+    def revoke(self, client_id: int, device_id: str) -> None:
+        ...
+
+    @abstractmethod
+    async def arevoke(self, client_id: int, device_id: str) -> None:
+        ...
+
+    @abstractmethod
+    def revoke_all(self, client_id: int) -> int:
+        ...
+
+    @abstractmethod
+    def get_active(self, client_id: int) -> list[SessionEntity]:
+        ...
+
+    @abstractmethod
+    def prune(self) -> int:
+        ...
+
+
+class ORMSessionService(BaseSessionService):
+    def create(self, claims: TokenClaims) -> None:
+        SessionModel.objects.create(
+            user_id=claims.client_id,
+            device_id=claims.device_id,
+            refresh_jti=claims.jti,
+            expires_at=datetime.fromtimestamp(claims.expires_at, tz=timezone.utc),
+        )
+
+    async def acreate(self, claims: TokenClaims) -> None:
+        await SessionModel.objects.acreate(
+            user_id=claims.client_id,
+            device_id=claims.device_id,
+            refresh_jti=claims.jti,
+            expires_at=datetime.fromtimestamp(claims.expires_at, tz=timezone.utc),
+        )
+
+    def rotate(self, claims: TokenClaims, new_claims: TokenClaims) -> None:
+        is_rotated = SessionModel.objects.filter(
+            user_id=claims.client_id,
+            device_id=claims.device_id,
+            refresh_jti=claims.jti,
+            revoked_at__isnull=True,
+        ).update(
+            refresh_jti=new_claims.jti,
+            expires_at=datetime.fromtimestamp(new_claims.expires_at, tz=timezone.utc),
+            updated_at=datetime.now(tz=timezone.utc),
+        )
+        if not is_rotated:
+            logger.warning(f"Session Rotation Error ({claims.client_id=}, {claims.device_id=})")
+            self.revoke(client_id=claims.client_id, device_id=claims.device_id)
+            raise SessionNotFoundException(client_id=claims.client_id, device_id=claims.device_id)
+
+    async def arotate(self, claims: TokenClaims, new_claims: TokenClaims) -> None:
+        is_rotated = await SessionModel.objects.filter(
+            user_id=claims.client_id,
+            device_id=claims.device_id,
+            refresh_jti=claims.jti,
+            revoked_at__isnull=True,
+        ).aupdate(
+            refresh_jti=new_claims.jti,
+            expires_at=datetime.fromtimestamp(new_claims.expires_at, tz=timezone.utc),
+            updated_at=datetime.now(tz=timezone.utc),
+        )
+        if not is_rotated:
+            logger.warning(f"Session Rotation Error ({claims.client_id=}, {claims.device_id=})")
+            await self.arevoke(client_id=claims.client_id, device_id=claims.device_id)
+            raise SessionNotFoundException(client_id=claims.client_id, device_id=claims.device_id)
+
+    def reissue(self, claims: TokenClaims) -> None:
+        is_reissued = SessionModel.objects.filter(
+            user_id=claims.client_id,
+            device_id=claims.device_id,
+            revoked_at__isnull=True,
+        ).update(
+            refresh_jti=claims.jti,
+            expires_at=datetime.fromtimestamp(claims.expires_at, tz=timezone.utc),
+            updated_at=datetime.now(tz=timezone.utc),
+        )
+        if not is_reissued:
+            logger.warning(f"Session Reissue Error ({claims.client_id=}, {claims.device_id=})")
+            raise SessionNotFoundException(client_id=claims.client_id, device_id=claims.device_id)
+
+    def revoke(self, client_id: int, device_id: str) -> None:
+        now = datetime.now(tz=timezone.utc)
+        SessionModel.objects.filter(
+            user_id=client_id,
+            device_id=device_id,
+            revoked_at__isnull=True,
+        ).update(revoked_at=now, updated_at=now)
+
+    async def arevoke(self, client_id: int, device_id: str) -> None:
+        now = datetime.now(tz=timezone.utc)
+        await SessionModel.objects.filter(
+            user_id=client_id,
+            device_id=device_id,
+            revoked_at__isnull=True,
+        ).aupdate(revoked_at=now, updated_at=now)
+
+    def revoke_all(self, client_id: int) -> int:
+        now = datetime.now(tz=timezone.utc)
+        return SessionModel.objects.filter(
+            user_id=client_id,
+            revoked_at__isnull=True,
+        ).update(revoked_at=now, updated_at=now)
+
+    def get_active(self, client_id: int) -> list[SessionEntity]:
+        sessions = SessionModel.objects.filter(
+            user_id=client_id,
+            revoked_at__isnull=True,
+            expires_at__gt=datetime.now(tz=timezone.utc),
+        ).order_by('-updated_at')
+
+        return [session.to_entity() for session in sessions]
+
+    def prune(self) -> int:
+        deleted, _ = SessionModel.objects.filter(expires_at__lte=datetime.now(tz=timezone.utc)).delete()
+        return deleted
@@ -0,0 +1,108 @@
+import logging
+import time
+from abc import (
+    ABC,
+    abstractmethod,
+)
+from dataclasses import (
+    dataclass,
+    field,
+)
+from typing import ClassVar
+
+from django.db import router
+from django.db.models import F
+
+from core.apps.common.bus import (
+    BaseInvalidationBus,
+    InvalidationTopic,
+)
+from core.apps.common.cache import LRUCache
+from core.apps.news.exceptions.user import (
+    ClientNotFoundException,
+    ClientUpdateException,
+)
+from core.apps.news.models.user import User as ClientModel
+from core.project.settings import env
+
+
+logger = logging.getLogger(__name__)
+
+
+class BaseTokenVersionService(ABC):
+    @abstractmethod
+    def get_version(self, client_id: int) -> int:
+        ...
+
+    @abstractmethod
+    async def aget_version(self, client_id: int) -> int:
+        ...
+
+    @abstractmethod
+    def increment(self, client_id: int) -> None:
+        ...
+
+    @abstractmethod
+    def invalidate(self, client_id: int) -> None:
+        ...
+
+
+@dataclass(eq=False)
+class ORMTokenVersionService(BaseTokenVersionService):
+    CACHE_SIZE: ClassVar[int] = env.int("TOKEN_VERSION_CACHE_SIZE", default=100_000)
+    CACHE_TTL: ClassVar[int] = env.int("TOKEN_VERSION_CACHE_TTL", default=60)
+
+    invalidation_bus: BaseInvalidationBus
+    versions: LRUCache = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self.versions = LRUCache(maxsize=self.CACHE_SIZE)
+        self.invalidation_bus.subscribe(InvalidationTopic.CLIENT, self._on_client_invalidated)
+
+    def get_version(self, client_id: int) -> int:
+        version: int | None = self.versions.get(client_id)
+        if version is None:
+            try:
+                version = ClientModel.objects.using(router.db_for_write(ClientModel)).values_list(
+                    "token_version",
+                    flat=True,
+                ).get(id=client_id)
+            except ClientModel.DoesNotExist:
+                logger.info(f"Client Does Not Exist Error ({client_id=})")
+                raise ClientNotFoundException(id=client_id)
+            self.versions.set(client_id, version, expires_at=time.time() + self.CACHE_TTL)
+
+        return version
+
+    async def aget_version(self, client_id: int) -> int:
+        version: int | None = self.versions.get(client_id)
+        if version is None:
+            try:
+                version = await ClientModel.objects.using(router.db_for_write(ClientModel)).values_list(
+                    "token_version",
+                    flat=True,
+                ).aget(id=client_id)
+            except ClientModel.DoesNotExist:
+                logger.info(f"Client Does Not Exist Error ({client_id=})")
+                raise ClientNotFoundException(id=client_id)
+            self.versions.set(client_id, version, expires_at=time.time() + self.CACHE_TTL)
+
+        return version
+
+    def increment(self, client_id: int) -> None:
+        is_updated = ClientModel.objects.filter(id=client_id).update(token_version=F("token_version") + 1)
+        self.invalidate(client_id=client_id)
+        self.invalidation_bus.publish(InvalidationTopic.CLIENT, ids=[client_id])
+        if not is_updated:
+            logger.error(f"Client Update Token Version Error ({client_id=})")
+            raise ClientUpdateException(id=client_id)
+
+    def invalidate(self, client_id: int) -> None:
+        self.versions.delete(client_id)
+
+    def _on_client_invalidated(self, keys: dict[str, list] | None) -> None:
+        if keys is None:
+            self.versions.clear()
+            return
+        for client_id in keys.get("ids", []):
+            self.invalidate(client_id=client_id)
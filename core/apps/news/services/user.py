@@ -1,15 +1,33 @@
+from django.db import (
+    close_old_connections,
+    connection,
+    models,
+    transaction,
+)
 from django.db.utils import IntegrityError
 from decimal import Decimal
+import csv
+import io
 import logging
 from abc import (
     ABC,
     abstractmethod,
 )
+from collections import defaultdict
 from dataclasses import dataclass
-from typing import Any
+from typing import (
+    Any,
+    ClassVar,
+)
 
-from core.apps.news.entities.token import Token
-from core.apps.news.entities.user import User as ClientEntity
+from core.apps.news.entities.token import (
+    Token,
+    TokenClaims,
+)
+from core.apps.news.entities.user import (
+    ClientProjection,
+    User as ClientEntity,
+)
 from core.apps.news.exceptions.auth import InvalidAuthDataException
 from core.apps.news.exceptions.user import (
     ClientAlreadyExistsException,
@@ -18,8 +36,18 @@ from core.apps.news.exceptions.user import (
     ClientUpdateException,
 )
 from core.apps.news.models.user import User as ClientModel
+from core.apps.news.services.token_version import BaseTokenVersionService
 from core.apps.common.auth.password import BasePasswordService
 from core.apps.common.auth.token import BaseTokenService
+from core.apps.common.bus import (
+    BaseInvalidationBus,
+    InvalidationTopic,
+)
+from core.apps.common.exceptions import ExecutorSaturatedException
+from core.apps.common.executor import (
+    BoundedPriorityExecutor,
+    TaskPriority,
+)
 from core.apps.common.factory import get_new_uuid
 from core.apps.common.models import (
     UserRole,
@@ -34,6 +62,9 @@ logger = logging.getLogger(__name__)
 class BaseClientService(ABC):
     password_service: BasePasswordService
     token_service: BaseTokenService
+    token_version_service: BaseTokenVersionService
+    password_hashing_executor: BoundedPriorityExecutor
+    invalidation_bus: BaseInvalidationBus
 
     @abstractmethod
     def create(
@@ -48,51 +79,87 @@ class BaseClientService(ABC):
         ...
 
     @abstractmethod
-    def update_email(self, client_id: int, email: str) -> None:
+    def bulk_create(self, clients: list[ClientEntity]) -> set[str]:
+        ...
+
+    @abstractmethod
+    def update_email(self, client_email: str, email: str) -> ClientEntity:
+        ...
+
+    @abstractmethod
+    def update_password(self, client_email: str, hashed_password: str) -> ClientEntity:
+        ...
+
+    @abstractmethod
+    def upgrade_password_hash(self, client_id: int, old_hashed_password: str, hashed_password: str) -> bool:
         ...
 
     @abstractmethod
-    def update_password(self, client_id: int, hashed_password: str) -> None:
+    def schedule_password_rehash(self, client: ClientEntity, plain_password: str) -> None:
         ...
 
     @abstractmethod
     def update_credentials(
         self,
-        client_id: int,
+        client_email: str,
         first_name: str,
         last_name: str,
         middle_name: str,
-    ) -> None:
+    ) -> ClientEntity:
         ...
 
     @abstractmethod
     def update_role(
             self,
-            client_id: int,
+            client_email: str,
             role: str,
-    ) -> None:
+    ) -> ClientEntity:
         ...
 
     @abstractmethod
     def update_score(
             self,
-            client_id: int,
+            client_email: str,
             score: Decimal,
-    ) -> None:
+    ) -> ClientEntity:
         ...
 
     @abstractmethod
-    def get_by_email(self, client_email: str) -> ClientEntity:
+    def increment_score(self, client_email: str, delta: Decimal) -> ClientEntity:
         ...
 
     @abstractmethod
-    def get_by_id(self, client_id: int) -> ClientEntity:
+    def increment_scores(self, deltas: dict[str, Decimal]) -> list[int]:
+        ...
+
+    @abstractmethod
+    def get_by_email(self, client_email: str, projection: ClientProjection = ClientProjection.FULL) -> ClientEntity:
+        ...
+
+    @abstractmethod
+    def get_by_id(self, client_id: int, projection: ClientProjection = ClientProjection.FULL) -> ClientEntity:
         ...
 
     @abstractmethod
     def check_client_exists(self, client_email: str) -> bool:
         ...
 
+    @abstractmethod
+    async def aget_by_email(
+            self,
+            client_email: str,
+            projection: ClientProjection = ClientProjection.FULL,
+    ) -> ClientEntity:
+        ...
+
+    @abstractmethod
+    async def aget_by_id(self, client_id: int, projection: ClientProjection = ClientProjection.FULL) -> ClientEntity:
+        ...
+
+    @abstractmethod
+    async def acheck_client_exists(self, client_email: str) -> bool:
+        ...
+
     @abstractmethod
     def validate_password(self, client_password: str, plain_password: str) -> None:
         ...
@@ -102,7 +169,7 @@ class BaseClientService(ABC):
         ...
 
     @abstractmethod
-    def generate_tokens(self, client: ClientEntity) -> Token:
+    def generate_tokens(self, client: ClientEntity, device_id: str | None = None) -> Token:
         ...
 
     @abstractmethod
@@ -113,6 +180,10 @@ class BaseClientService(ABC):
     def get_raw_jwt(self, token: str) -> dict[str, Any]:
         ...
 
+    @abstractmethod
+    def get_claims_from_token(self, token: str) -> TokenClaims:
+        ...
+
     @abstractmethod
     def get_client_email_from_token(self, token: str) -> str:
         ...
@@ -139,6 +210,11 @@ class BaseClientService(ABC):
 
 
 class ORMClientService(BaseClientService):
+    SCORE_FIELD: ClassVar[models.DecimalField] = ClientModel._meta.get_field("score")
+    MAX_SCORE: ClassVar[Decimal] = (
+        Decimal(10) ** (SCORE_FIELD.max_digits - SCORE_FIELD.decimal_places) - Decimal(10) ** -SCORE_FIELD.decimal_places
+    )
+
     def create(
         self,
         first_name: str,
@@ -148,89 +224,273 @@ class ORMClientService(BaseClientService):
         role: str,
         hashed_password: str,
     ) -> ClientEntity:
-        try:
-            client: ClientModel = ClientModel.objects.create(
+        client = self._insert_returning(
+            client=ClientModel(
                 first_name=first_name,
                 last_name=last_name,
                 middle_name=middle_name,
                 email=email,
                 role=role,
                 password=hashed_password,
+            ),
+        )
+        if client is None:
+            logger.warning(f"Client Creation Error ({email=})")
+            raise ClientAlreadyExistsException(email=email)
+
+        return client
+
+    def bulk_create(self, clients: list[ClientEntity]) -> set[str]:
+        if not clients:
+            return set()
+
+        fields = [field for field in ClientModel._meta.concrete_fields if not field.primary_key]
+        columns = ", ".join(connection.ops.quote_name(field.column) for field in fields)
+        email_column = connection.ops.quote_name(ClientModel._meta.get_field("email").column)
+
+        rows = io.StringIO()
+        writer = csv.writer(rows, quoting=csv.QUOTE_ALL)
+        for client in clients:
+            instance = ClientModel(
+                first_name=client.first_name,
+                last_name=client.last_name,
+                middle_name=client.middle_name,
+                email=client.email,
+                role=client.role,
+                password=client.password,
+            )
+            writer.writerow(
+                field.get_db_prep_save(field.pre_save(instance, add=True), connection=connection) for field in fields
+            )
+        rows.seek(0)
+
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute(
+                f"CREATE TEMPORARY TABLE client_import ON COMMIT DROP AS "
+                f"SELECT {columns} FROM {connection.ops.quote_name(ClientModel._meta.db_table)} WITH NO DATA"
+            )
+            copy_sql = f"COPY client_import ({columns}) FROM STDIN WITH (FORMAT csv)"
+            if hasattr(cursor, "copy"):
+                with cursor.copy(copy_sql) as copy:
+                    copy.write(rows.getvalue())
+            else:
+                cursor.copy_expert(copy_sql, rows)
+            cursor.execute(
+                f"INSERT INTO {connection.ops.quote_name(ClientModel._meta.db_table)} ({columns}) "
+                f"SELECT {columns} FROM client_import "
+                f"ON CONFLICT (lower({email_column})) DO NOTHING "
+                f"RETURNING lower({email_column})"
+            )
+            inserted_emails = {row[0] for row in cursor.fetchall()}
+            cursor.execute("DROP TABLE client_import")
+
+        return inserted_emails
+
+    def update_email(self, client_email: str, email: str) -> ClientEntity:
+        try:
+            client = self._update_returning(
+                assignments="email = %s, token_version = token_version + 1",
+                where="lower(email) = lower(%s)",
+                params=[email, client_email],
             )
         except IntegrityError:
-            logger.warning(f"Client Creation Error ({email=})")
+            logger.warning(f"Client Update Email Error ({client_email=}, {email=})")
             raise ClientAlreadyExistsException(email=email)
 
-        return client.to_entity()
+        if client is None:
+            logger.error(f"Client Update Email Error ({client_email=}, {email=})")
+            raise ClientUpdateException(email=client_email)
+        self.token_version_service.invalidate(client_id=client.id)
+        self._publish_client_change(client_ids=[client.id], client_emails=[client_email, email])
 
-    def update_email(self, client_id: int, email: str) -> None:
-        is_updated = ClientModel.objects.filter(id=client_id).update(email=email)
-        if not is_updated:
-            logger.error(f"Client Update Email Error ({client_id=}, {email=})")
-            raise ClientUpdateException(id=client_id, email=email)
+        return client
 
-    def update_password(self, client_id: int, hashed_password: str) -> None:
-        is_updated = ClientModel.objects.filter(id=client_id).update(password=hashed_password)
+    def update_password(self, client_email: str, hashed_password: str) -> ClientEntity:
+        client = self._update_returning(
+            assignments="password = %s, token_version = token_version + 1",
+            where="lower(email) = lower(%s)",
+            params=[hashed_password, client_email],
+        )
+        if client is None:
+            logger.error(f"Client Update Password Error ({client_email=})")
+            raise ClientUpdateException(email=client_email)
+        self.token_version_service.invalidate(client_id=client.id)
+        self._publish_client_change(client_ids=[client.id], client_emails=[client_email])
+
+        return client
+
+    def upgrade_password_hash(self, client_id: int, old_hashed_password: str, hashed_password: str) -> bool:
+        is_updated = ClientModel.objects.filter(id=client_id, password=old_hashed_password).update(
+            password=hashed_password,
+        )
         if not is_updated:
-            logger.error(f"Client Update Password Error ({client_id=})")
-            raise ClientUpdateException(id=client_id, password=hashed_password)
+            logger.info(f"Client Upgrade Password Hash Skipped ({client_id=})")
+        return bool(is_updated)
+
+    def schedule_password_rehash(self, client: ClientEntity, plain_password: str) -> None:
+        try:
+            self.password_hashing_executor.submit(
+                self._rehash_password,
+                client=client,
+                plain_password=plain_password,
+                priority=TaskPriority.LOW,
+            )
+        except ExecutorSaturatedException:
+            logger.info(f"Client Password Rehash Postponed ({client.id=})")
+
+    def _rehash_password(self, client: ClientEntity, plain_password: str) -> None:
+        try:
+            hashed_password = self.password_service.hash_password(plain_password=plain_password)
+            self.upgrade_password_hash(
+                client_id=client.id,
+                old_hashed_password=client.password,
+                hashed_password=hashed_password,
+            )
+        except Exception:
+            logger.exception(f"Client Password Rehash Error ({client.id=})")
+        finally:
+            close_old_connections()
 
     def update_credentials(
         self,
-        client_id: int,
+        client_email: str,
         first_name: str,
         last_name: str,
         middle_name: str,
-    ) -> None:
-        is_updated = ClientModel.objects.filter(id=client_id).update(
-            first_name=first_name,
-            last_name=last_name,
-            middle_name=middle_name,
+    ) -> ClientEntity:
+        client = self._update_returning(
+            assignments="first_name = %s, last_name = %s, middle_name = %s",
+            where="lower(email) = lower(%s)",
+            params=[first_name, last_name, middle_name, client_email],
         )
-        if not is_updated:
-            logger.error(f"Client Update Credentials Error ({client_id=})")
-            raise ClientUpdateException(id=client_id)
+        if client is None:
+            logger.error(f"Client Update Credentials Error ({client_email=})")
+            raise ClientUpdateException(email=client_email)
+        self._publish_client_change(client_ids=[client.id], client_emails=[client_email])
+
+        return client
 
     def update_role(
             self,
-            client_id: int,
+            client_email: str,
             role: str,
-    ) -> None:
-        is_updated = ClientModel.objects.filter(id=client_id).update(role=role)
-        if not is_updated:
-            logger.error(f"Client Update Role Error ({client_id=})")
-            raise ClientUpdateException(id=client_id)
+    ) -> ClientEntity:
+        client = self._update_returning(
+            assignments="role = %s, token_version = token_version + 1",
+            where="lower(email) = lower(%s)",
+            params=[role, client_email],
+        )
+        if client is None:
+            logger.error(f"Client Update Role Error ({client_email=})")
+            raise ClientUpdateException(email=client_email)
+        self.token_version_service.invalidate(client_id=client.id)
+        self._publish_client_change(client_ids=[client.id], client_emails=[client_email])
+
+        return client
 
     def update_score(
             self,
-            client_id: int,
-            score: float,
-    ):
-        is_updated = ClientModel.objects.filter(id=client_id).update(score=score)
-        if not is_updated:
-            logger.error(f"Client Update Score Error ({client_id=})")
-            raise ClientUpdateException(id=client_id)
+            client_email: str,
+            score: Decimal,
+    ) -> ClientEntity:
+        client = self._update_returning(
+            assignments="score = LEAST(GREATEST(%s, %s), %s)",
+            where="lower(email) = lower(%s)",
+            params=[score, -self.MAX_SCORE, self.MAX_SCORE, client_email],
+        )
+        if client is None:
+            logger.error(f"Client Update Score Error ({client_email=})")
+            raise ClientUpdateException(email=client_email)
+        self._publish_client_change(client_ids=[client.id], client_emails=[client_email])
+
+        return client
+
+    def increment_score(self, client_email: str, delta: Decimal) -> ClientEntity:
+        client = self._update_returning(
+            assignments="score = LEAST(GREATEST(score + %s, %s), %s)",
+            where="lower(email) = lower(%s)",
+            params=[delta, -self.MAX_SCORE, self.MAX_SCORE, client_email],
+        )
+        if client is None:
+            logger.error(f"Client Update Score Error ({client_email=})")
+            raise ClientNotFoundException(email=client_email)
+        self._publish_client_change(client_ids=[client.id], client_emails=[client_email])
+
+        return client
+
+    def increment_scores(self, deltas: dict[str, Decimal]) -> list[int]:
+        if not deltas:
+            return []
+
+        email_deltas: defaultdict[str, Decimal] = defaultdict(Decimal)
+        for client_email, delta in deltas.items():
+            email_deltas[client_email.lower()] += delta
+
+        client_emails = sorted(email_deltas)
+        values = ", ".join(["(%s, %s::numeric)"] * len(client_emails))
+        params = [-self.MAX_SCORE, self.MAX_SCORE]
+        for client_email in client_emails:
+            params.extend([client_email, email_deltas[client_email]])
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"UPDATE {connection.ops.quote_name(ClientModel._meta.db_table)} AS client "
+                f"SET score = LEAST(GREATEST(client.score + score_delta.delta, %s), %s) "
+                f"FROM (VALUES {values}) AS score_delta (email, delta) "
+                f"WHERE lower(client.email) = score_delta.email "
+                f"RETURNING client.id",
+                params,
+            )
+            client_ids = [row[0] for row in cursor.fetchall()]
 
-    def get_by_email(self, client_email: str) -> ClientEntity:
+        self._publish_client_change(client_ids=client_ids, client_emails=client_emails)
+        return client_ids
+
+    def get_by_email(self, client_email: str, projection: ClientProjection = ClientProjection.FULL) -> ClientEntity:
         try:
-            client: ClientModel = ClientModel.objects.get(email=client_email)
+            row = ClientModel.objects.values_list(*projection.value).get(email__lower=client_email.lower())
         except ClientModel.DoesNotExist:
             logger.info(f"Client Does Not Exist Error ({client_email=})")
             raise ClientNotFoundException(email=client_email)
 
-        return client.to_entity()
+        return projection.to_entity(row=row)
 
-    def get_by_id(self, client_id: int) -> ClientEntity:
+    def get_by_id(self, client_id: int, projection: ClientProjection = ClientProjection.FULL) -> ClientEntity:
         try:
-            client: ClientModel = ClientModel.objects.get(id=client_id)
+            row = ClientModel.objects.values_list(*projection.value).get(id=client_id)
         except ClientModel.DoesNotExist:
             logger.error(f"Client Does Not Exist Error ({client_id=})")
             raise ClientNotFoundException(id=client_id)
 
-        return client.to_entity()
+        return projection.to_entity(row=row)
 
     def check_client_exists(self, client_email: str) -> bool:
-        return ClientModel.objects.filter(email=client_email).exists()
+        return ClientModel.objects.filter(email__lower=client_email.lower()).exists()
+
+    async def aget_by_email(
+            self,
+            client_email: str,
+            projection: ClientProjection = ClientProjection.FULL,
+    ) -> ClientEntity:
+        try:
+            row = await ClientModel.objects.values_list(*projection.value).aget(email__lower=client_email.lower())
+        except ClientModel.DoesNotExist:
+            logger.info(f"Client Does Not Exist Error ({client_email=})")
+            raise ClientNotFoundException(email=client_email)
+
+        return projection.to_entity(row=row)
+
+    async def aget_by_id(self, client_id: int, projection: ClientProjection = ClientProjection.FULL) -> ClientEntity:
+        try:
+            row = await ClientModel.objects.values_list(*projection.value).aget(id=client_id)
+        except ClientModel.DoesNotExist:
+            logger.error(f"Client Does Not Exist Error ({client_id=})")
+            raise ClientNotFoundException(id=client_id)
+
+        return projection.to_entity(row=row)
+
+    async def acheck_client_exists(self, client_email: str) -> bool:
+        return await ClientModel.objects.filter(email__lower=client_email.lower()).aexists()
 
     def validate_password(self, client_password: str, plain_password: str) -> None:
         if not self.password_service.verify_password(plain_password=plain_password, hashed_password=client_password):
@@ -242,8 +502,8 @@ class ORMClientService(BaseClientService):
             logger.warning(f"Client Role Not Matching Error ({client_role=}, {required_role=})")
             raise ClientRoleNotMatchingWithRequiredException(client_roles=client_role, required_role=required_role)
 
-    def generate_tokens(self, client: ClientEntity) -> Token:
-        device_id = get_new_uuid()
+    def generate_tokens(self, client: ClientEntity, device_id: str | None = None) -> Token:
+        device_id = device_id or get_new_uuid()
         access_token = self.token_service.create_access_token(user=client, payload={"device_id": device_id})
         refresh_token = self.token_service.create_refresh_token(user=client, payload={"device_id": device_id})
 
@@ -257,6 +517,9 @@ class ORMClientService(BaseClientService):
     def get_raw_jwt(self, token: str) -> dict[str, Any]:
         return self.token_service.get_raw_jwt(token=token)
 
+    def get_claims_from_token(self, token: str) -> TokenClaims:
+        return self.token_service.get_claims_from_token(token=token)
+
     def get_client_email_from_token(self, token: str) -> str:
         return self.token_service.get_client_email_from_token(token=token)
 
@@ -274,3 +537,45 @@ class ORMClientService(BaseClientService):
 
     def get_expiration_time_from_token(self, token: str) -> int:
         return self.token_service.get_expiration_time_from_token(token=token)
+
+    def _publish_client_change(self, client_ids: list[int], client_emails: list[str]) -> None:
+        self.invalidation_bus.publish(InvalidationTopic.CLIENT, ids=client_ids, emails=client_emails)
+
+    def _insert_returning(self, client: ClientModel) -> ClientEntity | None:
+        fields = [field for field in ClientModel._meta.concrete_fields if not field.primary_key]
+        columns = ", ".join(connection.ops.quote_name(field.column) for field in fields)
+        placeholders = ", ".join(["%s"] * len(fields))
+        params = [field.get_db_prep_save(field.pre_save(client, add=True), connection=connection) for field in fields]
+        email_column = connection.ops.quote_name(ClientModel._meta.get_field("email").column)
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"INSERT INTO {connection.ops.quote_name(ClientModel._meta.db_table)} ({columns}) "
+                f"VALUES ({placeholders}) "
+                f"ON CONFLICT (lower({email_column})) DO NOTHING "
+                f"RETURNING {self._returning_columns()}",
+                params,
+            )
+            row = cursor.fetchone()
+
+        if row is None:
+            return None
+        return ClientProjection.FULL.to_entity(row=row)
+
+    def _update_returning(self, assignments: str, where: str, params: list[Any]) -> ClientEntity | None:
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"UPDATE {connection.ops.quote_name(ClientModel._meta.db_table)} SET {assignments} "
+                f"WHERE {where} RETURNING {self._returning_columns()}",
+                params,
+            )
+            row = cursor.fetchone()
+
+        if row is None:
+            return None
+        return ClientProjection.FULL.to_entity(row=row)
+
+    @staticmethod
+    def _returning_columns() -> str:
+        return ", ".join(
+            connection.ops.quote_name(ClientModel._meta.get_field(name).column) for name in ClientProjection.FULL.value
+        )
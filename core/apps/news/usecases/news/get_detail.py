@@ -0,0 +1,14 @@
+from dataclasses import dataclass
+
+from core.apps.news.entities.news import News as NewsEntity
+from core.apps.news.services.news import BaseNewsService
+
+
+@dataclass
+class GetNewsDetailUseCase:
+    news_service: BaseNewsService
+
+    def execute(self, news_id: int) -> NewsEntity:
+        news = self.news_service.get_by_id(news_id=news_id)
+
+        return news
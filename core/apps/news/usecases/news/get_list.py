@@ -0,0 +1,27 @@
+from dataclasses import dataclass
+
+from core.apps.news.entities.news import News as NewsEntity
+from core.apps.news.services.news import BaseNewsService
+
+
+@dataclass
+class GetNewsListUseCase:
+    news_service: BaseNewsService
+
+    def execute(
+        self,
+        cursor: str | None,
+        limit: int,
+        faculty_id: int | None = None,
+        tag_id: int | None = None,
+        search: str | None = None,
+    ) -> tuple[list[NewsEntity], str | None]:
+        news, next_cursor = self.news_service.get_list(
+            cursor=cursor,
+            limit=limit,
+            faculty_id=faculty_id,
+            tag_id=tag_id,
+            search=search,
+        )
+
+        return news, next_cursor
@@ -26,8 +26,8 @@ class CreateClientUseCase:
         verify_password: str,
     ) -> ClientEntity:
 
-        self.email_validator_service.validate(email=email)
         self.password_validator_service.validate(password=password, verify_password=verify_password)
+        self.email_validator_service.validate(email=email)
 
         hashed_password = self.password_service.hash_password(plain_password=password)
         client = self.client_service.create(
@@ -1,6 +1,10 @@
 from dataclasses import dataclass
 
-from core.apps.news.entities.user import User as ClientEntity
+from core.apps.news.entities.user import (
+    ClientProjection,
+    User as ClientEntity,
+)
+from core.apps.news.services.async_user import BaseAsyncClientService
 from core.apps.news.services.user import BaseClientService
 
 
@@ -9,6 +13,16 @@ class GetClientInfoUseCase:
     client_service: BaseClientService
 
     def execute(self, email: str) -> ClientEntity:
-        client = self.client_service.get_by_email(client_email=email)
+        client = self.client_service.get_by_email(client_email=email, projection=ClientProjection.PRIVATE)
+
+        return client
+
+
+@dataclass
+class AsyncGetClientInfoUseCase:
+    client_service: BaseAsyncClientService
+
+    async def execute(self, email: str) -> ClientEntity:
+        client = await self.client_service.get_by_email(client_email=email, projection=ClientProjection.PRIVATE)
 
         return client
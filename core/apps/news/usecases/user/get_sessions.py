@@ -0,0 +1,14 @@
+from dataclasses import dataclass
+
+from core.apps.news.entities.session import Session as SessionEntity
+from core.apps.news.services.session import BaseSessionService
+
+
+@dataclass
+class GetClientSessionsUseCase:
+    session_service: BaseSessionService
+
+    def execute(self, client_id: int) -> list[SessionEntity]:
+        sessions = self.session_service.get_active(client_id=client_id)
+
+        return sessions
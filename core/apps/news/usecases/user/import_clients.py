@@ -0,0 +1,205 @@
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from itertools import islice
+from typing import (
+    Any,
+    ClassVar,
+    Iterable,
+    Iterator,
+)
+
+from django.db import DatabaseError
+
+from core.apps.news.entities.user import (
+    ClientImportError,
+    ClientImportReport,
+    User as ClientEntity,
+)
+from core.apps.news.exceptions.user import ClientAlreadyExistsException
+from core.apps.news.services.user import BaseClientService
+from core.apps.common.auth.password import (
+    PasswordServiceRegistry,
+    get_bcrypt_rounds,
+    pin_bcrypt_rounds,
+)
+from core.apps.common.auth.validators.email import EmailPatternValidatorService
+from core.apps.common.auth.validators.password import BasePasswordValidatorService
+from core.apps.common.exceptions import ServiceException
+from core.apps.common.models import UserRole
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ImportClientsUseCase:
+    REQUIRED_FIELDS: ClassVar[tuple[str, ...]] = ("first_name", "last_name", "middle_name", "email", "password")
+
+    client_service: BaseClientService
+    password_service: PasswordServiceRegistry
+
+    password_validator_service: BasePasswordValidatorService
+    email_validator_service: EmailPatternValidatorService
+
+    def execute(
+        self,
+        rows: Iterable[tuple[int, dict[str, Any] | None]],
+        chunk_size: int,
+        workers: int,
+        default_role: UserRole = UserRole.CREATOR,
+        bcrypt_rounds: int | None = None,
+    ) -> ClientImportReport:
+        report = ClientImportReport()
+        seen_emails: set[str] = set()
+        pending: tuple[list[tuple[int, ClientEntity]], Iterator[str]] | None = None
+
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=pin_bcrypt_rounds,
+            initargs=(bcrypt_rounds or get_bcrypt_rounds(),),
+        ) as executor:
+            rows = iter(rows)
+            while chunk := list(islice(rows, chunk_size)):
+                clients = self._validate(
+                    chunk=chunk,
+                    seen_emails=seen_emails,
+                    default_role=default_role,
+                    report=report,
+                )
+                hashed_passwords = self._hash(executor=executor, clients=clients, workers=workers, report=report)
+                if pending is not None:
+                    self._load(*pending, report=report)
+                pending = (clients, hashed_passwords) if hashed_passwords is not None else None
+
+            if pending is not None:
+                self._load(*pending, report=report)
+
+        report.errors.sort(key=lambda error: error.line)
+        return report
+
+    def _validate(
+        self,
+        chunk: list[tuple[int, dict[str, Any] | None]],
+        seen_emails: set[str],
+        default_role: UserRole,
+        report: ClientImportReport,
+    ) -> list[tuple[int, ClientEntity]]:
+        clients = []
+        for line, row in chunk:
+            if row is None:
+                report.errors.append(ClientImportError(line=line, email=None, message="Row could not be parsed"))
+                continue
+
+            email = str(row.get("email") or "").strip()
+            missing_fields = [name for name in self.REQUIRED_FIELDS if not str(row.get(name) or "").strip()]
+            if missing_fields:
+                report.errors.append(
+                    ClientImportError(
+                        line=line,
+                        email=email or None,
+                        message=f"Missing fields: {', '.join(missing_fields)}",
+                    ),
+                )
+                continue
+
+            try:
+                role = UserRole(row.get("role") or default_role)
+            except ValueError:
+                report.errors.append(ClientImportError(line=line, email=email, message=f"Unknown role: {row['role']}"))
+                continue
+
+            try:
+                self.email_validator_service.validate(email=email)
+                self.password_validator_service.validate(password=str(row["password"]))
+            except ServiceException as exception:
+                report.errors.append(ClientImportError(line=line, email=email, message=exception.message))
+                continue
+
+            if email.lower() in seen_emails:
+                report.errors.append(
+                    ClientImportError(line=line, email=email, message="Email is duplicated earlier in the file"),
+                )
+                continue
+            seen_emails.add(email.lower())
+
+            clients.append((
+                line,
+                ClientEntity(
+                    first_name=str(row["first_name"]).strip(),
+                    last_name=str(row["last_name"]).strip(),
+                    middle_name=str(row["middle_name"]).strip(),
+                    email=email,
+                    role=role,
+                    password=str(row["password"]),
+                ),
+            ))
+
+        return clients
+
+    def _hash(
+        self,
+        executor: ProcessPoolExecutor,
+        clients: list[tuple[int, ClientEntity]],
+        workers: int,
+        report: ClientImportReport,
+    ) -> Iterator[str] | None:
+        try:
+            return executor.map(
+                self.password_service.hash_password,
+                [client.password for _, client in clients],
+                chunksize=max(len(clients) // (workers * 4), 1),
+            )
+        except Exception as exception:
+            logger.exception(f"Client Import Hashing Error ({len(clients)=})")
+            self._report_chunk_failure(clients=clients, exception=exception, report=report)
+            return None
+
+    def _load(
+        self,
+        clients: list[tuple[int, ClientEntity]],
+        hashed_passwords: Iterator[str],
+        report: ClientImportReport,
+    ) -> None:
+        if not clients:
+            return
+
+        try:
+            for (_, client), hashed_password in zip(clients, hashed_passwords):
+                client.password = hashed_password
+        except Exception as exception:
+            logger.exception(f"Client Import Hashing Error ({len(clients)=})")
+            self._report_chunk_failure(clients=clients, exception=exception, report=report)
+            return
+
+        try:
+            inserted_emails = self.client_service.bulk_create(clients=[client for _, client in clients])
+        except DatabaseError as exception:
+            logger.exception(f"Client Import Chunk Error ({len(clients)=})")
+            self._report_chunk_failure(clients=clients, exception=exception, report=report)
+            return
+
+        for line, client in clients:
+            if client.email.lower() in inserted_emails:
+                report.imported += 1
+            else:
+                report.errors.append(
+                    ClientImportError(
+                        line=line,
+                        email=client.email,
+                        message=ClientAlreadyExistsException(email=client.email).message,
+                    ),
+                )
+        logger.info(f"Client Import Chunk Loaded ({report.imported=}, {len(report.errors)=})")
+
+    def _report_chunk_failure(
+        self,
+        clients: list[tuple[int, ClientEntity]],
+        exception: Exception,
+        report: ClientImportReport,
+    ) -> None:
+        message = str(exception).strip() or type(exception).__name__
+        for line, client in clients:
+            report.errors.append(ClientImportError(line=line, email=client.email, message=message))
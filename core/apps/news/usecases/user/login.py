@@ -1,18 +1,63 @@
 from dataclasses import dataclass
 
+from asgiref.sync import sync_to_async
+
 from core.apps.news.entities.token import Token as TokenEntity
-from core.apps.news.entities.user import User as ClientEntity
+from core.apps.news.entities.user import (
+    ClientProjection,
+    User as ClientEntity,
+)
+from core.apps.news.services.async_user import BaseAsyncClientService
+from core.apps.news.services.login_throttle import BaseLoginThrottleService
+from core.apps.news.services.session import BaseSessionService
 from core.apps.news.services.user import BaseClientService
+from core.apps.common.auth.password import BasePasswordService
 
 
 @dataclass
 class LoginClientUseCase:
     client_service: BaseClientService
+    session_service: BaseSessionService
+    password_service: BasePasswordService
+    login_throttle_service: BaseLoginThrottleService
 
-    def execute(self, email: str, password: str) -> tuple[ClientEntity, TokenEntity]:
-        client = self.client_service.get_by_email(client_email=email)
+    def execute(self, email: str, password: str, ip_address: str | None = None) -> tuple[ClientEntity, TokenEntity]:
+        self.login_throttle_service.acquire(email=email, ip_address=ip_address)
+        client = self.client_service.get_by_email(client_email=email, projection=ClientProjection.AUTH)
         self.client_service.validate_password(client_password=client.password, plain_password=password)
+        self.login_throttle_service.release(email=email, ip_address=ip_address)
+
+        if self.password_service.needs_rehash(hashed_password=client.password):
+            self.client_service.schedule_password_rehash(client=client, plain_password=password)
+
+        tokens: TokenEntity = self.client_service.generate_tokens(client=client)
+        self.session_service.create(claims=self.client_service.get_claims_from_token(token=tokens.refresh_token))
+
+        return client, tokens
+
+
+@dataclass
+class AsyncLoginClientUseCase:
+    client_service: BaseAsyncClientService
+    session_service: BaseSessionService
+    password_service: BasePasswordService
+    login_throttle_service: BaseLoginThrottleService
+
+    async def execute(
+            self,
+            email: str,
+            password: str,
+            ip_address: str | None = None,
+    ) -> tuple[ClientEntity, TokenEntity]:
+        await sync_to_async(self.login_throttle_service.acquire)(email=email, ip_address=ip_address)
+        client = await self.client_service.get_by_email(client_email=email, projection=ClientProjection.AUTH)
+        await self.client_service.validate_password(client_password=client.password, plain_password=password)
+        await sync_to_async(self.login_throttle_service.release)(email=email, ip_address=ip_address)
+
+        if self.password_service.needs_rehash(hashed_password=client.password):
+            self.client_service.schedule_password_rehash(client=client, plain_password=password)
 
         tokens: TokenEntity = self.client_service.generate_tokens(client=client)
+        await self.session_service.acreate(claims=self.client_service.get_claims_from_token(token=tokens.refresh_token))
 
         return client, tokens
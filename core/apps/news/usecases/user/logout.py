@@ -1,13 +1,35 @@
 from dataclasses import dataclass
 
+from jwt import PyJWTError
+
+from core.apps.news.entities.token import TokenClaims
+from core.apps.news.services.revocation import BaseTokenRevocationService
+from core.apps.news.services.session import BaseSessionService
 from core.apps.news.services.user import BaseClientService
+from core.apps.common.exceptions import JWTKeyParsingException
+from core.apps.common.models import TokenType
 
 
 @dataclass
 class LogoutClientUseCase:
     client_service: BaseClientService
+    revocation_service: BaseTokenRevocationService
+    session_service: BaseSessionService
+
+    def execute(self, claims: TokenClaims, refresh_token: str | None = None) -> None:
+        revoked_claims = [claims]
+        if refresh_token:
+            try:
+                refresh_claims = self.client_service.get_claims_from_token(token=refresh_token)
+            except (PyJWTError, JWTKeyParsingException):
+                refresh_claims = None
+
+            if (
+                refresh_claims is not None and
+                refresh_claims.token_type == TokenType.REFRESH and
+                refresh_claims.email == claims.email
+            ):
+                revoked_claims.append(refresh_claims)
 
-    def execute(self, token: str) -> None:
-        pass
-        # client_email = self.client_service.get_client_email_from_token(token=token)
-        # client = self.client_service.get_by_email(client_email=client_email)
+        self.revocation_service.revoke(claims=revoked_claims)
+        self.session_service.revoke(client_id=claims.client_id, device_id=claims.device_id)
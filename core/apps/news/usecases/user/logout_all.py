@@ -0,0 +1,18 @@
+from dataclasses import dataclass
+
+from core.apps.news.entities.token import TokenClaims
+from core.apps.news.services.revocation import BaseTokenRevocationService
+from core.apps.news.services.session import BaseSessionService
+from core.apps.news.services.token_version import BaseTokenVersionService
+
+
+@dataclass
+class LogoutAllClientUseCase:
+    revocation_service: BaseTokenRevocationService
+    session_service: BaseSessionService
+    token_version_service: BaseTokenVersionService
+
+    def execute(self, claims: TokenClaims) -> None:
+        self.revocation_service.revoke(claims=[claims])
+        self.session_service.revoke_all(client_id=claims.client_id)
+        self.token_version_service.increment(client_id=claims.client_id)
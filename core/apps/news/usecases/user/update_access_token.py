@@ -1,23 +1,80 @@
 from dataclasses import dataclass
 
 from core.apps.news.entities.token import Token as TokenEntity
+from core.apps.news.entities.user import User as ClientEntity
+from core.apps.news.services.async_user import BaseAsyncClientService
+from core.apps.news.services.revocation import BaseTokenRevocationService
+from core.apps.news.services.session import BaseSessionService
+from core.apps.news.services.token_version import BaseTokenVersionService
 from core.apps.news.services.user import BaseClientService
-from core.apps.common.exceptions import InvalidTokenTypeException
+from core.apps.common.exceptions import (
+    InvalidTokenTypeException,
+    TokenRevokedException,
+)
 from core.apps.common.models import TokenType
 
 
 @dataclass
 class UpdateAccessTokenUseCase:
     client_service: BaseClientService
+    revocation_service: BaseTokenRevocationService
+    session_service: BaseSessionService
+    token_version_service: BaseTokenVersionService
 
     def execute(self, token: str) -> TokenEntity:
-        token_type = self.client_service.get_token_type_from_token(token=token)
-        if token_type != TokenType.REFRESH:
+        claims = self.client_service.get_claims_from_token(token=token)
+        if claims.token_type != TokenType.REFRESH:
             raise InvalidTokenTypeException
 
-        client_email = self.client_service.get_client_email_from_token(token=token)
-        client = self.client_service.get_by_email(client_email=client_email)
+        if self.revocation_service.is_revoked(jti=claims.jti):
+            raise TokenRevokedException
 
-        device_id = self.client_service.get_device_id_from_token(token=token)
-        token: TokenEntity = self.client_service.update_access_token(client=client, device_id=device_id)
-        return token
+        if claims.token_version != self.token_version_service.get_version(client_id=claims.client_id):
+            raise TokenRevokedException
+
+        client = ClientEntity(
+            id=claims.client_id,
+            email=claims.email,
+            role=claims.role,
+            token_version=claims.token_version,
+        )
+
+        tokens: TokenEntity = self.client_service.generate_tokens(client=client, device_id=claims.device_id)
+        self.session_service.rotate(
+            claims=claims,
+            new_claims=self.client_service.get_claims_from_token(token=tokens.refresh_token),
+        )
+        return tokens
+
+
+@dataclass
+class AsyncUpdateAccessTokenUseCase:
+    client_service: BaseAsyncClientService
+    revocation_service: BaseTokenRevocationService
+    session_service: BaseSessionService
+    token_version_service: BaseTokenVersionService
+
+    async def execute(self, token: str) -> TokenEntity:
+        claims = self.client_service.get_claims_from_token(token=token)
+        if claims.token_type != TokenType.REFRESH:
+            raise InvalidTokenTypeException
+
+        if await self.revocation_service.ais_revoked(jti=claims.jti):
+            raise TokenRevokedException
+
+        if claims.token_version != await self.token_version_service.aget_version(client_id=claims.client_id):
+            raise TokenRevokedException
+
+        client = ClientEntity(
+            id=claims.client_id,
+            email=claims.email,
+            role=claims.role,
+            token_version=claims.token_version,
+        )
+
+        tokens: TokenEntity = self.client_service.generate_tokens(client=client, device_id=claims.device_id)
+        await self.session_service.arotate(
+            claims=claims,
+            new_claims=self.client_service.get_claims_from_token(token=tokens.refresh_token),
+        )
+        return tokens
@@ -1,6 +1,7 @@
 from dataclasses import dataclass
 
 from core.apps.news.entities.user import User as ClientEntity
+from core.apps.news.services.async_user import BaseAsyncClientService
 from core.apps.news.services.user import BaseClientService
 
 
@@ -9,13 +10,22 @@ class UpdateClientCredentialsUseCase:
     client_service: BaseClientService
 
     def execute(self, email: str, first_name: str, last_name: str, middle_name: str) -> ClientEntity:
-        client = self.client_service.get_by_email(client_email=email)
-        self.client_service.update_credentials(
-            client_id=client.id,
+        return self.client_service.update_credentials(
+            client_email=email,
             first_name=first_name,
             last_name=last_name,
             middle_name=middle_name,
         )
-        updated_client = self.client_service.get_by_id(client_id=client.id)
 
-        return updated_client
+
+@dataclass
+class AsyncUpdateClientCredentialsUseCase:
+    client_service: BaseAsyncClientService
+
+    async def execute(self, email: str, first_name: str, last_name: str, middle_name: str) -> ClientEntity:
+        return await self.client_service.update_credentials(
+            client_email=email,
+            first_name=first_name,
+            last_name=last_name,
+            middle_name=middle_name,
+        )
@@ -1,5 +1,6 @@
 from dataclasses import dataclass
 
+from core.apps.news.entities.user import ClientProjection
 from core.apps.news.services.user import BaseClientService
 from core.apps.common.auth.password import BasePasswordService
 from core.apps.common.auth.validators.password import BasePasswordValidatorService
@@ -13,7 +14,7 @@ class UpdateClientPasswordUseCase:
     password_validator_service: BasePasswordValidatorService
 
     def execute(self, email: str, old_password: str, new_password: str, verify_password: str) -> None:
-        client = self.client_service.get_by_email(client_email=email)
+        client = self.client_service.get_by_email(client_email=email, projection=ClientProjection.AUTH)
         self.client_service.validate_password(client_password=client.password, plain_password=old_password)
         self.password_validator_service.validate(
             password=new_password,
@@ -22,4 +23,4 @@ class UpdateClientPasswordUseCase:
         )
         hashed_password = self.password_service.hash_password(plain_password=new_password)
 
-        self.client_service.update_password(client_id=client.id, hashed_password=hashed_password)
+        self.client_service.update_password(client_email=email, hashed_password=hashed_password)
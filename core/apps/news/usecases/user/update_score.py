@@ -1,25 +1,42 @@
 from dataclasses import dataclass
 from decimal import Decimal
+from typing import ClassVar
+
+from asgiref.sync import sync_to_async
+
 from core.apps.news.entities.user import User as ClientEntity
+from core.apps.news.services.async_user import BaseAsyncClientService
+from core.apps.news.services.score_buffer import BaseScoreBufferService
 from core.apps.news.services.user import BaseClientService
 
 
 @dataclass
 class UpdateClientScoreUseCase:
+    SCORE_STEP: ClassVar[Decimal] = Decimal('0.01')
+
     client_service: BaseClientService
+    score_buffer_service: BaseScoreBufferService
+
+    def execute(self, email: str, liked: bool) -> ClientEntity | None:
+        delta = self.SCORE_STEP if liked else -self.SCORE_STEP
+        if not self.score_buffer_service.IS_BUFFERED:
+            return self.client_service.increment_score(client_email=email, delta=delta)
+
+        self.score_buffer_service.add(client_email=email, delta=delta)
+        return None
+
+
+@dataclass
+class AsyncUpdateClientScoreUseCase:
+    SCORE_STEP: ClassVar[Decimal] = UpdateClientScoreUseCase.SCORE_STEP
+
+    client_service: BaseAsyncClientService
+    score_buffer_service: BaseScoreBufferService
+
+    async def execute(self, email: str, liked: bool) -> ClientEntity | None:
+        delta = self.SCORE_STEP if liked else -self.SCORE_STEP
+        if not self.score_buffer_service.IS_BUFFERED:
+            return await self.client_service.increment_score(client_email=email, delta=delta)
 
-    def execute(self, email: str, liked: bool) -> ClientEntity:
-        client = self.client_service.get_by_email(client_email=email)
-        if liked:
-            self.client_service.update_score(
-                client_id=client.id,
-                score=client.score + Decimal('0.01'),
-            )
-        if not liked:
-            self.client_service.update_score(
-                client_id=client.id,
-                score=client.score - Decimal('0.01'),
-            )
-        updated_client = self.client_service.get_by_id(client_id=client.id)
-
-        return updated_client
+        await sync_to_async(self.score_buffer_service.add)(client_email=email, delta=delta)
+        return None
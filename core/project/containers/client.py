@@ -1,30 +1,144 @@
 import punq
 
-from core.apps.common.auth.password import BasePasswordService, BcryptPasswordService
+from core.apps.common.auth.password import (
+    BasePasswordService,
+    BcryptPasswordService,
+    PasswordServiceRegistry,
+    PooledPasswordService,
+    ScryptPasswordService,
+    get_password_hashing_executor,
+)
 from core.apps.common.auth.token import BaseTokenService, JWTTokenService
+from core.apps.common.bus import (
+    BaseInvalidationBus,
+    NoInvalidationBus,
+    PostgresInvalidationBus,
+)
+from core.apps.common.executor import BoundedPriorityExecutor
+from core.apps.news.services.async_user import AsyncORMClientService, BaseAsyncClientService
+from core.apps.news.services.client_cache import CachedClientService
+from core.apps.news.services.login_throttle import (
+    BaseLoginThrottleService,
+    CacheLoginThrottleService,
+    MemoryLoginThrottleService,
+)
+from core.apps.news.services.score_buffer import (
+    BaseScoreBufferService,
+    MemoryScoreBufferService,
+    NoScoreBufferService,
+    TableScoreBufferService,
+)
+from core.apps.news.services.revocation import BaseTokenRevocationService, ORMTokenRevocationService
+from core.apps.news.services.session import BaseSessionService, ORMSessionService
+from core.apps.news.services.token_version import BaseTokenVersionService, ORMTokenVersionService
 from core.apps.news.services.user import BaseClientService, ORMClientService
 from core.apps.news.usecases.user.create import CreateClientUseCase
-from core.apps.news.usecases.user.get_info import GetClientInfoUseCase
-from core.apps.news.usecases.user.login import LoginClientUseCase
+from core.apps.news.usecases.user.import_clients import ImportClientsUseCase
+from core.apps.news.usecases.user.get_info import AsyncGetClientInfoUseCase, GetClientInfoUseCase
+from core.apps.news.usecases.user.get_sessions import GetClientSessionsUseCase
+from core.apps.news.usecases.user.login import AsyncLoginClientUseCase, LoginClientUseCase
 from core.apps.news.usecases.user.logout import LogoutClientUseCase
-from core.apps.news.usecases.user.update_access_token import UpdateAccessTokenUseCase
-from core.apps.news.usecases.user.update_credentials import UpdateClientCredentialsUseCase
+from core.apps.news.usecases.user.logout_all import LogoutAllClientUseCase
+from core.apps.news.usecases.user.update_access_token import AsyncUpdateAccessTokenUseCase, UpdateAccessTokenUseCase
+from core.apps.news.usecases.user.update_credentials import (
+    AsyncUpdateClientCredentialsUseCase,
+    UpdateClientCredentialsUseCase,
+)
 from core.apps.news.usecases.user.update_email import UpdateClientEmailUseCase
 from core.apps.news.usecases.user.update_password import UpdateClientPasswordUseCase
-from core.apps.news.usecases.user.update_score import UpdateClientScoreUseCase
+from core.apps.news.usecases.user.update_score import AsyncUpdateClientScoreUseCase, UpdateClientScoreUseCase
+from core.project.settings import env
 
 
 def register_client_services(container: punq.Container):
-    container.register(BaseClientService, ORMClientService)
-    container.register(BasePasswordService, BcryptPasswordService)
+    if env.bool("INVALIDATION_BUS_ENABLED", default=False):
+        container.register(BaseInvalidationBus, PostgresInvalidationBus, scope=punq.Scope.singleton)
+    else:
+        container.register(BaseInvalidationBus, NoInvalidationBus, scope=punq.Scope.singleton)
+
+    container.register(ORMClientService)
+
+    def build_client_service() -> BaseClientService:
+        client_service = container.resolve(ORMClientService)
+        return CachedClientService(
+            password_service=client_service.password_service,
+            token_service=client_service.token_service,
+            token_version_service=client_service.token_version_service,
+            password_hashing_executor=client_service.password_hashing_executor,
+            invalidation_bus=client_service.invalidation_bus,
+            client_service=client_service,
+        )
+
+    if env.bool("CLIENT_CACHE_ENABLED", default=False):
+        container.register(BaseClientService, factory=build_client_service, scope=punq.Scope.singleton)
+    else:
+        container.register(BaseClientService, ORMClientService)
+    container.register(BaseAsyncClientService, AsyncORMClientService)
+
+    container.register(BcryptPasswordService)
+    container.register(ScryptPasswordService)
+    container.register(BoundedPriorityExecutor, instance=get_password_hashing_executor())
+
+    def build_password_service_registry() -> PasswordServiceRegistry:
+        return PasswordServiceRegistry(
+            password_services=[
+                container.resolve(BcryptPasswordService),
+                container.resolve(ScryptPasswordService),
+            ],
+            default_algorithm=env.str("PASSWORD_HASHER", default=BcryptPasswordService.ALGORITHM),
+        )
+
+    container.register(PasswordServiceRegistry, factory=build_password_service_registry)
+
+    def build_password_service() -> BasePasswordService:
+        return PooledPasswordService(
+            password_service=container.resolve(PasswordServiceRegistry),
+            executor=container.resolve(BoundedPriorityExecutor),
+            timeout=env.float("PASSWORD_HASHING_TIMEOUT", default=5.0),
+        )
+
+    container.register(BasePasswordService, factory=build_password_service)
     container.register(BaseTokenService, JWTTokenService)
+    container.register(BaseTokenRevocationService, ORMTokenRevocationService, scope=punq.Scope.singleton)
+    container.register(BaseSessionService, ORMSessionService)
+    container.register(BaseTokenVersionService, ORMTokenVersionService, scope=punq.Scope.singleton)
+
+    login_throttle_services = {
+        "memory": MemoryLoginThrottleService,
+        "cache": CacheLoginThrottleService,
+    }
+    container.register(
+        BaseLoginThrottleService,
+        login_throttle_services[env.str("LOGIN_THROTTLE_BACKEND", default="cache")],
+        scope=punq.Scope.singleton,
+    )
+
+    score_buffer_services = {
+        "off": NoScoreBufferService,
+        "memory": MemoryScoreBufferService,
+        "table": TableScoreBufferService,
+    }
+    container.register(
+        BaseScoreBufferService,
+        score_buffer_services[env.str("SCORE_BUFFER_MODE", default="off")],
+        scope=punq.Scope.singleton,
+    )
 
     container.register(CreateClientUseCase)
+    container.register(ImportClientsUseCase)
     container.register(LoginClientUseCase)
     container.register(LogoutClientUseCase)
+    container.register(LogoutAllClientUseCase)
+    container.register(GetClientSessionsUseCase)
     container.register(UpdateClientEmailUseCase)
     container.register(UpdateClientPasswordUseCase)
     container.register(UpdateClientCredentialsUseCase)
     container.register(GetClientInfoUseCase)
     container.register(UpdateAccessTokenUseCase)
     container.register(UpdateClientScoreUseCase)
+
+    container.register(AsyncLoginClientUseCase)
+    container.register(AsyncGetClientInfoUseCase)
+    container.register(AsyncUpdateAccessTokenUseCase)
+    container.register(AsyncUpdateClientCredentialsUseCase)
+    container.register(AsyncUpdateClientScoreUseCase)
@@ -3,6 +3,7 @@ from functools import lru_cache
 import punq
 
 from core.project.containers.client import register_client_services
+from core.project.containers.news import register_news_services
 from core.project.containers.validators import register_validators
 
 
@@ -15,6 +16,7 @@ def _initialize_container() -> punq.Container:
     container = punq.Container()
 
     register_client_services(container=container)
+    register_news_services(container=container)
 
     register_validators(container=container)
     return container
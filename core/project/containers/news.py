@@ -0,0 +1,15 @@
+import punq
+
+from core.apps.news.services.news import (
+    BaseNewsService,
+    ORMNewsService,
+)
+from core.apps.news.usecases.news.get_detail import GetNewsDetailUseCase
+from core.apps.news.usecases.news.get_list import GetNewsListUseCase
+
+
+def register_news_services(container: punq.Container):
+    container.register(BaseNewsService, ORMNewsService)
+
+    container.register(GetNewsListUseCase)
+    container.register(GetNewsDetailUseCase)
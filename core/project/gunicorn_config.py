@@ -0,0 +1,82 @@
+import os
+
+from core.project.settings import env
+
+
+WORKER_PROFILES = {
+    "sync": {
+        "wsgi_app": "core.project.wsgi:application",
+        "worker_class": "gthread",
+        "workers": 2 * (os.cpu_count() or 1) + 1,
+        "threads": env.int("GUNICORN_THREADS", default=4),
+    },
+    "async": {
+        "wsgi_app": "core.project.asgi:application",
+        "worker_class": "core.project.workers.UvicornWorker",
+        "workers": (os.cpu_count() or 1) + 1,
+        "threads": 1,
+    },
+}
+
+worker_profile = WORKER_PROFILES[env.str("GUNICORN_WORKER_PROFILE", default="async")]
+
+wsgi_app = worker_profile["wsgi_app"]
+worker_class = env.str("GUNICORN_WORKER_CLASS", default=worker_profile["worker_class"])
+workers = env.int("GUNICORN_WORKERS", default=worker_profile["workers"])
+threads = worker_profile["threads"]
+
+bind = env.str("GUNICORN_BIND", default="0.0.0.0:8000")
+backlog = env.int("GUNICORN_BACKLOG", default=2048)
+preload_app = env.bool("GUNICORN_PRELOAD", default=True)
+max_requests = env.int("GUNICORN_MAX_REQUESTS", default=10_000)
+max_requests_jitter = env.int("GUNICORN_MAX_REQUESTS_JITTER", default=1_000)
+timeout = env.int("GUNICORN_TIMEOUT", default=30)
+graceful_timeout = env.int("GUNICORN_GRACEFUL_TIMEOUT", default=30)
+keepalive = env.int("GUNICORN_KEEPALIVE", default=5)
+
+accesslog = env.str("GUNICORN_ACCESS_LOG", default="-") or None
+errorlog = "-"
+loglevel = env.str("GUNICORN_LOG_LEVEL", default="info")
+
+
+def when_ready(server):
+    from core.apps.common.auth.password import get_bcrypt_rounds
+
+    server.log.info(f"Bcrypt Rounds Calibrated ({get_bcrypt_rounds()=})")
+
+
+def pre_fork(server, worker):
+    from django.db import connections
+
+    connections.close_all()
+    for connection in connections.all():
+        if connection.settings_dict["OPTIONS"].get("pool"):
+            connection.close_pool()
+
+
+def post_fork(server, worker):
+    if not server.cfg.preload_app:
+        return
+
+    from core.apps.common.bus import BaseInvalidationBus
+    from core.project.containers.containers import get_container
+
+    get_container().resolve(BaseInvalidationBus).start()
+
+
+def worker_exit(server, worker):
+    from core.apps.common.bus import BaseInvalidationBus
+    from core.apps.news.services.score_buffer import BaseScoreBufferService
+    from core.project.containers.containers import get_container
+
+    from django.db import connections
+
+    container = get_container()
+    try:
+        container.resolve(BaseScoreBufferService).flush()
+    finally:
+        container.resolve(BaseInvalidationBus).stop()
+
+    for connection in connections.all():
+        if connection.settings_dict["OPTIONS"].get("pool"):
+            server.log.info(f"Connection Pool Stats ({connection.alias=}, {connection.pool.get_stats()=})")
@@ -0,0 +1,54 @@
+from asgiref.sync import iscoroutinefunction
+from django.conf import settings
+from django.http import (
+    HttpRequest,
+    HttpResponse,
+)
+from django.utils.decorators import sync_and_async_middleware
+
+from core.project.routers import (
+    pin_to_primary,
+    unpin_from_primary,
+)
+
+
+PRIMARY_PIN_COOKIE = "db_primary_pin"
+SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "TRACE"})
+
+
+@sync_and_async_middleware
+def primary_pinning_middleware(get_response):
+    if iscoroutinefunction(get_response):
+        async def middleware(request: HttpRequest) -> HttpResponse:
+            token = pin_to_primary(is_pinned=_is_request_pinned(request=request))
+            try:
+                response = await get_response(request)
+            finally:
+                unpin_from_primary(token)
+            return _set_pin_cookie(request=request, response=response)
+    else:
+        def middleware(request: HttpRequest) -> HttpResponse:
+            token = pin_to_primary(is_pinned=_is_request_pinned(request=request))
+            try:
+                response = get_response(request)
+            finally:
+                unpin_from_primary(token)
+            return _set_pin_cookie(request=request, response=response)
+
+    return middleware
+
+
+def _is_request_pinned(request: HttpRequest) -> bool:
+    return request.method not in SAFE_METHODS or PRIMARY_PIN_COOKIE in request.COOKIES
+
+
+def _set_pin_cookie(request: HttpRequest, response: HttpResponse) -> HttpResponse:
+    if settings.DATABASE_REPLICAS and request.method not in SAFE_METHODS:
+        response.set_cookie(
+            key=PRIMARY_PIN_COOKIE,
+            value="1",
+            max_age=settings.DB_PRIMARY_PIN_SECONDS,
+            httponly=True,
+            samesite="Strict",
+        )
+    return response
@@ -0,0 +1,69 @@
+import random
+from contextlib import contextmanager
+from contextvars import (
+    ContextVar,
+    Token,
+)
+from typing import (
+    ClassVar,
+    Iterator,
+)
+
+from django.conf import settings
+from django.db import (
+    DEFAULT_DB_ALIAS,
+    connections,
+)
+from django.db.models import Model
+
+
+_pinned_to_primary: ContextVar[bool] = ContextVar("pinned_to_primary", default=False)
+
+
+def pin_to_primary(is_pinned: bool = True) -> Token:
+    return _pinned_to_primary.set(is_pinned)
+
+
+def unpin_from_primary(token: Token) -> None:
+    _pinned_to_primary.reset(token)
+
+
+def is_pinned_to_primary() -> bool:
+    return _pinned_to_primary.get()
+
+
+@contextmanager
+def use_primary() -> Iterator[None]:
+    token = pin_to_primary()
+    try:
+        yield
+    finally:
+        unpin_from_primary(token)
+
+
+class PrimaryReplicaRouter:
+    PRIMARY_ONLY_MODELS: ClassVar[frozenset[str]] = frozenset({
+        "news.revokedtoken",
+        "news.scoreevent",
+        "news.session",
+    })
+
+    def db_for_read(self, model: type[Model], **hints) -> str:
+        replicas = settings.DATABASE_REPLICAS
+        if (
+            not replicas
+            or is_pinned_to_primary()
+            or model._meta.label_lower in self.PRIMARY_ONLY_MODELS
+            or connections[DEFAULT_DB_ALIAS].in_atomic_block
+        ):
+            return DEFAULT_DB_ALIAS
+        return random.choice(replicas)
+
+    def db_for_write(self, model: type[Model], **hints) -> str:
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1: Model, obj2: Model, **hints) -> bool:
+        return True
+
+    def allow_migrate(self, db: str, app_label: str, model_name: str | None = None, **hints) -> bool:
+        return db == DEFAULT_DB_ALIAS
@@ -10,6 +10,7 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/5.1/ref/settings/
 """
 import environ
+from importlib.util import find_spec
 from pathlib import Path
 
 # Build paths inside the core like this: BASE_DIR / 'subdir'.
@@ -53,6 +54,7 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+    'core.project.middleware.primary_pinning_middleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -86,6 +88,12 @@ WSGI_APPLICATION = 'core.project.wsgi.application'
 # Database
 # https://docs.djangoproject.com/en/5.1/ref/settings/#databases
 
+# off: a new connection per request
+# persistent: reuse one connection per thread for DB_CONN_MAX_AGE seconds
+# pool: psycopg 3 connection pool per process (requires the "pool" extra)
+# pgbouncer: persistent connections to pgbouncer in transaction pooling mode
+DB_POOL_MODE = env.str('DB_POOL_MODE', default='pool' if find_spec('psycopg_pool') else 'persistent')
+
 DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.postgresql',
@@ -94,9 +102,59 @@ DATABASES = {
         'PASSWORD': env('POSTGRES_DB_PASSWORD'),
         'HOST': env('POSTGRES_HOST'),
         'PORT': env('POSTGRES_PORT'),
+        'CONN_MAX_AGE': env.int('DB_CONN_MAX_AGE', default=600) if DB_POOL_MODE in ('persistent', 'pgbouncer') else 0,
+        'CONN_HEALTH_CHECKS': DB_POOL_MODE in ('persistent', 'pgbouncer'),
+        'DISABLE_SERVER_SIDE_CURSORS': DB_POOL_MODE == 'pgbouncer',
+        'OPTIONS': {
+            'application_name': env.str('DB_APPLICATION_NAME', default='sep_backend'),
+        },
     }
 }
 
+if DB_POOL_MODE == 'pool':
+    DATABASES['default']['OPTIONS']['pool'] = {
+        'name': 'default',
+        'min_size': env.int('DB_POOL_MIN_SIZE', default=2),
+        'max_size': env.int('DB_POOL_MAX_SIZE', default=10),
+        'timeout': env.float('DB_POOL_TIMEOUT', default=10.0),
+        'max_idle': env.float('DB_POOL_MAX_IDLE', default=600.0),
+        'max_lifetime': env.float('DB_POOL_MAX_LIFETIME', default=3600.0),
+    }
+
+# Reads go to the replica only when POSTGRES_REPLICA_HOST is set; clients that
+# sent a write stay on the primary for DB_PRIMARY_PIN_SECONDS
+DATABASE_REPLICAS = []
+DATABASE_ROUTERS = ['core.project.routers.PrimaryReplicaRouter']
+DB_PRIMARY_PIN_SECONDS = env.int('DB_PRIMARY_PIN_SECONDS', default=5)
+
+if env.str('POSTGRES_REPLICA_HOST', default=''):
+    DATABASES['replica'] = {
+        **DATABASES['default'],
+        'NAME': env.str('POSTGRES_REPLICA_DB_NAME', default=DATABASES['default']['NAME']),
+        'HOST': env('POSTGRES_REPLICA_HOST'),
+        'PORT': env.str('POSTGRES_REPLICA_PORT', default=DATABASES['default']['PORT']),
+        'OPTIONS': {
+            **DATABASES['default']['OPTIONS'],
+            **(
+                {'pool': {**DATABASES['default']['OPTIONS']['pool'], 'name': 'replica'}}
+                if 'pool' in DATABASES['default']['OPTIONS'] else {}
+            ),
+        },
+        'TEST': {'MIRROR': 'default'},
+    }
+    DATABASE_REPLICAS = ['replica']
+
+
+# Cache
+# https://docs.djangoproject.com/en/5.1/topics/cache/
+
+# locmemcache:// is private to each worker process; the client cache and the login throttle
+# must see the same counters in every worker, so production points CACHE_URL at a shared
+# backend such as redis://redis:6379/0 (requires the "cache" extra)
+CACHES = {
+    'default': env.cache_url('CACHE_URL', default='locmemcache://'),
+}
+
 
 
 # Password validation
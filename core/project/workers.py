@@ -0,0 +1,17 @@
+import signal
+import sys
+
+from uvicorn.workers import UvicornWorker as BaseUvicornWorker
+
+
+class UvicornWorker(BaseUvicornWorker):
+    # uvicorn drains requests on SIGTERM, then restores the worker's SIGTERM handler and re-raises the
+    # signal. The stock worker resets that handler to SIG_DFL, so the process is killed by the re-raised
+    # signal before gunicorn's worker_exit hook runs and the buffered score deltas are never flushed.
+    # Exiting with status 0 instead lets Worker.run return through gunicorn's normal shutdown path.
+    def init_signals(self) -> None:
+        super().init_signals()
+        signal.signal(signal.SIGTERM, self.handle_term)
+
+    def handle_term(self, sig, frame) -> None:
+        sys.exit(0)
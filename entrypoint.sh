@@ -1,4 +1,7 @@
 #!/bin/bash
 # !WARNING This file should not contain last blank line
-# gunicorn core.project.wsgi:application -w 2 --bind 0.0.0.0:8000 --reload
-python manage.py runserver 0.0.0.0:8000
\ No newline at end of file
+if [ "${APP_SERVER:-gunicorn}" = "runserver" ]; then
+    python manage.py runserver 0.0.0.0:8000
+else
+    exec gunicorn -c python:core.project.gunicorn_config
+fi
\ No newline at end of file
@@ -1,4 +1,10 @@
-from core.apps.common.auth.password import BasePasswordService
+import bcrypt
+
+from core.apps.common.auth.password import (
+    BasePasswordService,
+    calibrate_bcrypt_rounds,
+    get_bcrypt_rounds,
+)
 
 
 def test_verify_password_success(password_service: BasePasswordService, hash_password, generate_password):
@@ -19,3 +25,19 @@ def test_verify_password_fail(password_service: BasePasswordService, hash_passwo
         password_service.verify_password(plain_password=another_plain_password, hashed_password=hashed_password) is
         False
     )
+
+
+def test_needs_rehash(password_service: BasePasswordService, hash_password, generate_password):
+    """Test that only hashes with a cost different from the calibrated one need rehashing."""
+    plain_password = generate_password()
+    outdated_rounds = get_bcrypt_rounds() - 1
+    outdated_hashed_password = bcrypt.hashpw(plain_password.encode(), bcrypt.gensalt(rounds=outdated_rounds)).decode()
+
+    assert password_service.needs_rehash(hashed_password=hash_password(plain_password=plain_password)) is False
+    assert password_service.needs_rehash(hashed_password=outdated_hashed_password) is True
+
+
+def test_calibrate_bcrypt_rounds_respects_bounds():
+    """Test that calibrated cost stays within the configured bounds."""
+    assert calibrate_bcrypt_rounds(target_ms=1, min_rounds=10) == 10
+    assert calibrate_bcrypt_rounds(target_ms=10 ** 9, min_rounds=10, max_rounds=14) == 14
@@ -0,0 +1,73 @@
+import pytest
+
+from core.apps.common.auth.password import (
+    BcryptPasswordService,
+    PasswordServiceRegistry,
+    ScryptPasswordService,
+)
+
+
+@pytest.fixture
+def build_registry():
+    def _build_registry(default_algorithm: str) -> PasswordServiceRegistry:
+        return PasswordServiceRegistry(
+            password_services=[BcryptPasswordService(), ScryptPasswordService()],
+            default_algorithm=default_algorithm,
+        )
+
+    return _build_registry
+
+
+def test_scrypt_verify_password(generate_password):
+    """Test for verifying plain password against scrypt hash."""
+    password_service = ScryptPasswordService()
+    plain_password = generate_password()
+    hashed_password = password_service.hash_password(plain_password=plain_password)
+
+    assert hashed_password.startswith("$scrypt$")
+    assert password_service.verify_password(plain_password=plain_password, hashed_password=hashed_password) is True
+    assert password_service.verify_password(plain_password=generate_password(), hashed_password=hashed_password) is False
+    assert password_service.needs_rehash(hashed_password=hashed_password) is False
+
+
+@pytest.mark.parametrize(
+    "hashed_password",
+    [
+        "$scrypt$n=16384,r=8$c2FsdA$a2V5",
+        "$scrypt$r=8,p=1$c2FsdA$a2V5",
+        "$scrypt$n=3,r=8,p=1$c2FsdA$a2V5",
+        "$scrypt$n=16384,r=8,p=1$c2FsdA",
+    ],
+)
+def test_scrypt_verify_malformed_hash(build_registry, generate_password, hashed_password: str):
+    """Test that a malformed scrypt hash fails verification instead of raising."""
+    plain_password = generate_password()
+
+    assert ScryptPasswordService().verify_password(plain_password=plain_password, hashed_password=hashed_password) is False
+    assert build_registry("bcrypt").verify_password(plain_password=plain_password, hashed_password=hashed_password) is False
+
+
+def test_registry_verifies_any_known_algorithm(build_registry, generate_password):
+    """Test that registry dispatches verification on hash prefix regardless of default algorithm."""
+    plain_password = generate_password()
+    bcrypt_hashed_password = build_registry("bcrypt").hash_password(plain_password=plain_password)
+    scrypt_hashed_password = build_registry("scrypt").hash_password(plain_password=plain_password)
+    registry = build_registry("scrypt")
+
+    assert registry.verify_password(plain_password=plain_password, hashed_password=bcrypt_hashed_password) is True
+    assert registry.verify_password(plain_password=plain_password, hashed_password=scrypt_hashed_password) is True
+    assert registry.verify_password(plain_password=plain_password, hashed_password=plain_password) is False
+
+
+def test_registry_needs_rehash_on_algorithm_change(build_registry, generate_password):
+    """Test that hashes made with non-default algorithm need rehashing."""
+    plain_password = generate_password()
+    bcrypt_hashed_password = build_registry("bcrypt").hash_password(plain_password=plain_password)
+
+    assert build_registry("bcrypt").needs_rehash(hashed_password=bcrypt_hashed_password) is False
+    assert build_registry("scrypt").needs_rehash(hashed_password=bcrypt_hashed_password) is True
+
+
+def test_registry_unknown_default_algorithm(build_registry):
+    with pytest.raises(ValueError):
+        build_registry("argon2")
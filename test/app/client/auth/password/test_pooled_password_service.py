@@ -0,0 +1,65 @@
+import pytest
+import threading
+
+from core.apps.common.auth.password import (
+    BcryptPasswordService,
+    PooledPasswordService,
+)
+from core.apps.common.exceptions import ExecutorSaturatedException
+from core.apps.common.executor import (
+    BoundedPriorityExecutor,
+    TaskPriority,
+)
+
+
+@pytest.fixture
+def blocked_executor():
+    executor = BoundedPriorityExecutor(max_workers=1, max_queue_size=2, max_low_priority_queue_size=1)
+    started = threading.Event()
+    release = threading.Event()
+
+    def _block():
+        started.set()
+        release.wait()
+
+    executor.submit(_block)
+    started.wait()
+    yield executor, release
+    release.set()
+
+
+def test_high_priority_tasks_run_first(blocked_executor):
+    executor, release = blocked_executor
+    completed = []
+    low_future = executor.submit(completed.append, 'low', priority=TaskPriority.LOW)
+    high_future = executor.submit(completed.append, 'high', priority=TaskPriority.HIGH)
+
+    release.set()
+    low_future.result(timeout=5)
+    high_future.result(timeout=5)
+
+    assert completed == ['high', 'low']
+
+
+def test_low_priority_tasks_are_rejected_first(blocked_executor):
+    executor, _ = blocked_executor
+    executor.submit(lambda: None, priority=TaskPriority.LOW)
+
+    with pytest.raises(ExecutorSaturatedException):
+        executor.submit(lambda: None, priority=TaskPriority.LOW)
+
+    executor.submit(lambda: None, priority=TaskPriority.HIGH)
+    with pytest.raises(ExecutorSaturatedException):
+        executor.submit(lambda: None, priority=TaskPriority.HIGH)
+
+
+def test_pooled_password_service(generate_password):
+    password_service = PooledPasswordService(
+        password_service=BcryptPasswordService(),
+        executor=BoundedPriorityExecutor(max_workers=1, max_queue_size=2, max_low_priority_queue_size=1),
+    )
+    plain_password = generate_password()
+    hashed_password = password_service.hash_password(plain_password=plain_password)
+
+    assert password_service.verify_password(plain_password=plain_password, hashed_password=hashed_password) is True
+    assert password_service.verify_password(plain_password=generate_password(), hashed_password=hashed_password) is False
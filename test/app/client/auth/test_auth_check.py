@@ -0,0 +1,86 @@
+import pytest
+from asgiref.sync import async_to_sync
+from ninja.errors import HttpError
+
+from core.apps.common.auth.auth_check import (
+    AsyncAuthCheck,
+    AuthCheck,
+)
+from core.apps.common.auth.token import BaseTokenService
+from core.apps.common.models import UserRole
+from core.apps.news.entities.token import TokenClaims
+from core.apps.news.entities.user import User as ClientEntity
+from core.apps.news.services.revocation import BaseTokenRevocationService
+
+
+@pytest.fixture
+def client_entity(generate_email) -> ClientEntity:
+    return ClientEntity(id=1, email=generate_email(), role=UserRole.CREATOR)
+
+
+@pytest.mark.django_db
+def test_authenticate_returns_claims(token_service: BaseTokenService, client_entity, generate_device_id):
+    access_token = token_service.create_access_token(user=client_entity, payload={"device_id": generate_device_id})
+    claims = AuthCheck(allowed_roles=[UserRole.CREATOR]).authenticate(request=None, token=access_token)
+
+    assert isinstance(claims, TokenClaims)
+    assert claims.email == client_entity.email
+    assert claims.device_id == generate_device_id
+
+
+@pytest.mark.django_db
+def test_authenticate_refresh_token_failure(token_service: BaseTokenService, client_entity, generate_device_id):
+    refresh_token = token_service.create_refresh_token(user=client_entity, payload={"device_id": generate_device_id})
+
+    with pytest.raises(HttpError) as exc_info:
+        AuthCheck(allowed_roles=[UserRole.CREATOR]).authenticate(request=None, token=refresh_token)
+    assert exc_info.value.status_code == 403
+
+
+@pytest.mark.django_db
+def test_authenticate_role_not_allowed_failure(token_service: BaseTokenService, client_entity, generate_device_id):
+    access_token = token_service.create_access_token(user=client_entity, payload={"device_id": generate_device_id})
+
+    with pytest.raises(HttpError) as exc_info:
+        AuthCheck(allowed_roles=[UserRole.ADMIN]).authenticate(request=None, token=access_token)
+    assert exc_info.value.status_code == 403
+
+
+@pytest.mark.django_db
+def test_authenticate_invalid_token_failure():
+    with pytest.raises(HttpError) as exc_info:
+        AuthCheck(allowed_roles=[]).authenticate(request=None, token='invalid.token.value')
+    assert exc_info.value.status_code == 401
+
+
+@pytest.mark.django_db
+def test_authenticate_revoked_token_failure(
+        token_service: BaseTokenService,
+        revocation_service: BaseTokenRevocationService,
+        client_entity,
+        generate_device_id,
+):
+    access_token = token_service.create_access_token(user=client_entity, payload={"device_id": generate_device_id})
+    revocation_service.revoke(claims=[token_service.get_claims_from_token(token=access_token)])
+
+    with pytest.raises(HttpError) as exc_info:
+        AuthCheck(allowed_roles=[UserRole.CREATOR]).authenticate(request=None, token=access_token)
+    assert exc_info.value.status_code == 401
+
+
+@pytest.mark.django_db
+def test_async_authenticate_revoked_token_failure(
+        token_service: BaseTokenService,
+        revocation_service: BaseTokenRevocationService,
+        client_entity,
+        generate_device_id,
+):
+    access_token = token_service.create_access_token(user=client_entity, payload={"device_id": generate_device_id})
+    auth_check = AsyncAuthCheck(allowed_roles=[UserRole.CREATOR])
+    assert async_to_sync(auth_check.authenticate)(request=None, token=access_token).email == client_entity.email
+
+    revocation_service.revoke(claims=[token_service.get_claims_from_token(token=access_token)])
+
+    with pytest.raises(HttpError) as exc_info:
+        async_to_sync(auth_check.authenticate)(request=None, token=access_token)
+    assert exc_info.value.status_code == 401
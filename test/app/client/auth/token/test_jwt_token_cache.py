@@ -0,0 +1,66 @@
+import pytest
+import time
+
+from core.apps.common.auth.token import (
+    BaseTokenService,
+    JWTTokenService,
+)
+from core.apps.common.cache import LRUCache
+from core.apps.common.models import UserRole
+from core.apps.news.entities.user import User as ClientEntity
+
+
+@pytest.fixture
+def verified_tokens_cache(monkeypatch) -> LRUCache:
+    cache = LRUCache(maxsize=2)
+    monkeypatch.setattr(JWTTokenService, 'verified_tokens_cache', cache)
+    return cache
+
+
+@pytest.fixture
+def create_access_token(token_service: BaseTokenService, generate_email, generate_device_id):
+    def _create_access_token() -> str:
+        client = ClientEntity(id=1, email=generate_email(), role=UserRole.MANAGER)
+        return token_service.create_access_token(user=client, payload={"device_id": generate_device_id})
+
+    return _create_access_token
+
+
+def test_lru_cache_evicts_least_recently_used():
+    cache = LRUCache(maxsize=2)
+    cache.set('a', 1)
+    cache.set('b', 2)
+    cache.get('a')
+    cache.set('c', 3)
+
+    assert cache.get('b') is None
+    assert cache.get('a') == 1
+    assert cache.get('c') == 3
+
+
+def test_lru_cache_evicts_expired_entries():
+    cache = LRUCache(maxsize=2)
+    cache.set('a', 1, expires_at=time.time() - 1)
+
+    assert cache.get('a') is None
+    assert len(cache) == 0
+    assert cache.misses == 1
+
+
+def test_verified_token_is_cached(token_service: BaseTokenService, verified_tokens_cache, create_access_token):
+    access_token = create_access_token()
+
+    first_claims = token_service.get_claims_from_token(token=access_token)
+    second_claims = token_service.get_claims_from_token(token=access_token)
+
+    assert first_claims == second_claims
+    assert verified_tokens_cache.misses == 1
+    assert verified_tokens_cache.hits == 1
+
+
+def test_verified_token_cache_is_bounded(token_service: BaseTokenService, verified_tokens_cache, create_access_token):
+    for _ in range(3):
+        token_service.get_claims_from_token(token=create_access_token())
+
+    assert len(verified_tokens_cache) == 2
+    assert verified_tokens_cache.misses == 3
@@ -66,3 +66,17 @@ def test_get_raw_jwt_payload(token_service: BaseTokenService, service_params):
     assert payload["client_roles"] == service_params['user'].role
     assert payload["device_id"] == service_params['payload']['device_id']
     assert payload["iat"] <= token_service.get_expiration_time_from_token(token=access_token)
+
+
+@pytest.mark.django_db
+def test_get_claims_from_token(token_service: BaseTokenService, service_params, get_current_timestamp):
+    access_token = token_service.create_access_token(**service_params)
+    claims = token_service.get_claims_from_token(token=access_token)
+
+    assert claims.token_type == TokenType.ACCESS
+    assert claims.client_id == service_params['user'].id
+    assert claims.email == service_params['user'].email
+    assert claims.role == service_params['user'].role
+    assert claims.device_id == service_params['payload']['device_id']
+    assert claims.jti == token_service.get_jti_from_token(token=access_token)
+    assert claims.expires_at > get_current_timestamp
@@ -6,6 +6,7 @@ from datetime import (
 )
 from test.factories.client.client import ClientModelFactory
 
+from core.apps.news.services.revocation import BaseTokenRevocationService
 from core.apps.news.services.user import BaseClientService
 from core.apps.common.auth.password import BasePasswordService
 from core.apps.common.auth.token import BaseTokenService
@@ -17,6 +18,11 @@ def client_service(container) -> BaseClientService:
     return container.resolve(BaseClientService)
 
 
+@pytest.fixture
+def revocation_service(container) -> BaseTokenRevocationService:
+    return container.resolve(BaseTokenRevocationService)
+
+
 @pytest.fixture
 def password_service(container) -> BasePasswordService:
     return container.resolve(BasePasswordService)
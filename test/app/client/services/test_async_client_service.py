@@ -0,0 +1,85 @@
+import pytest
+from decimal import Decimal
+
+from asgiref.sync import async_to_sync
+
+from core.apps.news.entities.user import ClientProjection
+from core.apps.news.exceptions.auth import InvalidAuthDataException
+from core.apps.news.exceptions.user import ClientNotFoundException
+from core.apps.news.services.async_user import BaseAsyncClientService
+from core.apps.news.services.session import BaseSessionService
+from core.apps.news.usecases.user.update_access_token import AsyncUpdateAccessTokenUseCase
+
+
+@pytest.fixture
+def async_client_service(container) -> BaseAsyncClientService:
+    return container.resolve(BaseAsyncClientService)
+
+
+@pytest.mark.django_db
+def test_async_get_by_email_projection(async_client_service: BaseAsyncClientService, client_create):
+    client = client_create()
+    fetched_client = async_to_sync(async_client_service.get_by_email)(
+        client_email=client.email,
+        projection=ClientProjection.PRIVATE,
+    )
+
+    assert fetched_client.id == client.id
+    assert fetched_client.email == client.email
+    assert fetched_client.password is None
+
+
+@pytest.mark.django_db
+def test_async_get_by_email_not_found_failure(async_client_service: BaseAsyncClientService, generate_email):
+    with pytest.raises(ClientNotFoundException):
+        async_to_sync(async_client_service.get_by_email)(client_email=generate_email())
+
+
+@pytest.mark.django_db
+def test_async_validate_password(
+        async_client_service: BaseAsyncClientService,
+        generate_password,
+        hash_password,
+):
+    plain_password = generate_password()
+    hashed_password = hash_password(plain_password)
+
+    async_to_sync(async_client_service.validate_password)(
+        client_password=hashed_password,
+        plain_password=plain_password,
+    )
+    with pytest.raises(InvalidAuthDataException):
+        async_to_sync(async_client_service.validate_password)(
+            client_password=hashed_password,
+            plain_password=generate_password(),
+        )
+
+
+@pytest.mark.django_db
+def test_async_increment_score(async_client_service: BaseAsyncClientService, client_create):
+    client = client_create(score=Decimal("1.00"))
+    updated_client = async_to_sync(async_client_service.increment_score)(
+        client_email=client.email,
+        delta=Decimal("0.01"),
+    )
+
+    assert updated_client.score == Decimal("1.01")
+
+
+@pytest.mark.django_db
+def test_async_update_access_token_rotates_session(
+        container,
+        async_client_service: BaseAsyncClientService,
+        client_create,
+):
+    client = client_create()
+    tokens = async_client_service.generate_tokens(client=client.to_entity())
+    session_service: BaseSessionService = container.resolve(BaseSessionService)
+    async_to_sync(session_service.acreate)(
+        claims=async_client_service.get_claims_from_token(token=tokens.refresh_token),
+    )
+    use_case: AsyncUpdateAccessTokenUseCase = container.resolve(AsyncUpdateAccessTokenUseCase)
+
+    new_tokens = async_to_sync(use_case.execute)(tokens.refresh_token)
+
+    assert new_tokens.refresh_token != tokens.refresh_token
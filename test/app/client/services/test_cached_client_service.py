@@ -0,0 +1,137 @@
+import pytest
+from asgiref.sync import async_to_sync
+from django.core.cache import cache
+
+from core.apps.news.entities.user import ClientProjection
+from core.apps.news.services.client_cache import CachedClientService
+from core.apps.news.services.user import ORMClientService
+
+
+@pytest.fixture
+def cached_client_service(container) -> CachedClientService:
+    cache.clear()
+    client_service: ORMClientService = container.resolve(ORMClientService)
+    return CachedClientService(
+        password_service=client_service.password_service,
+        token_service=client_service.token_service,
+        token_version_service=client_service.token_version_service,
+        password_hashing_executor=client_service.password_hashing_executor,
+        invalidation_bus=client_service.invalidation_bus,
+        client_service=client_service,
+    )
+
+
+@pytest.mark.django_db
+def test_cached_client_read_through(
+        cached_client_service: CachedClientService,
+        client_create,
+        django_assert_num_queries,
+):
+    client = client_create()
+
+    with django_assert_num_queries(1):
+        cached_client_service.get_by_email(client_email=client.email, projection=ClientProjection.PRIVATE)
+        cached_client_service.get_by_email(client_email=client.email, projection=ClientProjection.PRIVATE)
+
+    cached_client_service.local_cache.clear()
+    with django_assert_num_queries(0):
+        cached_client = cached_client_service.get_by_email(
+            client_email=client.email,
+            projection=ClientProjection.PRIVATE,
+        )
+    assert cached_client.first_name == client.first_name
+
+    with django_assert_num_queries(1):
+        cached_client_service.get_by_email(client_email=client.email, projection=ClientProjection.AUTH)
+
+
+@pytest.mark.django_db
+def test_cached_client_async_read_through(
+        cached_client_service: CachedClientService,
+        client_create,
+        django_assert_num_queries,
+):
+    client = client_create()
+
+    with django_assert_num_queries(1):
+        async_to_sync(cached_client_service.aget_by_email)(
+            client_email=client.email.upper(),
+            projection=ClientProjection.PRIVATE,
+        )
+        cached_client_service.get_by_email(client_email=client.email, projection=ClientProjection.PRIVATE)
+
+    cached_client_service.local_cache.clear()
+    with django_assert_num_queries(0):
+        cached_client = async_to_sync(cached_client_service.aget_by_email)(
+            client_email=client.email,
+            projection=ClientProjection.PRIVATE,
+        )
+    assert cached_client.first_name == client.first_name
+
+    cached_client_service.update_credentials(
+        client_email=client.email,
+        first_name="Оновлене",
+        last_name=client.last_name,
+        middle_name=client.middle_name,
+    )
+    assert async_to_sync(cached_client_service.aget_by_email)(
+        client_email=client.email,
+        projection=ClientProjection.PRIVATE,
+    ).first_name == "Оновлене"
+
+
+@pytest.mark.django_db
+def test_cached_client_invalidated_on_update(cached_client_service: CachedClientService, client_create, faker_ua):
+    client = client_create()
+    cached_client_service.get_by_email(client_email=client.email, projection=ClientProjection.PRIVATE)
+    cached_client_service.get_by_id(client_id=client.id, projection=ClientProjection.PUBLIC)
+
+    new_first_name = faker_ua.first_name()
+    cached_client_service.update_credentials(
+        client_email=client.email,
+        first_name=new_first_name,
+        last_name=client.last_name,
+        middle_name=client.middle_name,
+    )
+
+    assert cached_client_service.get_by_email(
+        client_email=client.email,
+        projection=ClientProjection.PRIVATE,
+    ).first_name == new_first_name
+    assert cached_client_service.get_by_id(
+        client_id=client.id,
+        projection=ClientProjection.PUBLIC,
+    ).first_name == new_first_name
+
+
+@pytest.mark.django_db
+def test_cached_client_stale_fill_is_discarded(
+        cached_client_service: CachedClientService,
+        client_create,
+        faker_ua,
+        monkeypatch,
+):
+    client = client_create()
+    client_service = cached_client_service.client_service
+    get_by_email = client_service.get_by_email
+    new_first_name = faker_ua.first_name()
+
+    def get_by_email_racing_update(client_email, projection):
+        stale_client = get_by_email(client_email=client_email, projection=projection)
+        monkeypatch.setattr(client_service, "get_by_email", get_by_email)
+        cached_client_service.update_credentials(
+            client_email=client_email,
+            first_name=new_first_name,
+            last_name=client.last_name,
+            middle_name=client.middle_name,
+        )
+        return stale_client
+
+    monkeypatch.setattr(client_service, "get_by_email", get_by_email_racing_update)
+    stale_client = cached_client_service.get_by_email(client_email=client.email, projection=ClientProjection.PRIVATE)
+
+    assert stale_client.first_name == client.first_name
+    assert cached_client_service.get_by_email(
+        client_email=client.email,
+        projection=ClientProjection.PRIVATE,
+    ).first_name == new_first_name
@@ -1,6 +1,12 @@
 import pytest
+from decimal import Decimal
 
-from core.apps.news.entities.user import User as ClientEntity
+from django.db import models
+
+from core.apps.news.entities.user import (
+    ClientProjection,
+    User as ClientEntity,
+)
 from core.apps.news.exceptions.auth import InvalidAuthDataException
 from core.apps.news.exceptions.user import (
     ClientAlreadyExistsException,
@@ -8,7 +14,9 @@ from core.apps.news.exceptions.user import (
     ClientRoleNotMatchingWithRequiredException,
     ClientUpdateException,
 )
+from core.apps.news.models.user import User as ClientModel
 from core.apps.news.services.user import BaseClientService
+from core.apps.news.usecases.user.create import CreateClientUseCase
 from core.apps.common.models import (
     UserRole,
     TokenType,
@@ -63,6 +71,82 @@ def test_create_client_already_exists_failure(client_service: BaseClientService,
         )
 
 
+@pytest.mark.django_db
+def test_create_client_email_case_insensitive_failure(client_service: BaseClientService, client_create):
+    client = client_create()
+    with pytest.raises(ClientAlreadyExistsException):
+        client_service.create(
+            first_name=client.first_name,
+            last_name=client.last_name,
+            middle_name=client.middle_name,
+            email=client.email.upper(),
+            hashed_password=client.password,
+            role=client.role,
+        )
+
+
+@pytest.mark.django_db
+def test_get_client_by_email_case_insensitive(client_service: BaseClientService, client_create):
+    client = client_create()
+    found_client = client_service.get_by_email(client_email=client.email.upper())
+
+    assert found_client.id == client.id
+    assert client_service.check_client_exists(client_email=client.email.upper())
+
+
+def test_email_lower_lookup_is_scoped_to_client_email():
+    assert ClientModel._meta.get_field("email").get_transform("lower") is not None
+    assert models.EmailField().get_transform("lower") is None
+
+
+@pytest.mark.django_db
+def test_create_client_single_insert(
+        client_service: BaseClientService,
+        build_client_with_password,
+        django_assert_num_queries,
+):
+    client, plain_password = build_client_with_password
+    with django_assert_num_queries(1):
+        created_client = client_service.create(
+            first_name=client.first_name,
+            last_name=client.last_name,
+            middle_name=client.middle_name,
+            email=client.email,
+            hashed_password=client.password,
+            role=client.role,
+        )
+
+    assert created_client.id is not None
+    assert created_client.score == Decimal("0")
+    assert created_client.token_version == 0
+    assert created_client.created_at is not None
+
+
+@pytest.mark.django_db
+def test_create_client_use_case_duplicate_skips_hashing(
+        container,
+        client_create,
+        generate_password,
+        django_assert_num_queries,
+        monkeypatch,
+):
+    client = client_create()
+    use_case: CreateClientUseCase = container.resolve(CreateClientUseCase)
+    monkeypatch.setattr(use_case.password_service, "hash_password", pytest.fail)
+    password = generate_password()
+
+    with django_assert_num_queries(1), pytest.raises(ClientAlreadyExistsException):
+        use_case.execute(
+            first_name=client.first_name,
+            last_name=client.last_name,
+            middle_name=client.middle_name,
+            role=client.role,
+            email=client.email,
+            password=password,
+            verify_password=password,
+        )
+
+
 @pytest.mark.django_db
 def test_get_client_by_email_success(client_service: BaseClientService, client_create):
     client = client_create()
@@ -82,6 +166,22 @@ def test_get_client_by_id_success(client_service: BaseClientService, client_crea
     assert found_client.id == client.id
 
 
+@pytest.mark.django_db
+def test_get_client_by_email_projection(client_service: BaseClientService, client_create):
+    client = client_create(role=UserRole.MANAGER)
+
+    private_client = client_service.get_by_email(client_email=client.email, projection=ClientProjection.PRIVATE)
+    auth_client = client_service.get_by_email(client_email=client.email, projection=ClientProjection.AUTH)
+
+    assert private_client.email == client.email
+    assert private_client.first_name == client.first_name
+    assert private_client.role == UserRole.MANAGER
+    assert private_client.password is None
+    assert auth_client.password == client.password
+    assert auth_client.token_version == client.token_version
+    assert auth_client.first_name is None
+
+
 @pytest.mark.django_db
 def test_get_client_by_email_not_found_failure(client_service: BaseClientService, client_build):
     client = client_build()
@@ -146,8 +246,7 @@ def test_client_role_check_failure(client_service: BaseClientService, client_cre
 def test_client_update_email_success(client_service: BaseClientService, client_create, generate_email):
     client = client_create()
     new_email = generate_email()
-    client_service.update_email(client_id=client.id, email=new_email)
-    updated_client = client_service.get_by_id(client.id)
+    updated_client = client_service.update_email(client_email=client.email, email=new_email)
 
     assert updated_client.email == new_email
     assert updated_client.email != client.email
@@ -159,7 +258,7 @@ def test_client_update_email_failure(client_service: BaseClientService, client_b
     new_email = generate_email()
 
     with pytest.raises(ClientUpdateException):
-        client_service.update_email(client_id=client.id, email=new_email)
+        client_service.update_email(client_email=client.email, email=new_email)
 
 
 @pytest.mark.django_db
@@ -170,8 +269,7 @@ def test_client_update_password_success(
 ):
     client, plain_password = create_client_with_password
     new_client, new_plain_password = build_client_with_password
-    client_service.update_password(client_id=client.id, hashed_password=new_client.password)
-    updated_client = client_service.get_by_id(client.id)
+    updated_client = client_service.update_password(client_email=client.email, hashed_password=new_client.password)
 
     assert updated_client.password == new_client.password
     assert updated_client.password != client.password
@@ -182,7 +280,32 @@ def test_client_update_password_failure(client_service: BaseClientService, clien
     client = client_build()
     password = generate_password()
     with pytest.raises(ClientUpdateException):
-        client_service.update_password(client_id=client.id, hashed_password=password)
+        client_service.update_password(client_email=client.email, hashed_password=password)
+
+
+@pytest.mark.django_db
+def test_client_upgrade_password_hash(
+        client_service: BaseClientService,
+        create_client_with_password,
+        build_client_with_password,
+):
+    client, _ = create_client_with_password
+    new_client, _ = build_client_with_password
+
+    assert client_service.upgrade_password_hash(
+        client_id=client.id,
+        old_hashed_password=client.password,
+        hashed_password=new_client.password,
+    ) is True
+    assert client_service.upgrade_password_hash(
+        client_id=client.id,
+        old_hashed_password=client.password,
+        hashed_password=new_client.password,
+    ) is False
+
+    updated_client = client_service.get_by_id(client.id)
+    assert updated_client.password == new_client.password
+    assert updated_client.token_version == client.token_version
 
 
 @pytest.mark.django_db
@@ -192,13 +315,12 @@ def test_client_update_credentials_success(client_service: BaseClientService, cl
     new_last_name = faker_ua.last_name()
     new_middle_name = faker_ua.last_name()
 
-    client_service.update_credentials(
-        client_id=client.id,
+    updated_client = client_service.update_credentials(
+        client_email=client.email,
         first_name=new_first_name,
         last_name=new_last_name,
         middle_name=new_middle_name,
     )
-    updated_client = client_service.get_by_id(client.id)
 
     assert updated_client.first_name == new_first_name, f'{new_first_name=}'
     assert updated_client.last_name == new_last_name, f'{new_last_name=}'
@@ -214,7 +336,7 @@ def test_client_update_credentials_failure(client_service: BaseClientService, cl
 
     with pytest.raises(ClientUpdateException):
         client_service.update_credentials(
-            client_id=client.id,
+            client_email=client.email,
             first_name=new_first_name,
             last_name=new_last_name,
             middle_name=new_middle_name,
@@ -224,8 +346,7 @@ def test_client_update_credentials_failure(client_service: BaseClientService, cl
 @pytest.mark.django_db
 def test_client_update_role_success(client_service: BaseClientService, client_create):
     client = client_create(role=UserRole.MANAGER)
-    client_service.update_role(client_id=client.id, role=UserRole.ADMIN)
-    updated_client = client_service.get_by_id(client.id)
+    updated_client = client_service.update_role(client_email=client.email, role=UserRole.ADMIN)
     assert updated_client.role == UserRole.ADMIN
 
 
@@ -234,7 +355,58 @@ def test_client_update_role_failure(client_service: BaseClientService, client_bu
     client = client_build()
 
     with pytest.raises(ClientUpdateException):
-        client_service.update_role(client_id=client.id, role=UserRole.ADMIN)
+        client_service.update_role(client_email=client.email, role=UserRole.ADMIN)
+
+
+@pytest.mark.django_db
+def test_client_update_email_already_exists_failure(client_service: BaseClientService, client_create):
+    client = client_create()
+    another_client = client_create()
+
+    with pytest.raises(ClientAlreadyExistsException):
+        client_service.update_email(client_email=client.email, email=another_client.email)
+
+
+@pytest.mark.django_db
+def test_client_update_is_single_query(client_service: BaseClientService, client_create, django_assert_num_queries):
+    client = client_create()
+
+    with django_assert_num_queries(1):
+        updated_client = client_service.update_score(client_email=client.email, score=Decimal('1.50'))
+
+    assert updated_client.id == client.id
+    assert updated_client.score == Decimal('1.50')
+
+
+@pytest.mark.django_db
+def test_client_increment_score(client_service: BaseClientService, client_create, django_assert_num_queries):
+    client = client_create(score=Decimal('0.10'))
+
+    with django_assert_num_queries(1):
+        updated_client = client_service.increment_score(client_email=client.email, delta=Decimal('0.01'))
+
+    assert updated_client.id == client.id
+    assert updated_client.score == Decimal('0.11')
+    assert isinstance(updated_client, ClientEntity)
+
+
+@pytest.mark.django_db
+def test_client_increment_score_is_bounded(client_service: BaseClientService, client_create):
+    client = client_create(score=Decimal('999.99'))
+    negative_client = client_create(score=Decimal('-999.99'))
+
+    assert client_service.increment_score(client_email=client.email, delta=Decimal('0.01')).score == Decimal('999.99')
+    assert client_service.increment_score(
+        client_email=negative_client.email,
+        delta=Decimal('-0.01'),
+    ).score == Decimal('-999.99')
+
+
+@pytest.mark.django_db
+def test_client_increment_score_not_found_failure(client_service: BaseClientService, client_build):
+    client = client_build()
+    with pytest.raises(ClientNotFoundException):
+        client_service.increment_score(client_email=client.email, delta=Decimal('0.01'))
 
 
 @pytest.mark.django_db
@@ -0,0 +1,99 @@
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+
+from core.apps.news.usecases.user import import_clients
+from core.apps.news.usecases.user.import_clients import ImportClientsUseCase
+from core.apps.common.auth.validators.exceptions import (
+    InvalidEmailPatternException,
+    InvalidPasswordPatternException,
+)
+from core.apps.common.models import UserRole
+
+
+@pytest.fixture
+def import_clients_use_case(container) -> ImportClientsUseCase:
+    return container.resolve(ImportClientsUseCase)
+
+
+def build_row(email: str, password: str, **kwargs) -> dict[str, str]:
+    return {
+        "first_name": "Taras",
+        "last_name": "Shevchenko",
+        "middle_name": "Hryhorovych",
+        "email": email,
+        "password": password,
+        **kwargs,
+    }
+
+
+@pytest.mark.django_db
+def test_import_clients_reports_row_errors(
+        import_clients_use_case: ImportClientsUseCase,
+        client_service,
+        client_create,
+        generate_email,
+        generate_password,
+):
+    existing_client = client_create()
+    emails = [generate_email() for _ in range(3)]
+    password = generate_password()
+    rows = [
+        build_row(email=emails[0], password=password),
+        build_row(email=emails[1], password=password, role=UserRole.MANAGER),
+        build_row(email=emails[0].upper(), password=password),
+        build_row(email=existing_client.email, password=password),
+        build_row(email="not-an-email", password=password),
+        build_row(email=emails[2], password="weak"),
+        build_row(email=emails[2], password=password, role="superuser"),
+        None,
+        {"email": emails[2]},
+        build_row(email=emails[2], password=password),
+    ]
+
+    report = import_clients_use_case.execute(
+        rows=enumerate(rows, start=1),
+        chunk_size=4,
+        workers=1,
+        bcrypt_rounds=4,
+    )
+
+    assert report.imported == 3
+    assert [error.line for error in report.errors] == [3, 4, 5, 6, 7, 8, 9]
+    assert report.errors[2].message == InvalidEmailPatternException(email="not-an-email").message
+    assert report.errors[3].message == InvalidPasswordPatternException(password="weak").message
+    assert report.errors[4].message == "Unknown role: superuser"
+    imported_client = client_service.get_by_email(client_email=emails[1])
+    assert imported_client.role == UserRole.MANAGER
+    client_service.validate_password(client_password=imported_client.password, plain_password=password)
+
+
+@pytest.mark.django_db
+def test_import_clients_reports_hashing_failure(
+        import_clients_use_case: ImportClientsUseCase,
+        client_service,
+        generate_email,
+        generate_password,
+        monkeypatch,
+):
+    emails = [generate_email() for _ in range(6)]
+    password = generate_password()
+    failing_password = generate_password()
+    hash_password = import_clients_use_case.password_service.hash_password
+
+    def hash_password_failing(plain_password: str) -> str:
+        if plain_password == failing_password:
+            raise RuntimeError("hasher crashed")
+        return hash_password(plain_password)
+
+    monkeypatch.setattr(import_clients, "ProcessPoolExecutor", lambda mp_context, **kwargs: ThreadPoolExecutor(**kwargs))
+    monkeypatch.setattr(import_clients_use_case.password_service, "hash_password", hash_password_failing)
+    rows = [
+        build_row(email=email, password=failing_password if line == 3 else password)
+        for line, email in enumerate(emails, start=1)
+    ]
+
+    report = import_clients_use_case.execute(rows=enumerate(rows, start=1), chunk_size=2, workers=1)
+
+    assert report.imported == 4
+    assert [(error.line, error.message) for error in report.errors] == [(3, "hasher crashed"), (4, "hasher crashed")]
+    assert client_service.check_client_exists(client_email=emails[5])
@@ -0,0 +1,35 @@
+import pytest
+import queue
+
+from core.apps.common.bus import (
+    InvalidationTopic,
+    PostgresInvalidationBus,
+)
+
+
+@pytest.fixture
+def listening_bus():
+    bus = PostgresInvalidationBus()
+    messages = queue.Queue()
+    bus.subscribe(InvalidationTopic.CLIENT, messages.put)
+    assert messages.get(timeout=5) is None
+    yield bus, messages
+    bus.stop()
+
+
+@pytest.mark.django_db(transaction=True)
+def test_invalidation_bus_delivers_other_origins_only(listening_bus):
+    bus, messages = listening_bus
+    bus.publish(InvalidationTopic.CLIENT, ids=[1])
+    PostgresInvalidationBus().publish(InvalidationTopic.CLIENT, ids=[2], emails=["client@gmail.com"])
+
+    assert messages.get(timeout=5) == {"ids": [2], "emails": ["client@gmail.com"]}
+    assert messages.empty()
+
+
+@pytest.mark.django_db(transaction=True)
+def test_invalidation_bus_oversized_message_resets(listening_bus):
+    _, messages = listening_bus
+    PostgresInvalidationBus().publish(InvalidationTopic.CLIENT, ids=list(range(5000)))
+
+    assert messages.get(timeout=5) is None
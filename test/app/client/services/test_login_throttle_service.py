@@ -0,0 +1,78 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from django.core.cache import cache
+
+from core.apps.news.exceptions.auth import LoginThrottledException
+from core.apps.news.services.login_throttle import (
+    BaseLoginThrottleService,
+    CacheLoginThrottleService,
+    MemoryLoginThrottleService,
+)
+from core.apps.news.usecases.user.login import LoginClientUseCase
+
+
+@pytest.fixture(params=[MemoryLoginThrottleService, CacheLoginThrottleService])
+def login_throttle_service(request) -> BaseLoginThrottleService:
+    cache.clear()
+    return request.param()
+
+
+def test_login_throttled_by_email(login_throttle_service: BaseLoginThrottleService, generate_email):
+    email = generate_email()
+    for _ in range(login_throttle_service.EMAIL_LIMIT):
+        login_throttle_service.acquire(email=email, ip_address="10.0.0.1")
+
+    with pytest.raises(LoginThrottledException):
+        login_throttle_service.acquire(email=email.upper(), ip_address="10.0.0.2")
+
+    login_throttle_service.release(email=email)
+    login_throttle_service.acquire(email=email, ip_address="10.0.0.2")
+
+
+def test_login_throttled_by_ip_address(login_throttle_service: BaseLoginThrottleService, generate_email):
+    for _ in range(login_throttle_service.IP_LIMIT):
+        login_throttle_service.acquire(email=generate_email(), ip_address="10.0.0.1")
+
+    with pytest.raises(LoginThrottledException):
+        login_throttle_service.acquire(email=generate_email(), ip_address="10.0.0.1")
+    login_throttle_service.acquire(email=generate_email(), ip_address="10.0.0.2")
+
+
+def test_login_throttle_released_after_success(login_throttle_service: BaseLoginThrottleService, generate_email):
+    for _ in range(login_throttle_service.IP_LIMIT * 2):
+        email = generate_email()
+        login_throttle_service.acquire(email=email, ip_address="10.0.0.1")
+        login_throttle_service.release(email=email, ip_address="10.0.0.1")
+
+    login_throttle_service.acquire(email=generate_email(), ip_address="10.0.0.1")
+
+
+def test_login_throttle_concurrent_burst(login_throttle_service: BaseLoginThrottleService, generate_email):
+    email = generate_email()
+    barrier = threading.Barrier(login_throttle_service.EMAIL_LIMIT * 4)
+
+    def attempt() -> bool:
+        barrier.wait()
+        try:
+            login_throttle_service.acquire(email=email)
+        except LoginThrottledException:
+            return False
+        return True
+
+    with ThreadPoolExecutor(max_workers=barrier.parties) as executor:
+        results = list(executor.map(lambda _: attempt(), range(barrier.parties)))
+
+    assert results.count(True) == login_throttle_service.EMAIL_LIMIT
+
+
+@pytest.mark.django_db
+def test_throttled_login_skips_database(container, generate_email, generate_password, django_assert_num_queries):
+    use_case: LoginClientUseCase = container.resolve(LoginClientUseCase)
+    email = generate_email()
+    for _ in range(use_case.login_throttle_service.EMAIL_LIMIT):
+        use_case.login_throttle_service.acquire(email=email)
+
+    with django_assert_num_queries(0), pytest.raises(LoginThrottledException):
+        use_case.execute(email=email, password=generate_password())
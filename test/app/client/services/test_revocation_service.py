@@ -0,0 +1,92 @@
+import pytest
+from datetime import (
+    datetime,
+    timedelta,
+    timezone,
+)
+
+from core.apps.common.bloom import BloomFilter
+from core.apps.common.factory import (
+    convert_to_timestamp,
+    get_new_uuid,
+)
+from core.apps.common.models import (
+    UserRole,
+    TokenType,
+)
+from core.apps.news.entities.token import TokenClaims
+from core.apps.news.models import RevokedToken
+from core.apps.news.services.revocation import BaseTokenRevocationService
+
+
+@pytest.fixture
+def build_claims(generate_email):
+    def _build_claims(expires_in: int = 600) -> TokenClaims:
+        now = datetime.now(tz=timezone.utc)
+        return TokenClaims(
+            token_type=TokenType.ACCESS,
+            client_id=1,
+            email=generate_email(),
+            role=UserRole.CREATOR,
+            token_version=0,
+            jti=get_new_uuid(),
+            expires_at=convert_to_timestamp(now + timedelta(seconds=expires_in)),
+            issued_at=convert_to_timestamp(now),
+        )
+
+    return _build_claims
+
+
+def test_bloom_filter_has_no_false_negatives():
+    bloom_filter = BloomFilter(capacity=1000)
+    items = [get_new_uuid() for _ in range(1000)]
+    for item in items:
+        bloom_filter.add(item)
+
+    assert all(item in bloom_filter for item in items)
+    assert sum(get_new_uuid() in bloom_filter for _ in range(1000)) < 20
+
+
+@pytest.mark.django_db
+def test_revoke_token_success(revocation_service: BaseTokenRevocationService, build_claims):
+    claims = build_claims()
+    revocation_service.revoke(claims=[claims])
+
+    assert revocation_service.is_revoked(jti=claims.jti) is True
+    assert RevokedToken.objects.filter(jti=claims.jti).exists()
+
+
+@pytest.mark.django_db
+def test_not_revoked_token(revocation_service: BaseTokenRevocationService, build_claims):
+    revocation_service.revoke(claims=[build_claims()])
+
+    assert revocation_service.is_revoked(jti=build_claims().jti) is False
+
+
+@pytest.mark.django_db
+def test_revoke_token_twice(revocation_service: BaseTokenRevocationService, build_claims):
+    claims = build_claims()
+    revocation_service.revoke(claims=[claims])
+    revocation_service.revoke(claims=[claims])
+
+    assert RevokedToken.objects.filter(jti=claims.jti).count() == 1
+
+
+@pytest.mark.django_db
+def test_rebuild_loads_revoked_tokens(revocation_service: BaseTokenRevocationService, build_claims):
+    claims = build_claims()
+    revocation_service.revoke(claims=[claims])
+    revocation_service.rebuild()
+
+    assert revocation_service.is_revoked(jti=claims.jti) is True
+
+
+@pytest.mark.django_db
+def test_prune_expired_tokens(revocation_service: BaseTokenRevocationService, build_claims):
+    expired_claims = build_claims(expires_in=-60)
+    active_claims = build_claims()
+    revocation_service.revoke(claims=[expired_claims, active_claims])
+
+    assert revocation_service.prune() == 1
+    assert not RevokedToken.objects.filter(jti=expired_claims.jti).exists()
+    assert revocation_service.is_revoked(jti=active_claims.jti) is True
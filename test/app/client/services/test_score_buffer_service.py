@@ -0,0 +1,101 @@
+import pytest
+from decimal import Decimal
+
+from core.apps.news.models import ScoreEvent
+from core.apps.news.services.score_buffer import (
+    BackgroundFlushScoreBufferService,
+    MemoryScoreBufferService,
+    NoScoreBufferService,
+    TableScoreBufferService,
+)
+from core.apps.news.services.user import BaseClientService
+
+
+@pytest.fixture(params=[MemoryScoreBufferService, TableScoreBufferService])
+def score_buffer_service(request, monkeypatch, client_service: BaseClientService) -> BackgroundFlushScoreBufferService:
+    monkeypatch.setattr(BackgroundFlushScoreBufferService, "FLUSH_INTERVAL_MS", 3_600_000)
+    return request.param(client_service=client_service)
+
+
+@pytest.mark.django_db
+def test_client_increment_scores(client_service: BaseClientService, client_create, django_assert_num_queries):
+    first_client = client_create(score=Decimal('0.10'))
+    second_client = client_create(score=Decimal('999.90'))
+
+    with django_assert_num_queries(1):
+        updated = client_service.increment_scores(
+            deltas={first_client.email: Decimal('0.05'), second_client.email: Decimal('0.50')},
+        )
+
+    assert sorted(updated) == sorted([first_client.id, second_client.id])
+    assert client_service.get_by_id(first_client.id).score == Decimal('0.15')
+    assert client_service.get_by_id(second_client.id).score == Decimal('999.99')
+
+
+@pytest.mark.django_db
+def test_client_increment_scores_merges_email_case_variants(client_service: BaseClientService, client_create):
+    client = client_create(score=Decimal('0.10'))
+
+    updated = client_service.increment_scores(
+        deltas={client.email.upper(): Decimal('0.05'), client.email.lower(): Decimal('0.02')},
+    )
+
+    assert updated == [client.id]
+    assert client_service.get_by_id(client.id).score == Decimal('0.17')
+
+
+@pytest.mark.django_db
+def test_score_buffer_merges_email_case_variants(
+        score_buffer_service: BackgroundFlushScoreBufferService,
+        client_service: BaseClientService,
+        client_create,
+):
+    client = client_create(score=Decimal('0.10'))
+    score_buffer_service.add(client_email=client.email.upper(), delta=Decimal('0.01'))
+    score_buffer_service.add(client_email=client.email.lower(), delta=Decimal('0.02'))
+
+    assert score_buffer_service.flush() == 1
+    assert client_service.get_by_id(client.id).score == Decimal('0.13')
+
+
+@pytest.mark.django_db
+def test_score_buffer_coalesces_events(
+        score_buffer_service: BackgroundFlushScoreBufferService,
+        client_service: BaseClientService,
+        client_create,
+):
+    client = client_create(score=Decimal('0.10'))
+    for _ in range(3):
+        score_buffer_service.add(client_email=client.email, delta=Decimal('0.01'))
+    score_buffer_service.add(client_email=client.email, delta=Decimal('-0.01'))
+
+    assert client_service.get_by_id(client.id).score == Decimal('0.10')
+    assert score_buffer_service.flush() == 1
+    assert client_service.get_by_id(client.id).score == Decimal('0.12')
+    assert score_buffer_service.flush() == 0
+    assert not ScoreEvent.objects.exists()
+
+
+@pytest.mark.django_db
+def test_score_buffer_flushes_on_max_events(
+        score_buffer_service: BackgroundFlushScoreBufferService,
+        client_service: BaseClientService,
+        client_create,
+        monkeypatch,
+):
+    monkeypatch.setattr(BackgroundFlushScoreBufferService, "MAX_EVENTS", 2)
+    client = client_create(score=Decimal('0.10'))
+    score_buffer_service.add(client_email=client.email, delta=Decimal('0.01'))
+    score_buffer_service.add(client_email=client.email, delta=Decimal('0.01'))
+
+    assert client_service.get_by_id(client.id).score == Decimal('0.12')
+
+
+@pytest.mark.django_db
+def test_no_score_buffer_writes_through(client_service: BaseClientService, client_create):
+    score_buffer_service = NoScoreBufferService(client_service=client_service)
+    client = client_create(score=Decimal('0.10'))
+    score_buffer_service.add(client_email=client.email, delta=Decimal('0.01'))
+
+    assert client_service.get_by_id(client.id).score == Decimal('0.11')
+    assert score_buffer_service.flush() == 0
@@ -0,0 +1,133 @@
+import pytest
+
+from core.apps.news.entities.user import User as ClientEntity
+from core.apps.news.exceptions.session import SessionNotFoundException
+from core.apps.news.services.session import BaseSessionService
+from core.apps.news.services.user import BaseClientService
+from core.apps.news.usecases.user.update_email import UpdateClientEmailUseCase
+
+
+@pytest.fixture
+def session_service(container) -> BaseSessionService:
+    return container.resolve(BaseSessionService)
+
+
+@pytest.fixture
+def start_session(client_service: BaseClientService, session_service: BaseSessionService, client_create):
+    def _start_session(client=None):
+        client = client or client_create()
+        client_entity = ClientEntity(id=client.id, email=client.email, role=client.role)
+        tokens = client_service.generate_tokens(client=client_entity)
+        claims = client_service.get_claims_from_token(token=tokens.refresh_token)
+        session_service.create(claims=claims)
+        return client_entity, claims
+
+    return _start_session
+
+
+@pytest.fixture
+def rotate_tokens(client_service: BaseClientService):
+    def _rotate_tokens(client_entity, claims):
+        tokens = client_service.generate_tokens(client=client_entity, device_id=claims.device_id)
+        return client_service.get_claims_from_token(token=tokens.refresh_token)
+
+    return _rotate_tokens
+
+
+@pytest.mark.django_db
+def test_create_session_success(session_service: BaseSessionService, start_session):
+    client_entity, claims = start_session()
+    sessions = session_service.get_active(client_id=client_entity.id)
+
+    assert len(sessions) == 1
+    assert sessions[0].device_id == claims.device_id
+
+
+@pytest.mark.django_db
+def test_rotate_session_success(session_service: BaseSessionService, start_session, rotate_tokens):
+    client_entity, claims = start_session()
+    new_claims = rotate_tokens(client_entity, claims)
+    session_service.rotate(claims=claims, new_claims=new_claims)
+
+    assert new_claims.device_id == claims.device_id
+    assert len(session_service.get_active(client_id=client_entity.id)) == 1
+
+
+@pytest.mark.django_db
+def test_rotate_reused_refresh_token_revokes_session(
+        session_service: BaseSessionService,
+        start_session,
+        rotate_tokens,
+):
+    client_entity, claims = start_session()
+    session_service.rotate(claims=claims, new_claims=rotate_tokens(client_entity, claims))
+
+    with pytest.raises(SessionNotFoundException):
+        session_service.rotate(claims=claims, new_claims=rotate_tokens(client_entity, claims))
+    assert session_service.get_active(client_id=client_entity.id) == []
+
+
+@pytest.mark.django_db
+def test_reissue_session_success(session_service: BaseSessionService, start_session, rotate_tokens):
+    client_entity, claims = start_session()
+    new_claims = rotate_tokens(client_entity, claims)
+    session_service.reissue(claims=new_claims)
+
+    with pytest.raises(SessionNotFoundException):
+        session_service.rotate(claims=claims, new_claims=rotate_tokens(client_entity, claims))
+
+    session_service.revoke(client_id=client_entity.id, device_id=claims.device_id)
+    with pytest.raises(SessionNotFoundException):
+        session_service.reissue(claims=rotate_tokens(client_entity, claims))
+
+
+@pytest.mark.django_db
+def test_update_email_reuses_current_session(
+        container,
+        session_service: BaseSessionService,
+        client_service: BaseClientService,
+        client_create,
+        start_session,
+        generate_email,
+        generate_password,
+        hash_password,
+):
+    password = generate_password()
+    client_entity, claims = start_session(client=client_create(password=hash_password(password)))
+    use_case: UpdateClientEmailUseCase = container.resolve(UpdateClientEmailUseCase)
+
+    _, tokens = use_case.execute(
+        old_email=client_entity.email,
+        new_email=generate_email(),
+        password=password,
+        device_id=claims.device_id,
+    )
+
+    new_claims = client_service.get_claims_from_token(token=tokens.refresh_token)
+    sessions = session_service.get_active(client_id=client_entity.id)
+    assert new_claims.device_id == claims.device_id
+    assert [session.device_id for session in sessions] == [claims.device_id]
+    with pytest.raises(SessionNotFoundException):
+        session_service.rotate(claims=claims, new_claims=new_claims)
+
+
+@pytest.mark.django_db
+def test_revoke_session(session_service: BaseSessionService, start_session, rotate_tokens):
+    client_entity, claims = start_session()
+    session_service.revoke(client_id=client_entity.id, device_id=claims.device_id)
+
+    assert session_service.get_active(client_id=client_entity.id) == []
+    with pytest.raises(SessionNotFoundException):
+        session_service.rotate(claims=claims, new_claims=rotate_tokens(client_entity, claims))
+
+
+@pytest.mark.django_db
+def test_revoke_all_sessions(session_service: BaseSessionService, start_session, client_create):
+    client = client_create()
+    client_entity, _ = start_session(client=client)
+    start_session(client=client)
+    other_client_entity, _ = start_session()
+
+    assert session_service.revoke_all(client_id=client_entity.id) == 2
+    assert session_service.get_active(client_id=client_entity.id) == []
+    assert len(session_service.get_active(client_id=other_client_entity.id)) == 1
@@ -0,0 +1,59 @@
+import pytest
+
+from core.apps.news.exceptions.user import ClientNotFoundException
+from core.apps.news.services.token_version import BaseTokenVersionService
+from core.apps.news.services.user import BaseClientService
+
+
+@pytest.fixture
+def token_version_service(container) -> BaseTokenVersionService:
+    return container.resolve(BaseTokenVersionService)
+
+
+@pytest.mark.django_db
+def test_get_version_is_cached(
+        token_version_service: BaseTokenVersionService,
+        client_create,
+        django_assert_num_queries,
+):
+    client = client_create()
+    token_version_service.invalidate(client_id=client.id)
+
+    with django_assert_num_queries(1):
+        assert token_version_service.get_version(client_id=client.id) == 0
+        assert token_version_service.get_version(client_id=client.id) == 0
+
+
+@pytest.mark.django_db
+def test_get_version_not_found_failure(token_version_service: BaseTokenVersionService, client_build):
+    client = client_build()
+    with pytest.raises(ClientNotFoundException):
+        token_version_service.get_version(client_id=client.id)
+
+
+@pytest.mark.django_db
+def test_increment_version(token_version_service: BaseTokenVersionService, client_create):
+    client = client_create()
+    token_version_service.get_version(client_id=client.id)
+    token_version_service.increment(client_id=client.id)
+
+    assert token_version_service.get_version(client_id=client.id) == 1
+
+
+@pytest.mark.django_db
+def test_client_updates_increment_version(
+        client_service: BaseClientService,
+        token_version_service: BaseTokenVersionService,
+        client_create,
+        generate_email,
+        hash_password,
+        generate_password,
+):
+    client = client_create()
+    token_version_service.get_version(client_id=client.id)
+
+    client = client_service.update_email(client_email=client.email, email=generate_email())
+    client_service.update_password(client_email=client.email, hashed_password=hash_password(generate_password()))
+    client_service.update_role(client_email=client.email, role=client.role)
+
+    assert token_version_service.get_version(client_id=client.id) == 3
@@ -0,0 +1,36 @@
+import pytest
+
+from django.utils import timezone
+
+from core.apps.common.exceptions import InvalidCursorException
+from core.apps.common.pagination import paginate_by_keyset
+from core.apps.news.models.user import User as ClientModel
+from test.factories.client.client import ClientModelFactory
+
+
+@pytest.mark.django_db
+def test_paginate_by_keyset_walks_all_pages(django_assert_num_queries):
+    clients = ClientModelFactory.create_batch(7)
+    ClientModel.objects.filter(id__in=[client.id for client in clients[:4]]).update(created_at=timezone.now())
+    expected_ids = list(ClientModel.objects.order_by("-created_at", "-id").values_list("id", flat=True))
+
+    ids, cursor = [], None
+    while True:
+        with django_assert_num_queries(1):
+            page = paginate_by_keyset(queryset=ClientModel.objects.all(), cursor=cursor, limit=3)
+        ids.extend(client.id for client in page.items)
+        cursor = page.next_cursor
+        if cursor is None:
+            break
+
+    assert ids == expected_ids
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "cursor",
+    ["not-a-cursor", "WzFd", "WyJub3QtYS1kYXRlIiwxXQ", "W1sxXSxbMl1d", "W3siYSI6MX0sMl0", "W3RydWUsMV0"],
+)
+def test_paginate_by_keyset_invalid_cursor_failure(cursor: str):
+    with pytest.raises(InvalidCursorException):
+        paginate_by_keyset(queryset=ClientModel.objects.all(), cursor=cursor, limit=3)
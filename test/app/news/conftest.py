@@ -0,0 +1,20 @@
+import pytest
+
+from core.apps.news.services.news import BaseNewsService
+from test.factories.news.news import (
+    NewsModelFactory,
+    TagModelFactory,
+)
+
+
+@pytest.fixture
+def news_service(container) -> BaseNewsService:
+    return container.resolve(BaseNewsService)
+
+
+@pytest.fixture(scope='function')
+def news_create():
+    def _news_create(tags_count: int = 2, **kwargs):
+        return NewsModelFactory.create(tags=TagModelFactory.create_batch(tags_count), **kwargs)
+
+    return _news_create
@@ -0,0 +1,86 @@
+import pytest
+
+from core.apps.news.exceptions.news import NewsNotFoundException
+from core.apps.news.services.news import BaseNewsService
+
+
+@pytest.mark.django_db
+def test_get_news_by_id_success(news_service: BaseNewsService, news_create):
+    news = news_create(tags_count=3)
+    found_news = news_service.get_by_id(news_id=news.id)
+
+    assert found_news.title == news.title
+    assert found_news.user.email == news.user.email
+    assert found_news.faculty.name == news.faculty.name
+    assert {tag.name for tag in found_news.tags} == {tag.name for tag in news.tags.all()}
+
+
+@pytest.mark.django_db
+def test_get_news_by_id_not_found_failure(news_service: BaseNewsService):
+    with pytest.raises(NewsNotFoundException):
+        news_service.get_by_id(news_id=0)
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("news_count", [1, 20])
+def test_get_news_list_constant_queries(
+        news_service: BaseNewsService,
+        news_create,
+        django_assert_num_queries,
+        news_count: int,
+):
+    for _ in range(news_count):
+        news_create()
+
+    with django_assert_num_queries(2):
+        news, next_cursor = news_service.get_list(cursor=None, limit=50)
+
+    assert len(news) == news_count
+    assert next_cursor is None
+    assert all(item.user.id is not None and len(item.tags) == 2 for item in news)
+
+
+@pytest.mark.django_db
+def test_get_news_list_filters_and_pages(news_service: BaseNewsService, news_create):
+    news = [news_create() for _ in range(3)]
+    tag = news[0].tags.first()
+
+    first_page, next_cursor = news_service.get_list(cursor=None, limit=2)
+    second_page, last_cursor = news_service.get_list(cursor=next_cursor, limit=2)
+    tagged_news, _ = news_service.get_list(cursor=None, limit=2, tag_id=tag.id)
+
+    assert [item.id for item in first_page + second_page] == [item.id for item in reversed(news)]
+    assert last_cursor is None
+    assert [item.id for item in tagged_news] == [news[0].id]
+
+
+@pytest.mark.django_db
+def test_search_news_ranked_with_headline(news_service: BaseNewsService, news_create):
+    title_match = news_create(title="Телескоп на даху корпусу", content="Відкриття обсерваторії.")
+    content_match = news_create(title="Новини кафедри", content="Студенти зібрали телескоп власноруч.")
+    excluded_match = news_create(title="Телескоп і орбіта", content="Орбіта супутника.")
+    news_create(title="Спортивні змагання", content="Футбольний турнір.")
+
+    found_news, next_cursor = news_service.get_list(cursor=None, limit=10, search="телескоп")
+    filtered_news, _ = news_service.get_list(cursor=None, limit=10, search="телескоп -орбіта")
+
+    assert [item.id for item in found_news][:2] == [excluded_match.id, title_match.id]
+    assert found_news[2].id == content_match.id
+    assert "<b>телескоп</b>" in found_news[2].headline
+    assert next_cursor is None
+    assert {item.id for item in filtered_news} == {title_match.id, content_match.id}
+
+
+@pytest.mark.django_db
+def test_search_news_pages_by_rank(news_service: BaseNewsService, news_create):
+    news = [news_create(title=f"Хакатон {index}", content="хакатон " * index) for index in range(1, 6)]
+
+    ids, cursor = [], None
+    while True:
+        page, cursor = news_service.get_list(cursor=cursor, limit=2, search="хакатон")
+        ids.extend(item.id for item in page)
+        if cursor is None:
+            break
+
+    assert sorted(ids) == sorted(item.id for item in news)
+    assert len(ids) == len(set(ids))
@@ -0,0 +1,40 @@
+import factory
+from factory.django import DjangoModelFactory
+
+from core.apps.news.models import (
+    Faculty,
+    News,
+    Tag,
+)
+from test.factories.client.client import ClientModelFactory
+
+
+class FacultyModelFactory(DjangoModelFactory):
+    name = factory.Faker('company', locale='uk_UA')
+
+    class Meta:
+        model = Faculty
+
+
+class TagModelFactory(DjangoModelFactory):
+    name = factory.Faker('word', locale='uk_UA')
+
+    class Meta:
+        model = Tag
+
+
+class NewsModelFactory(DjangoModelFactory):
+    title = factory.Faker('sentence', nb_words=5, locale='uk_UA')
+    description = factory.Faker('sentence', nb_words=15, locale='uk_UA')
+    content = factory.Faker('text', locale='uk_UA')
+    user = factory.SubFactory(ClientModelFactory)
+    faculty = factory.SubFactory(FacultyModelFactory)
+
+    @factory.post_generation
+    def tags(self, create, extracted, **kwargs):
+        if create and extracted:
+            self.tags.set(extracted)
+
+    class Meta:
+        model = News
+        skip_postgeneration_save = True
@@ -0,0 +1,81 @@
+import pytest
+from django.http import HttpResponse
+from django.test import (
+    RequestFactory,
+    override_settings,
+)
+
+from core.apps.news.models.session import Session as SessionModel
+from core.apps.news.models.user import User as ClientModel
+from core.project.middleware import (
+    PRIMARY_PIN_COOKIE,
+    primary_pinning_middleware,
+)
+from core.project.routers import (
+    PrimaryReplicaRouter,
+    is_pinned_to_primary,
+    use_primary,
+)
+
+
+@pytest.fixture
+def db_router() -> PrimaryReplicaRouter:
+    return PrimaryReplicaRouter()
+
+
+@pytest.fixture
+def pinning_middleware():
+    pinned_states = []
+
+    def get_response(request):
+        pinned_states.append(is_pinned_to_primary())
+        return HttpResponse()
+
+    return primary_pinning_middleware(get_response), pinned_states
+
+
+@override_settings(DATABASE_REPLICAS=["replica"])
+def test_read_goes_to_replica(db_router: PrimaryReplicaRouter):
+    assert db_router.db_for_read(ClientModel) == "replica"
+    assert db_router.db_for_write(ClientModel) == "default"
+
+
+@override_settings(DATABASE_REPLICAS=[])
+def test_read_without_replicas_goes_to_primary(db_router: PrimaryReplicaRouter):
+    assert db_router.db_for_read(ClientModel) == "default"
+
+
+@override_settings(DATABASE_REPLICAS=["replica"])
+def test_read_pinned_to_primary(db_router: PrimaryReplicaRouter):
+    with use_primary():
+        assert db_router.db_for_read(ClientModel) == "default"
+    assert db_router.db_for_read(ClientModel) == "replica"
+
+
+@override_settings(DATABASE_REPLICAS=["replica"])
+def test_primary_only_model_read_goes_to_primary(db_router: PrimaryReplicaRouter):
+    assert db_router.db_for_read(SessionModel) == "default"
+
+
+@override_settings(DATABASE_REPLICAS=["replica"], DB_PRIMARY_PIN_SECONDS=7)
+def test_write_request_pins_client_to_primary(pinning_middleware):
+    middleware, pinned_states = pinning_middleware
+    response = middleware(RequestFactory().patch("/"))
+
+    assert pinned_states == [True]
+    assert response.cookies[PRIMARY_PIN_COOKIE]["max-age"] == 7
+    assert not is_pinned_to_primary()
+
+
+@override_settings(DATABASE_REPLICAS=["replica"])
+def test_read_request_pinned_only_with_cookie(pinning_middleware):
+    middleware, pinned_states = pinning_middleware
+    request_factory = RequestFactory()
+    response = middleware(request_factory.get("/"))
+
+    pinned_request = request_factory.get("/")
+    pinned_request.COOKIES[PRIMARY_PIN_COOKIE] = "1"
+    middleware(pinned_request)
+
+    assert pinned_states == [False, True]
+    assert PRIMARY_PIN_COOKIE not in response.cookies
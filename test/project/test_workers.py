@@ -0,0 +1,30 @@
+import signal
+
+import pytest
+from uvicorn import (
+    Config,
+    Server,
+)
+
+from core.project.workers import UvicornWorker
+
+
+@pytest.fixture
+def restore_signals():
+    handlers = {sig: signal.getsignal(sig) for sig in UvicornWorker.SIGNALS}
+    yield
+    for sig, handler in handlers.items():
+        signal.signal(sig, handler)
+
+
+def test_uvicorn_worker_sigterm_exits_cleanly_after_graceful_shutdown(restore_signals):
+    worker = UvicornWorker.__new__(UvicornWorker)
+    worker.init_signals()
+    server = Server(config=Config(app=None))
+
+    with pytest.raises(SystemExit) as exception_info:
+        with server.capture_signals():
+            signal.raise_signal(signal.SIGTERM)
+
+    assert server.should_exit
+    assert exception_info.value.code == 0